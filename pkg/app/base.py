@@ -1,3 +1,4 @@
+import copy
 import threading
 import time
 from abc import abstractmethod, ABC
@@ -8,6 +9,7 @@ from ..utils.blackboard import GlobalBlackboard
 from ..utils.config_manager import ConfigManager
 from ..utils.logging import Logger
 from ..utils.process_control import FlagDelay
+from .register_map import RegisterMap
 import traceback
 from pkg.configs.global_config import GlobalConfig
 
@@ -47,15 +49,50 @@ class AppCommunication(ABC):
 
 
 
+def merge_spans(values, max_gap=0, fill=None):
+    """
+    Merge {address: value} into contiguous (start, [values]) spans.
+    Addresses up to max_gap apart are merged when fill(address) can provide the gap values (None otherwise).
+    """
+    spans = []
+    for address in sorted(values):
+        if spans:
+            start, span = spans[-1]
+            gap = address - (start + len(span))
+            if gap == 0:
+                span.append(values[address])
+                continue
+            if 0 < gap <= max_gap and fill is not None:
+                gap_values = [fill(addr) for addr in range(start + len(span), address)]
+                if None not in gap_values:
+                    span.extend(gap_values)
+                    span.append(values[address])
+                    continue
+        spans.append((address, [values[address]]))
+    return spans
+
+
 class ModbusStyleCommunication(AppCommunication):
     client: 'ModbusStyleClientBase'
 
+    REGISTER_BYTES = 2      # bytes per register, for traffic statistics
+    MAX_GAP = 4             # clean registers written to join two dirty spans into one request
+    FULL_SYNC_S = 5.0       # period of full rewrite of the write image (recovers a restarted server)
+
     def __init__(self, config_path, period_s=0.1, run_server=True):
         """ Init. thread """
         self.running = False
         self.thread = None
         self.period_s = period_s
 
+        """ Init. write statistics """
+        self.full_sync_time = 0.0
+        self.write_requests = 0
+        self.write_registers = 0
+        self.write_bytes = 0
+        self.skipped_registers = 0
+        self.stats_time = time.time()
+
         """ Init. config """
         self.config = ConfigManager(config_path=config_path)
         self.server_info = self.config.get("server")
@@ -71,6 +108,21 @@ class ModbusStyleCommunication(AppCommunication):
                 self.delayed_resets[idx] = FlagDelay(delay)
                 bb.set(f"{self.address_dict[idx]}/expire", 0)
 
+        """ Init. register maps: protocol compiled into index arrays over NumPy register images """
+        self.read_map = RegisterMap(self.protocol['read']['ranges'], self.protocol['read']['forwarding'],
+                                    list_as_range=True)
+        self.write_map = RegisterMap(self.protocol['write']['ranges'], self.protocol['write']['forwarding'],
+                                     list_as_range=False)
+        self.read_log_keys = [key for key, address in zip(self.read_map.scalar_keys, self.read_map.scalar_addresses)
+                              if address in [41, 51]]
+        self.write_delayed_scalars = [(i, key, address) for i, (key, address)
+                                      in enumerate(zip(self.write_map.scalar_keys, self.write_map.scalar_addresses))
+                                      if address in self.delayed_resets]
+        self.read_reset_items = list(self.protocol['read_reset']['forwarding'].items())
+        self.read_str_keys = list(self.protocol['read_str']['forwarding'].keys())
+        self.read_str_addresses = list(self.protocol['read_str']['forwarding'].values())
+        self.read_str_cache = {}    # key -> (last received string, parsed value)
+
         """ Init. server """
         self.run_server = run_server
         if run_server:
@@ -137,97 +189,73 @@ class ModbusStyleCommunication(AppCommunication):
                 traceback.print_exc()
                 Logger.error(f"Try Reconnect to {self.__class__.__name__} client")
                 self.client.check_reopen()
+                self.invalidate_write_shadow()
 
     def receive_data_from_app(self):
 
         """
         Receiving data from the app.
         """
-        ranges = self.protocol['read']['ranges']
-        addr0 = ranges[0][0]
-        full_size = ranges[-1][-1] - addr0 + 1
-        t0 = time.time()
-        data = [0] * full_size
-        for read_range in ranges:
-            dat = self.client.get_ints(read_range[0], read_range[1] - read_range[0] + 1)
-            if dat is not None:
-                data[read_range[0] - addr0:read_range[1] - addr0 + 1] = dat
-
-        for key, address in self.protocol['read']['forwarding'].items():
-            if isinstance(address, int):                
-                set_data= data[address-addr0]
-                if address in [41, 51] :
-                    if set_data :
-                        Logger.info(f"App Send {key} {address} : {set_data}")
-                    pass
-                if address in [102, 110, 152] :
-                    if set_data :
-                        # Logger.info(f"App Send {key} {address} : {set_data}")
-                        pass
-                bb.set(key, set_data)
-            elif isinstance(address, list):
-                set_data= []
-                for i in range(address[0],address[1]+1):
-                    set_data.append(data[i-addr0])
-                bb.set(key, set_data)
-        
-        
-        for key, address in self.protocol['read_str']['forwarding'].items():
-            str_data = self.client.get_string_with_id(address)
+        self.read_map.read(self.client)
+        values = self.read_map.values()
+        for key in self.read_log_keys:
+            if values[key]:
+                Logger.info(f"App Send {key} {self.protocol['read']['forwarding'][key]} : {values[key]}")
+        bb.set_many(values)
+
+        # all string registers in one bulk fetch
+        # an unchanged string is neither parsed nor set again (the blackboard already holds its value);
+        # a changed one is parsed once and cached, and dict/list results are published as a copy
+        # so a consumer modifying its value cannot alter the cached one
+        str_values = {}
+        str_data_list = self.client.get_strings_with_id(self.read_str_addresses)
+        for key, str_data in zip(self.read_str_keys, str_data_list):
+            cached = self.read_str_cache.get(key)
+            if cached is not None and cached[0] == str_data:
+                continue
             # 수신된 문자열을 JSON으로 변환하여 출력
             try:
-                json_data :dict = json.loads(str_data)
-                data = json_data
-                bb.set(key, data)
+                data = json.loads(str_data)
                 # Logger.info(f"{key} {data}")
-
             except json.JSONDecodeError as e:
                 # Logger.info(f"-----------------string -----------------\n {e}")
-                bb.set(key, str_data)
+                data = str_data
+            self.read_str_cache[key] = (str_data, data)
+            str_values[key] = copy.deepcopy(data) if isinstance(data, (dict, list)) else data
+        if str_values:
+            bb.set_many(str_values)
         # Logger.debug("Read time: {:.1f}".format(1000*(time.time()-t0)))
 
 
     def send_data_to_app(self):
         """
         Sending data to the app.
+        Only registers changed since the last accepted write are sent (all of them every FULL_SYNC_S).
         """
-        # Attempt to send updated data to the app for each specified range
-
-        ranges = self.protocol['write']['ranges']
-        addr0 = ranges[0][0]
-        full_size = ranges[-1][-1] - addr0 + 1
-        data = [0] * full_size
-        for key, address in self.protocol['write']['forwarding'].items():
-            if isinstance(address, int):
-                val = bb.get(key)       
-                val_checked = self.check_reset(address, val, overwrite_address=False)
-                data[address-addr0] = val_checked
-                if val != val_checked:
-                    bb.set(key, val_checked)
-
-            elif isinstance(address, list):
-                values = bb.get(key)
-                values_checked = []
-                for addr, val in zip(address, values):
-                    val_checked = self.check_reset(addr, val, overwrite_address=False)
-                    values_checked.append(val_checked)
-                    data[addr-addr0] = val_checked
-                if any([val != val_checked for val, val_checked in zip(values, values_checked)]):
-                    bb.set(key, values_checked)
+        write_map = self.write_map
+        values = bb.get_many(write_map.scalar_keys)
+        for i, key, address in self.write_delayed_scalars:
+            val_checked = self.check_reset(address, values[i], overwrite_address=False)
+            if values[i] != val_checked:
+                values[i] = val_checked
+                bb.set(key, val_checked)
+        write_map.image[write_map.scalar_index] = values
+
+        for key, addresses, index in write_map.list_keys:
+            values = bb.get(key)
+            values_checked = [self.check_reset(addr, val, overwrite_address=False)
+                              for addr, val in zip(addresses, values)]
+            if isinstance(index, slice):
+                write_map.image[index.start:index.start + len(values_checked)] = values_checked
             else:
-                msg = "Invalid address type: {}".format(type(address))
-                Logger.error(msg)
-                raise(TypeError(msg))
-        t0 = time.time()
-        for write_range in ranges:
-            range0 = write_range[0]
-            try:
-                self.client.set_ints(range0, data[range0-addr0:write_range[1]-addr0+1])
-            except Exception as e:
-                print('grpc base : ',range0,' ',data[range0-addr0:write_range[1]-addr0+1])
-                print('예외@@@@@@@@@ range ',range0,' : ',e)
-
-        for key, address in self.protocol['read_reset']['forwarding'].items():
+                write_map.image[index[:len(values_checked)]] = values_checked
+            if any([val != val_checked for val, val_checked in zip(values, values_checked)]):
+                bb.set(key, values_checked)
+
+        # int resets of read registers, batched into contiguous set_ints requests
+        resets = {}
+        reset_keys = {}
+        for key, address in self.read_reset_items:
             if bb.get(key):
                 if key == "ui/reset/pot1/btn" :
                     Logger.info("reset btn")
@@ -235,15 +263,62 @@ class ModbusStyleCommunication(AppCommunication):
                     Logger.info("reset btn")
                 if key == "ui/reset/restart" :
                     Logger.info("reset restart")
-                self.client.set_int(address,0)
-                bb.set(key,False)
+                resets[address] = 0
+                reset_keys[address] = key
+
+        full = time.time() - self.full_sync_time >= self.FULL_SYNC_S
+        if full:
+            self.full_sync_time = time.time()
+        spans = write_map.dirty_spans(self.MAX_GAP, full=full)
+        written = sum(len(span) for _, span in spans)
+        self.skipped_registers += max(0, int(write_map.in_range.sum()) - written)
+
+        requests = [(start, values, False) for start, values in spans]
+        requests += [(start, values, True) for start, values in merge_spans(resets)]
+        for start, values, is_reset in requests:
+            try:
+                self.client.set_ints(start, values)
+            except Exception as e:
+                print('grpc base : ',start,' ',values)
+                print('예외@@@@@@@@@ range ',start,' : ',e)
+                continue
+            self.write_requests += 1
+            self.write_registers += len(values)
+            self.write_bytes += len(values) * self.REGISTER_BYTES
+            if is_reset:
+                for address in range(start, start + len(values)):
+                    bb.set(reset_keys[address], False)
+            else:
+                write_map.accept(start, len(values))
 
         for key, address in self.protocol['read_str_reset']['forwarding'].items():
             if bb.get(key):
                 Logger.info(f"****************** {key} : {address}")
                 self.client.set_string_with_id(address,'')
+                self.write_requests += 1
                 bb.set(key,False)
 
+    def invalidate_write_shadow(self):
+        """ Forget the last written image so that the next period rewrites every register """
+        self.write_map.invalidate()
+        self.full_sync_time = 0.0
+
+    def get_write_stats(self, reset=True):
+        """ Write traffic to the app server per second since the last reset """
+        now = time.time()
+        elapsed = max(now - self.stats_time, 1e-6)
+        total = self.write_registers + self.skipped_registers
+        stats = {
+            "requests_per_sec": round(self.write_requests / elapsed, 1),
+            "registers_per_sec": round(self.write_registers / elapsed, 1),
+            "bytes_per_sec": round(self.write_bytes / elapsed, 1),
+            "skipped_ratio": round(self.skipped_registers / total, 3) if total else 0.0,
+        }
+        if reset:
+            self.write_requests = self.write_registers = self.write_bytes = self.skipped_registers = 0
+            self.stats_time = now
+        return stats
+
     def check_reset(self, address, val, overwrite_address=True):
         if address in self.delayed_resets:
             expire_name = f"{self.address_dict[address]}/expire"
@@ -302,6 +377,12 @@ class ModbusStyleClientBase(ABC):
     def get_string_with_id(self, idx) -> List[int]:
         raise(NotImplementedError())
 
+    ##
+    # @brief read the strings of several ids. Override to fetch them in one round-trip
+    # @param ids ids of the strings
+    def get_strings_with_id(self, ids) -> List[str]:
+        return [self.get_string_with_id(idx) for idx in ids]
+
     ##
     # @brief disconnect client here. Need to be definitely FAIL-SAFE
     # @return True if connection was good
@@ -81,3 +81,8 @@ class gRPC_Client(ModbusStyleClientBase):
         request = StringId(id=id)
         response = self.client.GetStringWithId(request)
         return response.val
+
+    # 여러 id의 문자열을 동시에 요청하여 한 번의 왕복 시간으로 읽어옵니다.
+    def get_strings_with_id(self, ids):
+        futures = [self.client.GetStringWithId.future(StringId(id=id)) for id in ids]
+        return [future.result().val for future in futures]
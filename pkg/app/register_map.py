@@ -0,0 +1,94 @@
+import numpy as np
+
+
+class RegisterMap:
+    """
+    Register image of one protocol direction ('read' or 'write'), compiled once from the protocol.
+
+    The image covers ranges[0][0] .. ranges[-1][-1]; registers between ranges are never transferred.
+    Forwarding entries are compiled into index arrays over the image:
+        int address   -> scalar key (one register)
+        list address  -> list key, [first, last] (inclusive) if list_as_range else the listed addresses
+    """
+
+    def __init__(self, ranges, forwarding, list_as_range):
+        self.addr0 = ranges[0][0]
+        self.size = ranges[-1][-1] - self.addr0 + 1
+        self.ranges = [(start - self.addr0, end - start + 1) for start, end in ranges]   # (offset, count)
+        self.image = np.zeros(self.size, dtype=np.int64)
+        self.in_range = np.zeros(self.size, dtype=bool)
+        for offset, count in self.ranges:
+            self.in_range[offset:offset + count] = True
+        # number of out-of-range registers before each offset, to test a span for holes in O(1)
+        self._holes = np.concatenate(([0], np.cumsum(~self.in_range)))
+
+        self.scalar_keys = []
+        self.scalar_addresses = []
+        self.list_keys = []         # [(key, addresses, index)], index is a slice when the addresses are consecutive
+        for key, address in forwarding.items():
+            if isinstance(address, int):
+                self.scalar_keys.append(key)
+                self.scalar_addresses.append(address)
+            elif isinstance(address, list):
+                addresses = list(range(address[0], address[1] + 1)) if list_as_range else list(address)
+                self.list_keys.append((key, addresses, self._index(addresses)))
+            else:
+                raise TypeError("Invalid address type: {}".format(type(address)))
+        self.scalar_index = np.asarray(self.scalar_addresses, dtype=np.intp) - self.addr0
+
+        # last image accepted by the peer (write direction)
+        self.shadow = np.zeros(self.size, dtype=np.int64)
+        self.shadow_valid = np.zeros(self.size, dtype=bool)
+
+    def _index(self, addresses):
+        offsets = np.asarray(addresses, dtype=np.intp) - self.addr0
+        if len(offsets) > 0 and np.all(np.diff(offsets) == 1):
+            return slice(int(offsets[0]), int(offsets[-1]) + 1)
+        return offsets
+
+    # --- read direction ---
+    def read(self, client):
+        """ Fill the image with one get_ints per range (a failed range reads as zeros) """
+        image = self.image
+        for offset, count in self.ranges:
+            dat = client.get_ints(self.addr0 + offset, count)
+            if dat is not None:
+                image[offset:offset + count] = dat
+            else:
+                image[offset:offset + count] = 0
+
+    def values(self):
+        """ {key: value} of all forwarding keys from the image """
+        values = dict(zip(self.scalar_keys, self.image[self.scalar_index].tolist()))
+        for key, _, index in self.list_keys:
+            values[key] = self.image[index].tolist()
+        return values
+
+    # --- write direction ---
+    def dirty_spans(self, max_gap=0, full=False):
+        """
+        Contiguous (address, [values]) spans of registers that differ from the shadow.
+        Dirty registers up to max_gap apart are joined when the gap lies inside the ranges.
+        """
+        if full:
+            dirty = self.in_range
+        else:
+            dirty = self.in_range & (~self.shadow_valid | (self.image != self.shadow))
+        offsets = np.flatnonzero(dirty)
+        if len(offsets) == 0:
+            return []
+        gaps = np.diff(offsets) - 1
+        holes = self._holes[offsets[1:]] - self._holes[offsets[:-1]]
+        breaks = np.flatnonzero((gaps > max_gap) | (holes > 0))
+        starts = np.concatenate(([offsets[0]], offsets[breaks + 1]))
+        ends = np.concatenate((offsets[breaks], [offsets[-1]])) + 1
+        return [(self.addr0 + int(start), self.image[start:end].tolist()) for start, end in zip(starts, ends)]
+
+    def accept(self, address, count):
+        """ Mark count registers from address as written """
+        offset = address - self.addr0
+        self.shadow[offset:offset + count] = self.image[offset:offset + count]
+        self.shadow_valid[offset:offset + count] = True
+
+    def invalidate(self):
+        self.shadow_valid[:] = False
@@ -18,6 +18,11 @@ import common as Common
 import grpc
 import time
 
+try:
+    from .channel_pool import get_channel
+except ImportError:
+    from channel_pool import get_channel
+
 
 class BootSocketClient:
     """
@@ -25,7 +30,7 @@ class BootSocketClient:
     """
 
     def __init__(self, ip_addr, port=Common.Config().BOOT_SOCKET_PORT):
-        boot_channel = grpc.insecure_channel("{}:{}".format(ip_addr, port))
+        boot_channel = get_channel(ip_addr, port)
         boot_stub = boot_grpc.BootStub(boot_channel)
         self.__boot_stub = Common.Utils.StubWithTimeout(stub=boot_stub, timeout=Common.Limits.GRPCTimeOut)
 
@@ -0,0 +1,214 @@
+"""
+Process-wide gRPC channel registry for IndyFramework clients.
+
+All clients connecting to the same (ip, port) share one channel, i.e. one HTTP/2 connection.
+Each channel is created with keepalive and a short reconnect backoff, so that the connection is
+re-established within a few seconds after a controller reboot instead of backing off up to 2 minutes (gRPC default).
+The connectivity state and per-method call latency of every channel are recorded.
+Channel options can be overridden with set_channel_options() before the first channel is created.
+
+Usage:
+    channel = get_channel(ip_addr, port)
+    stub = rtde_grpc.RTDataExchangeStub(channel)
+    ...
+    print(get_channel_metrics())
+
+    # e.g. a controller whose server permits more frequent keepalive pings
+    set_channel_options({'grpc.keepalive_time_ms': 60000})
+"""
+import threading
+import time
+
+import grpc
+
+# keepalive: ping every 5 min, and only while calls are active. gRPC servers reject more frequent pings
+#   (default min ping interval 5 min, no pings without calls) with GOAWAY too_many_pings.
+#   An idle dead controller is detected by the next call; active calls fail after keepalive_timeout.
+# reconnect backoff: retry every 0.2 s, growing up to 2 s while the controller is down
+DEFAULT_OPTIONS = (
+    ('grpc.keepalive_time_ms', 300000),
+    ('grpc.keepalive_timeout_ms', 20000),
+    ('grpc.keepalive_permit_without_calls', 0),
+    ('grpc.initial_reconnect_backoff_ms', 200),
+    ('grpc.min_reconnect_backoff_ms', 200),
+    ('grpc.max_reconnect_backoff_ms', 2000),
+)
+
+_STATE_NAMES = {
+    grpc.ChannelConnectivity.IDLE: 'IDLE',
+    grpc.ChannelConnectivity.CONNECTING: 'CONNECTING',
+    grpc.ChannelConnectivity.READY: 'READY',
+    grpc.ChannelConnectivity.TRANSIENT_FAILURE: 'TRANSIENT_FAILURE',
+    grpc.ChannelConnectivity.SHUTDOWN: 'SHUTDOWN',
+}
+
+
+class CallMetrics:
+    """Latency statistics of one RPC method"""
+    __slots__ = ('count', 'errors', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed, failed):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if failed:
+            self.errors += 1
+
+    def to_dict(self):
+        return {'count': self.count, 'errors': self.errors,
+                'avg_ms': self.total / self.count * 1000.0 if self.count else 0.0,
+                'max_ms': self.max * 1000.0}
+
+
+class _LatencyInterceptor(grpc.UnaryUnaryClientInterceptor):
+    def __init__(self, pooled):
+        self._pooled = pooled
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        start = time.perf_counter()
+        outcome = continuation(client_call_details, request)
+        method = client_call_details.method
+        outcome.add_done_callback(
+            lambda call: self._pooled.record_call(method, time.perf_counter() - start, call.exception() is not None))
+        return outcome
+
+
+class PooledChannel:
+    """A shared channel with connectivity monitoring and call metrics"""
+
+    def __init__(self, target, options=DEFAULT_OPTIONS):
+        self.target = target
+        self.state = grpc.ChannelConnectivity.IDLE
+        self.state_changes = 0
+        self.reconnects = 0         # READY reached again after a failure
+        self.ready_time = None      # time.time() of the last READY
+        self.calls = {}             # method -> CallMetrics
+        self._lock = threading.Lock()
+        self._was_ready = False
+        self._raw_channel = grpc.insecure_channel(target, options=list(options))
+        self._raw_channel.subscribe(self._on_state, try_to_connect=True)
+        self.channel = grpc.intercept_channel(self._raw_channel, _LatencyInterceptor(self))
+
+    def _on_state(self, state):
+        with self._lock:
+            if state == self.state:
+                return
+            self.state = state
+            self.state_changes += 1
+            if state == grpc.ChannelConnectivity.READY:
+                if self._was_ready:
+                    self.reconnects += 1
+                self._was_ready = True
+                self.ready_time = time.time()
+
+    def record_call(self, method, elapsed, failed):
+        with self._lock:
+            metrics = self.calls.get(method)
+            if metrics is None:
+                metrics = self.calls[method] = CallMetrics()
+            metrics.add(elapsed, failed)
+
+    def is_ready(self):
+        return self.state == grpc.ChannelConnectivity.READY
+
+    def wait_ready(self, timeout):
+        """Block until the channel is READY. Returns False on timeout"""
+        try:
+            grpc.channel_ready_future(self._raw_channel).result(timeout=timeout)
+            return True
+        except grpc.FutureTimeoutError:
+            return False
+
+    def get_metrics(self):
+        with self._lock:
+            return {'state': _STATE_NAMES.get(self.state, str(self.state)),
+                    'state_changes': self.state_changes,
+                    'reconnects': self.reconnects,
+                    'ready_time': self.ready_time,
+                    'calls': {method: metrics.to_dict() for method, metrics in self.calls.items()}}
+
+    def close(self):
+        self._raw_channel.unsubscribe(self._on_state)
+        self._raw_channel.close()
+
+
+def merge_options(options, overrides):
+    """Channel options with overrides ({name: value} or (name, value) pairs) replacing same-named entries"""
+    merged = dict(options)
+    merged.update(dict(overrides))
+    return tuple(merged.items())
+
+
+class ChannelPool:
+    """Registry of PooledChannel keyed by (ip, port)"""
+
+    def __init__(self, options=DEFAULT_OPTIONS):
+        self.options = tuple(options)
+        self._channels = {}
+        self._lock = threading.Lock()
+
+    def set_options(self, overrides):
+        """Override channel options on top of DEFAULT_OPTIONS. Applies to channels created afterwards"""
+        with self._lock:
+            self.options = merge_options(DEFAULT_OPTIONS, overrides)
+
+    def get(self, ip_addr, port):
+        key = (ip_addr, int(port))
+        with self._lock:
+            pooled = self._channels.get(key)
+            if pooled is None:
+                pooled = self._channels[key] = PooledChannel("{}:{}".format(ip_addr, port), self.options)
+            return pooled
+
+    def get_channel(self, ip_addr, port):
+        return self.get(ip_addr, port).channel
+
+    def get_metrics(self):
+        with self._lock:
+            channels = list(self._channels.values())
+        return {pooled.target: pooled.get_metrics() for pooled in channels}
+
+    def close(self, ip_addr=None, port=None):
+        """Close one channel, or all channels if ip_addr is None"""
+        with self._lock:
+            if ip_addr is None:
+                closing = list(self._channels.values())
+                self._channels.clear()
+            else:
+                pooled = self._channels.pop((ip_addr, int(port)), None)
+                closing = [pooled] if pooled is not None else []
+        for pooled in closing:
+            pooled.close()
+
+
+_pool = ChannelPool()
+
+
+def get_channel(ip_addr, port):
+    """Shared channel to ip_addr:port (created on first use)"""
+    return _pool.get_channel(ip_addr, port)
+
+
+def set_channel_options(overrides):
+    """Override DEFAULT_OPTIONS for channels created afterwards, e.g. {'grpc.keepalive_time_ms': 60000}"""
+    _pool.set_options(overrides)
+
+
+def get_pooled_channel(ip_addr, port):
+    return _pool.get(ip_addr, port)
+
+
+def get_channel_metrics():
+    """{target: {state, state_changes, reconnects, ready_time, calls: {method: {count, errors, avg_ms, max_ms}}}}"""
+    return _pool.get_metrics()
+
+
+def close_channels():
+    _pool.close()
@@ -15,12 +15,19 @@ while impl_path in sys.path:
     sys.path.remove(impl_path)
 ## relative import can cause error in python grpc. add impl to path to import and remove to prevent side-effect
 
+try:
+    from .channel_pool import get_channel
+    from .response_view import ResponseModeMixin, RESPONSE_DICT
+except ImportError:
+    from channel_pool import get_channel
+    from response_view import ResponseModeMixin, RESPONSE_DICT
+
 import common as Common
 import grpc
 import time
 
 
-class ConfigSocketClient:
+class ConfigSocketClient(ResponseModeMixin):
     """
     gRPC client to Config Server in C++ IndyFramework v3.0
     """
@@ -33,8 +40,12 @@ class ConfigSocketClient:
     STOPCAT_SMOOTH_ONLY = common_data.SMOOTH_ONLY
     GUARD_STOP = common_data.GUARD_STOP
 
-    def __init__(self, ip_addr, port=Common.Config().CONFIG_SOCKET_PORT):
-        config_channel = grpc.insecure_channel("{}:{}".format(ip_addr, port))
+    def __init__(self, ip_addr, port=Common.Config().CONFIG_SOCKET_PORT, response_mode=RESPONSE_DICT):
+        """
+        :param response_mode: RESPONSE_DICT (MessageToDict), RESPONSE_VIEW (MessageView) or RESPONSE_RAW (protobuf message)
+        """
+        self._init_response_mode(response_mode)
+        config_channel = get_channel(ip_addr, port)
         config_stub = config_grpc.ConfigStub(config_channel)
 
         self.__config_stub = Common.Utils.StubWithTimeout(stub=config_stub, timeout=Common.Limits.GRPCTimeOut)
@@ -42,33 +53,21 @@ class ConfigSocketClient:
     @Common.Utils.exception_handler
     def GetNonce(self):
         response = self.__config_stub.GetNonce(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def Login(self, digest: str):
         response = self.__config_stub.Login(config_data.Digest(digest=digest))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def ChangePassword(self, digest:str, nonce:str):
         response = self.__config_stub.ChangePassword(
             config_data.ChangePasswordReq(digest=digest, nonce=nonce))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def VerifyToken(self, token: str):
         response = self.__config_stub.VerifyToken(config_data.Token(token=token))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetRefFrame(self, fpos: list):
@@ -79,10 +78,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetRefFrame(config_data.Frame(
             fpos=list(fpos)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetRefFramePlanar(self, fpos0: list, fpos1: list, fpos2: list):
@@ -93,10 +89,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetRefFramePlanar(config_data.PlanarFrame(
             fpos0=list(fpos0), fpos1=list(fpos1), fpos2=list(fpos2)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetLockedJoint(self, locked_joint: int):
@@ -105,10 +98,7 @@ class ConfigSocketClient:
             locked_joint -> int
         """
         response = self.__config_stub.SetLockedJoint(common_data.Int(value=int(locked_joint)))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetToolLink(self, tool_link: int):
@@ -117,10 +107,7 @@ class ConfigSocketClient:
             tool_link -> int
         """
         response = self.__config_stub.SetToolLink(common_data.Int(value=int(tool_link)))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetToolFrame(self, fpos: list):
@@ -131,10 +118,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetToolFrame(config_data.Frame(
             fpos=list(fpos)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetToolFrameList(self, tool_frame_list):
@@ -149,10 +133,7 @@ class ConfigSocketClient:
         json_format.ParseDict(tool_frame_list, tool_frame_list_request)
 
         response = self.__config_stub.SetToolFrameList(tool_frame_list_request)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetToolFrameList(self):
@@ -164,10 +145,7 @@ class ConfigSocketClient:
             }
         """
         response = self.__config_stub.GetToolFrameList(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetRefFrameList(self, ref_frame_list):
@@ -182,10 +160,7 @@ class ConfigSocketClient:
         json_format.ParseDict(ref_frame_list, ref_frame_list_request)
 
         response = self.__config_stub.SetRefFrameList(ref_frame_list_request)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetRefFrameList(self):
@@ -197,10 +172,7 @@ class ConfigSocketClient:
             }
         """
         response = self.__config_stub.GetRefFrameList(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetCustomPosList(self, custom_pos_list):
@@ -214,10 +186,7 @@ class ConfigSocketClient:
         json_format.ParseDict(custom_pos_list, custom_pos_list_request)
 
         response = self.__config_stub.SetCustomPosList(custom_pos_list_request)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetCustomPosList(self):
@@ -228,10 +197,7 @@ class ConfigSocketClient:
             }
         """
         response = self.__config_stub.GetCustomPosList(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetSpeedRatio(self, speed_ratio: int):
@@ -242,10 +208,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetSpeedRatio(config_data.Ratio(
             ratio=speed_ratio
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetSpeedRatio(self):
@@ -254,10 +217,7 @@ class ConfigSocketClient:
             ratio -> uint32 {0 ~ 100}
         """
         response = self.__config_stub.GetSpeedRatio(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetHomePos(self, home_jpos: list):
@@ -268,10 +228,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetHomePosition(config_data.JointPos(
             jpos=home_jpos
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetHomePos(self):
@@ -280,10 +237,7 @@ class ConfigSocketClient:
             jpos -> double[]
         """
         response = self.__config_stub.GetHomePosition(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetPackPos(self):
@@ -292,10 +246,7 @@ class ConfigSocketClient:
             jpos -> double[]
         """
         response = self.__config_stub.GetPackPosition(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetToolList(self):
@@ -319,10 +270,7 @@ class ConfigSocketClient:
         """
         response = self.__config_stub.GetToolList(common_data.Empty())
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetToolList(self, tool_list: dict):
@@ -348,10 +296,7 @@ class ConfigSocketClient:
         json_format.ParseDict(tool_list, tool_list_request)
         response = self.__config_stub.SetToolList(tool_list_request)
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetConveyorList(self):
@@ -374,10 +319,7 @@ class ConfigSocketClient:
         """
         response = self.__config_stub.GetConveyorList(common_data.Empty())
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorList(self, conveyor_list: dict):
@@ -402,10 +344,7 @@ class ConfigSocketClient:
         json_format.ParseDict(conveyor_list, conveyor_list_request)
         response = self.__config_stub.SetConveyorList(conveyor_list_request)
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetVisionServerList(self):
@@ -424,10 +363,7 @@ class ConfigSocketClient:
         """
         response = self.__config_stub.GetVisionServerList(common_data.Empty())
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetVisionServerList(self, vision_servers: dict):
@@ -448,10 +384,7 @@ class ConfigSocketClient:
         json_format.ParseDict(vision_servers, vision_servers_request)
         response = self.__config_stub.SetVisionServerList(vision_servers_request)
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetModbusServerList(self):
@@ -470,10 +403,7 @@ class ConfigSocketClient:
         """
         response = self.__config_stub.GetModbusServerList(common_data.Empty())
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetModbusServerList(self, modbus_servers: dict):
@@ -494,19 +424,13 @@ class ConfigSocketClient:
         json_format.ParseDict(modbus_servers, modbus_servers_request)
         response = self.__config_stub.SetModbusServerList(modbus_servers_request)
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetDefaultCollSensParam(self):
         response = self.__config_stub.GetDefaultCollSensParam(common_data.Empty())
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetCollSensParam(self, col_params: dict):
@@ -514,10 +438,7 @@ class ConfigSocketClient:
         json_format.ParseDict(col_params, col_params_request)
         response = self.__config_stub.SetCollSensParam(col_params_request)
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetDIConfigList(self, di_config_list: dict):
@@ -540,10 +461,7 @@ class ConfigSocketClient:
 
         response = self.__config_stub.SetDIConfigList(di_list_request)
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetDIConfigList(self):
@@ -562,10 +480,7 @@ class ConfigSocketClient:
             }
         """
         response = self.__config_stub.GetDIConfigList(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetDOConfigList(self, do_config_list: dict):
@@ -587,10 +502,7 @@ class ConfigSocketClient:
 
         response = self.__config_stub.SetDOConfigList(do_list_request)
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetDOConfigList(self):
@@ -608,10 +520,7 @@ class ConfigSocketClient:
             }
         """
         response = self.__config_stub.GetDOConfigList(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetAutoServoOff(self, enable: bool, time: float):
@@ -623,10 +532,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetAutoServoOff(config_data.AutoServoOffConfig(
             enable=enable, time=time
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetAutoServoOff(self):
@@ -636,10 +542,7 @@ class ConfigSocketClient:
             time -> float
         """
         response = self.__config_stub.GetAutoServoOff(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetJointControlGain(self, kp: list, kv: list, kl2: list):
@@ -652,10 +555,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetJointControlGain(config_data.JointGainSet(
             kp=list(kp), kv=list(kv), kl2=list(kl2)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetJointControlGain(self):
@@ -666,10 +566,7 @@ class ConfigSocketClient:
             kl2  -> float[6]
         """
         response = self.__config_stub.GetJointControlGain(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetTaskControlGain(self, kp, kv, kl2):
@@ -682,10 +579,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetTaskControlGain(config_data.TaskGainSet(
             kp=list(kp), kv=list(kv), kl2=list(kl2)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetTaskControlGain(self):
@@ -696,10 +590,7 @@ class ConfigSocketClient:
             kl2  -> float[6]
         """
         response = self.__config_stub.GetTaskControlGain(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetImpedanceControlGain(self, mass, damping, stiffness, kl2):
@@ -713,10 +604,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetImpedanceControlGain(config_data.ImpedanceGainSet(
             mass=list(mass), damping=list(damping), stiffness=list(stiffness), kl2=list(kl2)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetImpedanceControlGain(self):
@@ -728,10 +616,7 @@ class ConfigSocketClient:
             kl2  -> float[6]
         """
         response = self.__config_stub.GetImpedanceControlGain(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetForceControlGain(self, kp, kv, kl2, mass, damping, stiffness, kpf, kif):
@@ -746,10 +631,7 @@ class ConfigSocketClient:
             kp=list(kp), kv=list(kv), kl2=list(kl2), mass=list(mass), damping=list(damping), stiffness=list(stiffness),
             kpf=list(kpf), kif=list(kif)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetForceControlGain(self):
@@ -761,10 +643,7 @@ class ConfigSocketClient:
             kl2  -> float[6]
         """
         response = self.__config_stub.GetForceControlGain(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetComplianceControlJointGain(self, kp, kv, kl2, kd, bd, rate, ki, ks, km):
@@ -772,37 +651,25 @@ class ConfigSocketClient:
         response = self.__config_stub.SetComplianceControlJointGain(config_data.ComplianceGainSet(
             kp=list(kp), kv=list(kv), kl2=list(kl2), kd=list(kd), bd=list(bd), rate=list(rate), ki=list(ki), ks=list(ks), km=list(km)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetComplianceControlJointGain(self):
 
         response = self.__config_stub.GetComplianceControlJointGain(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetSensorlessParams(self, tau_bound):
         response =  self.__config_stub.SetSensorlessParams(config_data.SensorlessParams(
             tau_bound=list(tau_bound)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def GetSensorlessParams(self):
 
         response = self.__config_stub.GetSensorlessParams(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
 
     @Common.Utils.exception_handler
@@ -833,10 +700,7 @@ class ConfigSocketClient:
             gain4=list(gains[4]), gain5=list(gains[5]), gain6=list(gains[6]), gain7=list(gains[7]),
             gain8=list(gains[8]), gain9=list(gains[9])
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
 
     @Common.Utils.exception_handler
@@ -849,10 +713,7 @@ class ConfigSocketClient:
             kl2  -> float[6]
         """
         response = self.__config_stub.GetCustomControlGain(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetFrictionComp(self, control_comp: bool, control_comp_levels: list,
@@ -870,10 +731,7 @@ class ConfigSocketClient:
             teaching_comp_enable=dt_comp, teaching_comp_levels=list(dt_comp_levels)
         ))
 
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetFrictionComp(self):
@@ -886,10 +744,7 @@ class ConfigSocketClient:
             teaching_comp_levels   -> int32[6]
         """
         response = self.__config_stub.GetFrictionComp(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetMountPos(self, rot_y=0.0, rot_z=0.0):
@@ -901,10 +756,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetMountPos(config_data.MountingAngles(
             ry=rot_y, rz=rot_z
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetMountPos(self):
@@ -914,10 +766,7 @@ class ConfigSocketClient:
             rot_z   -> float
         """
         response = self.__config_stub.GetMountPos(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetFTSensorConfig(self,
@@ -936,18 +785,12 @@ class ConfigSocketClient:
             ft_frame_rotation_offset_r=ft_frame_rotation_offset_r,
             ft_frame_rotation_offset_p=ft_frame_rotation_offset_p,
             ft_frame_rotation_offset_y=ft_frame_rotation_offset_y))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetFTSensorConfig(self):
         response = self.__config_stub.GetFTSensorConfig(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetToolProperty(self, mass: float, center_of_mass: list, inertia: list):
@@ -960,10 +803,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetToolProperty(config_data.ToolProperties(
             mass=mass, center_of_mass=list(center_of_mass), inertia=list(inertia)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetToolProperty(self):
@@ -974,10 +814,7 @@ class ConfigSocketClient:
             inertia   -> float[6]
         """
         response = self.__config_stub.GetToolProperty(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetCollSensLevel(self, level: int):
@@ -988,10 +825,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetCollSensLevel(config_data.CollisionSensLevel(
             level=level
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetCollSensLevel(self):
@@ -1000,10 +834,7 @@ class ConfigSocketClient:
             level -> uint32
         """
         response = self.__config_stub.GetCollSensLevel(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetCollisonModelMargin(self):
@@ -1012,10 +843,7 @@ class ConfigSocketClient:
             level -> uint32
         """
         response = self.__config_stub.GetCollisonModelMargin(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetCollisonModelMargin(self, collision_margin: float, recover_margin: float):
@@ -1027,10 +855,7 @@ class ConfigSocketClient:
             config_data.CollisionModelMargin(
                 collision_margin=collision_margin, recover_margin=recover_margin
             ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetToolShapeList(self, tool_shape_list):
@@ -1044,10 +869,7 @@ class ConfigSocketClient:
         tool_shape_list_request = config_data.ToolShapeList()
         json_format.ParseDict(tool_shape_list, tool_shape_list_request)
         response = self.__config_stub.SetToolShapeList(tool_shape_list_request)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetToolShapeList(self):
@@ -1059,10 +881,7 @@ class ConfigSocketClient:
             - default_name: string
         """
         response = self.__config_stub.GetToolShapeList(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetEnvironmentList(self, env_list):
@@ -1076,10 +895,7 @@ class ConfigSocketClient:
         env_list_request = config_data.EnvironmentList()
         json_format.ParseDict(env_list, env_list_request)
         response = self.__config_stub.SetEnvironmentList(env_list_request)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetEnvironmentList(self):
@@ -1091,10 +907,7 @@ class ConfigSocketClient:
             - default_name: string
         """
         response = self.__config_stub.GetEnvironmentList(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetCollSensParam(self):
@@ -1112,10 +925,7 @@ class ConfigSocketClient:
             t_conveyor_torque_tangents      -> double[6]
         """
         response = self.__config_stub.GetCollSensParam(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetCollPolicy(self, policy=COLLISION_NO_DETECT,
@@ -1129,10 +939,7 @@ class ConfigSocketClient:
         response = self.__config_stub.SetCollPolicy(config_data.CollisionPolicy(
             policy=policy, sleep_time=sleep_time, gravity_time=gravity_time
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetCollPolicy(self):
@@ -1143,10 +950,7 @@ class ConfigSocketClient:
             gravity_time -> float
         """
         response = self.__config_stub.GetCollPolicy(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetOnStartProgramConfig(self, auto_run: bool, index: int):
@@ -1157,10 +961,7 @@ class ConfigSocketClient:
         """
         response = self.__config_stub.SetOnStartProgramConfig(
             config_data.OnStartProgramConfig(auto_run=auto_run, index=index))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetOnStartProgramConfig(self):
@@ -1170,18 +971,12 @@ class ConfigSocketClient:
             index -> uint32
         """
         response = self.__config_stub.GetOnStartProgramConfig(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetSimpleCollThreshold(self):
         response = self.__config_stub.SetSimpleCollThreshold(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetSafetyLimits(self, power_limit: float, power_limit_ratio: float,
@@ -1204,10 +999,7 @@ class ConfigSocketClient:
             tcp_speed_limit=tcp_speed_limit, tcp_speed_limit_ratio=tcp_speed_limit_ratio  # ,
             # joint_limits=list(joint_limits)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetSafetyLimits(self):
@@ -1222,10 +1014,7 @@ class ConfigSocketClient:
             joint_limits   -> float[]
         """
         response = self.__config_stub.GetSafetyLimits(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetPathConfig(self):
@@ -1236,10 +1025,7 @@ class ConfigSocketClient:
             index_program_path   -> str
         """
         response = self.__config_stub.GetPathConfig(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetSafetyStopConfig(self, jpos_limit_stop_cat=STOPCAT_IMMEDIATE_BRAKE,
@@ -1271,10 +1057,7 @@ class ConfigSocketClient:
             safegd_stop_cat=safegd_stop_cat,
             safegd_type=safegd_type
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetSafetyStopConfig(self):
@@ -1290,34 +1073,22 @@ class ConfigSocketClient:
             safegd_type[2] = GUARD_NONE(0) | GUARD_STOP(1) | GUARD_PAUSE(2) | GUARD_PAUSE_RESUME(3) | REDUCED_MODE(4)
         """
         response = self.__config_stub.GetSafetyStopConfig(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetReducedRatio(self):
         response = self.__config_stub.GetReducedRatio(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetReducedSpeed(self):
         response = self.__config_stub.GetReducedSpeed(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetReducedSpeed(self, speed):
         response = self.__config_stub.SetReducedSpeed(config_data.SetReducedSpeedReq(speed=speed))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetTeleOpParams(self, smooth_factor, cutoff_freq, error_gain):
@@ -1325,26 +1096,17 @@ class ConfigSocketClient:
             config_data.TeleOpParams(smooth_factor=smooth_factor,
                                      cutoff_freq=cutoff_freq,
                                      error_gain=error_gain))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetTeleOpParams(self):
         response = self.__config_stub.GetTeleOpParams(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetKinematicsParams(self):
         response = self.__config_stub.GetKinematicsParams(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
 
 ############################
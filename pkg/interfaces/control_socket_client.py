@@ -15,6 +15,13 @@ while impl_path in sys.path:
     sys.path.remove(impl_path)
 ## relative import can cause error in python grpc. add impl to path to import and remove to prevent side-effect
 
+try:
+    from .channel_pool import get_channel
+    from .response_view import ResponseModeMixin, RESPONSE_DICT, _field
+except ImportError:
+    from channel_pool import get_channel
+    from response_view import ResponseModeMixin, RESPONSE_DICT, _field
+
 
 from typing import List
 import time
@@ -23,7 +30,7 @@ import common as Common
 import managers as Managers
 
 
-class ControlSocketClient:
+class ControlSocketClient(ResponseModeMixin):
     """
     gRPC client to Control Server in C++ IndyFramework v3.0
     """
@@ -44,8 +51,12 @@ class ControlSocketClient:
     OVERRIDE_BLENDING = 1
     DUPLICATE_BLENDING = 2
 
-    def __init__(self, ip_addr, port=Common.Config().CONTROL_SOCKET_PORT):
-        control_channel = grpc.insecure_channel("{}:{}".format(ip_addr, port))
+    def __init__(self, ip_addr, port=Common.Config().CONTROL_SOCKET_PORT, response_mode=RESPONSE_DICT):
+        """
+        :param response_mode: RESPONSE_DICT (MessageToDict), RESPONSE_VIEW (MessageView) or RESPONSE_RAW (protobuf message)
+        """
+        self._init_response_mode(response_mode)
+        control_channel = get_channel(ip_addr, port)
         control_stub = control_grpc.ControlStub(control_channel)
         self.__control_stub = Common.Utils.StubWithTimeout(stub=control_stub, timeout=Common.Limits.GRPCTimeOut)
         self._logger = Managers.LogManager()
@@ -59,18 +70,12 @@ class ControlSocketClient:
             response -> {code: int64, msg: string}
         """
         response = self.__control_stub.GetControlInfo(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def PingFromConty(self):
         response = self.__control_stub.PingFromConty(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ############################
     # Motion
@@ -107,10 +112,7 @@ class ControlSocketClient:
             post_condition=post_cond,
             teaching_mode=teaching_mode
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveJT(self, jstart, jtarget,
@@ -145,10 +147,7 @@ class ControlSocketClient:
             time=move_time,
             post_condition=post_cond
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_forwarder
     def MoveL(self, tstart, ttarget,
@@ -185,10 +184,7 @@ class ControlSocketClient:
             teaching_mode=teaching_mode,
             bypass_singular=bypass_singular
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveAxis(self,
@@ -201,10 +197,7 @@ class ControlSocketClient:
         # acc = vel * acc_ratio / 100
 
         response = self.__control_stub.MoveLinearAxis(control_data.MoveAxisReq(target_mm=target_mm, vel_percentage=vel_ratio, acc_percentage=acc_ratio, is_absolute=is_absolute))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def ForceMode(self, enable, des_force, direction):
@@ -214,10 +207,7 @@ class ControlSocketClient:
             des_force=des_force,
             direction=direction
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def MoveLT(self, tstart, ttarget,
                blending_type=NO_BLENDING,
@@ -247,10 +237,7 @@ class ControlSocketClient:
             time=move_time,
             post_condition=post_cond
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveC(self, tstart, tpos0, tpos1,
@@ -293,10 +280,7 @@ class ControlSocketClient:
             teaching_mode=teaching_mode,
             bypass_singular=bypass_singular
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveCT(self, tstart, tpos0, tpos1,
@@ -334,10 +318,7 @@ class ControlSocketClient:
             time=move_time,
             post_condition=post_cond
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ############################
     # Motion
@@ -367,10 +348,7 @@ class ControlSocketClient:
             acc_ratio=acc_ratio,
             post_condition=post_cond
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ##
     # @brief move along joint trajectory
@@ -384,10 +362,7 @@ class ControlSocketClient:
                                                  qdot_list=list(map(lambda x: common_data.Vector(values=x), qdot_list)),
                                                  qddot_list=list(map(lambda x: common_data.Vector(values=x), qddot_list)))
         response = self.__control_stub.MoveJointTraj(traj_req)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ##
     # @brief move along joint trajectory
@@ -401,10 +376,7 @@ class ControlSocketClient:
                                                 pdot_list=list(map(lambda x: common_data.Vector(values=x), pdot_list)),
                                                 pddot_list=list(map(lambda x: common_data.Vector(values=x), pddot_list)))
         response = self.__control_stub.MoveTaskTraj(traj_req)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ##
     # @brief move gcode file
@@ -421,10 +393,7 @@ class ControlSocketClient:
                                               vel_ratio=vel_ratio,
                                               acc_ratio=acc_ratio)
         response = self.__control_stub.MoveGcode(gcode_req)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def WaitIO(self, di_signal_list, do_signal_list, end_di_signal_list, end_do_signal_list, conjunction=0,
@@ -438,10 +407,7 @@ class ControlSocketClient:
             end_do_list=self.__to_digital_request_list__(end_do_signal_list),
             conjunction=conjunction
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def WaitTime(self, time: float,
@@ -450,10 +416,7 @@ class ControlSocketClient:
         response = self.__control_stub.WaitTime(control_data.WaitTimeReq(
             time=time
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def WaitProgress(self, progress: int,
@@ -462,10 +425,7 @@ class ControlSocketClient:
         response = self.__control_stub.WaitProgress(control_data.WaitProgressReq(
             progress=progress
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def WaitTraj(self, traj_condition,
@@ -474,10 +434,7 @@ class ControlSocketClient:
         response = self.__control_stub.WaitTraj(control_data.WaitTrajReq(
             traj_condition=traj_condition
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def WaitRadius(self, radius: int,
@@ -486,10 +443,7 @@ class ControlSocketClient:
         response = self.__control_stub.WaitRadius(control_data.WaitRadiusReq(
             radius=radius
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     # -------------------------#
     # Violation Recovery
@@ -497,18 +451,12 @@ class ControlSocketClient:
     @Common.Utils.exception_handler
     def Recover(self) -> dict:
         response = self.__control_stub.Recover(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetManualRecovery(self, enable=True) -> dict:
         response = self.__control_stub.SetManualRecovery(common_data.State(enable=enable))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveRecoverJoint(self, jtarget,
@@ -516,10 +464,7 @@ class ControlSocketClient:
         response = self.__control_stub.MoveRecoverJoint(
             control_data.TargetJ(j_target=list(jtarget), base_type=base_type)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ############################
     # Command
@@ -527,83 +472,53 @@ class ControlSocketClient:
     @Common.Utils.exception_handler
     def StopMotion(self, stop_category=STOP_IMMEDIATE_BRAKE) -> dict:
         response = self.__control_stub.StopMotion(common_data.StopCat(category=stop_category))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetDirectTeaching(self, enable=True) -> dict:
         response = self.__control_stub.SetDirectTeaching(common_data.State(enable=enable))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetComplianceMode(self, enable=True, stiffness=[10]*6) -> dict:
         response = self.__control_stub.SetComplianceMode(control_data.ComplianceMode(enable=enable, stiffness=stiffness))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetComplianceMode(self) -> dict:
         response = self.__control_stub.GetComplianceMode(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetSimulationMode(self, enable=True) -> dict:
         response = self.__control_stub.SetSimulationMode(common_data.State(enable=enable))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def ActivateIndySDK(self, license_key, expire_date) -> dict:
         response = self.__control_stub.ActivateIndySDK(
             control_data.SDKLicenseInfo(license_key=license_key, expire_date=expire_date))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetCustomControlMode(self, mode: int) -> dict:
         response = self.__control_stub.SetCustomControlMode(common_data.IntMode(mode=mode))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetCustomControlMode(self) -> dict:
         response = self.__control_stub.GetCustomControlMode(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetFrictionCompensation(self, enable=False) -> dict:
         response = self.__control_stub.SetFrictionCompensation(common_data.State(enable=enable))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetFrictionCompensationState(self) -> dict:
         response = self.__control_stub.GetFrictionCompensationState(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
 
     ############################
@@ -615,10 +530,7 @@ class ControlSocketClient:
             prog_name=prog_name,
             prog_idx=prog_idx
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def PlayProgramLine(self, prog_name: str = '', prog_idx: int = -1):
@@ -626,10 +538,7 @@ class ControlSocketClient:
             prog_name=prog_name,
             prog_idx=prog_idx
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def PlayTuningProgram(self, prog_name: str = '', prog_idx: int = -1,
                           tuning_space=common_data.TUNE_ALL, precision=common_data.HIGH_PRECISION,
@@ -647,54 +556,36 @@ class ControlSocketClient:
 
         json_format.ParseDict(tuning_prog_dict, tuning_req)
         response = self.__control_stub.PlayTuningProgram(tuning_req, timeout=36000)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def PauseProgram(self):
         response = self.__control_stub.PauseProgram(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def ResumeProgram(self):
         response = self.__control_stub.ResumeProgram(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def StopProgram(self):
         response = self.__control_stub.StopProgram(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SendAlarm(self, content):
         response = self.__control_stub.SendAlarm(
             common_data.Message(content=content)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SendAnnotation(self, content):
         response = self.__control_stub.SendAnnotation(
             common_data.Message(content=content)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ############################
     # Custom Variable
@@ -726,10 +617,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetModbusVariableNameList(
             control_data.ModbusVariableList(modbus_variables=modbus_variables)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     # @Common.Utils.exception_handler
     # def CheckModbusConnection(self, server):
@@ -769,10 +657,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetVariableNameList(
             control_data.AllVars(variables=variable_list)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetVariableNameList(self):
@@ -789,10 +674,7 @@ class ControlSocketClient:
         """
         response = self.__control_stub.GetVariableNameList(common_data.Empty())
         # print("control_socket_client.py GetVariableNameList: ", response)
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['variables']
+        return _field(self._decode(response), 'variables')
 
     @Common.Utils.exception_handler
     def SetIntVariable(self, int_variables: list):
@@ -810,10 +692,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetIntVariable(
             control_data.IntVars(variables=variable_list)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetIntVariable(self):
@@ -825,10 +704,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetIntVariable(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['variables']
+        return _field(self._decode(response), 'variables')
 
     @Common.Utils.exception_handler
     def SetModbusVariable(self, modbus_variables: list):
@@ -849,10 +725,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetModbusVariable(
             control_data.ModbusVars(variables=variable_list)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetModbusVariable(self):
@@ -865,10 +738,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetModbusVariable(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['variables']
+        return _field(self._decode(response), 'variables')
 
     @Common.Utils.exception_handler
     def SetBoolVariable(self, bool_variables: list):
@@ -886,10 +756,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetBoolVariable(
             control_data.BoolVars(variables=variable_list)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetBoolVariable(self):
@@ -901,10 +768,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetBoolVariable(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['variables']
+        return _field(self._decode(response), 'variables')
 
     @Common.Utils.exception_handler
     def SetFloatVariable(self, float_variables: list):
@@ -922,10 +786,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetFloatVariable(
             control_data.FloatVars(variables=variable_list)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetFloatVariable(self):
@@ -937,10 +798,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetFloatVariable(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['variables']
+        return _field(self._decode(response), 'variables')
 
     @Common.Utils.exception_handler
     def SetJPosVariable(self, jpos_variables: list):
@@ -958,10 +816,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetJPosVariable(
             control_data.JPosVars(variables=variable_list)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetJPosVariable(self):
@@ -973,10 +828,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetJPosVariable(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['variables']
+        return _field(self._decode(response), 'variables')
 
     @Common.Utils.exception_handler
     def SetTPosVariable(self, tpos_variables: list):
@@ -994,10 +846,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetTPosVariable(
             control_data.TPosVars(variables=variable_list)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetTPosVariable(self):
@@ -1009,10 +858,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetTPosVariable(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['variables']
+        return _field(self._decode(response), 'variables')
 
     @Common.Utils.exception_handler
     def SetPluginBoolVariable(self, name: str, value: bool):
@@ -1026,10 +872,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetPluginBoolVariable(
             common_data.NamedBool(name=name, value=value)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetPluginBoolVariable(self, name: str):
@@ -1041,10 +884,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetPluginBoolVariable(common_data.Name(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetPluginIntVariable(self, name: str, value: int):
@@ -1058,10 +898,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetPluginIntVariable(
             common_data.NamedInt(name=name, value=value)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetPluginIntVariable(self, name: str):
@@ -1073,10 +910,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetPluginIntVariable(common_data.Name(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetPluginFloatVariable(self, name: str, value: float):
@@ -1090,10 +924,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetPluginFloatVariable(
             common_data.NamedFloat(name=name, value=value)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetPluginFloatVariable(self, name: str):
@@ -1105,10 +936,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetPluginFloatVariable(common_data.Name(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetPluginJPosVariable(self, name: str, jpos: List[float]):
@@ -1122,10 +950,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetPluginJPosVariable(
             common_data.NamedJointPosition(name=name, jpos=jpos)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetPluginJPosVariable(self, name: str):
@@ -1137,10 +962,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetPluginJPosVariable(common_data.Name(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetPluginTPosVariable(self, name: str, tpos: List[float]):
@@ -1154,10 +976,7 @@ class ControlSocketClient:
         response = self.__control_stub.SetPluginTPosVariable(
             common_data.NamedTaskPosition(name=name, tpos=tpos)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetPluginTPosVariable(self, name: str):
@@ -1169,10 +988,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetPluginTPosVariable(common_data.Name(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def PushBusEvent(self, event_id: int, b_data=[], i_data=[], f_data=[], text_data=""):
@@ -1190,10 +1006,7 @@ class ControlSocketClient:
                                   i_data=i_data,
                                   f_data=f_data,
                                   text_data=text_data))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def CatchBusEvent(self, event_id: int, timeout: float):
@@ -1210,10 +1023,7 @@ class ControlSocketClient:
             string text_data = 5;
         """
         response = self.__control_stub.CatchBusEvent(common_data.CatchBusEventReq(event_id=event_id, timeout=timeout))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetTactTime(self):
@@ -1225,10 +1035,7 @@ class ControlSocketClient:
             ]
         """
         response = self.__control_stub.GetTactTime(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ############################
     # Utility
@@ -1245,10 +1052,7 @@ class ControlSocketClient:
             tpos=list(tpos),
             init_jpos=list(init_jpos)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def Calculate_FK(self, jpos) -> dict:
         """
@@ -1260,10 +1064,7 @@ class ControlSocketClient:
         response = self.__control_stub.ForwardKinematics(control_data.ForwardKinematicsReq(
             jpos=list(jpos)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ############################
     # Utility
@@ -1278,10 +1079,7 @@ class ControlSocketClient:
         response = self.__control_stub.ForwardKinematics(control_data.ForwardKinematicsReq(
             jpos=list(jpos)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def CheckAproachRetractValid(self, tpos, init_jpos, pre_tpos, post_tpos):
@@ -1291,10 +1089,7 @@ class ControlSocketClient:
             pre_tpos=list(pre_tpos),
             post_tpos=list(post_tpos)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetPalletPointList(self, tpos, jpos, pre_tpos, post_tpos, pallet_pattern, width, height):
@@ -1307,10 +1102,7 @@ class ControlSocketClient:
             width=width,
             height=height
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def CalculateRelativePose(self, start_pos, end_pos,
@@ -1320,10 +1112,7 @@ class ControlSocketClient:
             end_pos=list(end_pos),
             base_type=base_type
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def CalculateCurrentPoseRel(self, current_pos, relative_pos,
@@ -1333,26 +1122,17 @@ class ControlSocketClient:
             relative_pos=list(relative_pos),
             base_type=base_type
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetTeleOpDevice(self):
         response = self.__control_stub.GetTeleOpDevice(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetTeleOpState(self):
         response = self.__control_stub.GetTeleOpState(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def ConnectTeleOpDevice(self, name: str, type: control_data.TeleOpDevice, ip: str, port: int):
@@ -1360,157 +1140,103 @@ class ControlSocketClient:
             control_data.TeleOpDevice(name=name,type=type,ip=ip,port=port
                                       )
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def DisConnectTeleOpDevice(self):
         response = self.__control_stub.DisConnectTeleOpDevice(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def ReadTeleOpInput(self):
         response = self.__control_stub.ReadTeleOpInput(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def StartTeleOp(self, method, mode=control_data.TeleMode.TELE_RAW):
         response = self.__control_stub.StartTeleOp(control_data.TeleOpState(mode=mode,method=method))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def StopTeleOp(self):
         response = self.__control_stub.StopTeleOp(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetPlayRate(self, rate: float):
         response = self.__control_stub.SetPlayRate(control_data.TelePlayRate(rate=rate))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetPlayRate(self):
         response = self.__control_stub.GetPlayRate(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def EnableTeleKey(self, enable):
         response = self.__control_stub.EnableTeleKey(common_data.State(enable=enable))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveTeleJAbs(self, jpos, vel_ratio=0.8, acc_ratio=7.0):
         response = self.__control_stub.MoveTeleJ(
             control_data.MoveTeleJReq(jpos=jpos, vel_ratio=vel_ratio, acc_ratio=acc_ratio,
                                       method=control_data.TELE_JOINT_ABSOLUTE))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveTeleJRel(self, jpos, vel_ratio=0.8, acc_ratio=7.0):
         response = self.__control_stub.MoveTeleJ(
             control_data.MoveTeleJReq(jpos=jpos, vel_ratio=vel_ratio, acc_ratio=acc_ratio,
                                       method=control_data.TELE_JOINT_RELATIVE))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveTeleLAbs(self, tpos, vel_ratio=0.8, acc_ratio=7.0):
         response = self.__control_stub.MoveTeleL(
             control_data.MoveTeleLReq(tpos=tpos, vel_ratio=vel_ratio, acc_ratio=acc_ratio,
                                       method=control_data.TELE_TASK_ABSOLUTE))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveTeleLRel(self, tpos, vel_ratio=0.8, acc_ratio=7.0):
         response = self.__control_stub.MoveTeleL(
             control_data.MoveTeleLReq(tpos=tpos, vel_ratio=vel_ratio, acc_ratio=acc_ratio,
                                       method=control_data.TELE_TASK_RELATIVE))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def MoveTeleLTCP(self, tpos, vel_ratio=0.8, acc_ratio=7.0):
         response = self.__control_stub.MoveTeleL(
             control_data.MoveTeleLReq(tpos=tpos, vel_ratio=vel_ratio, acc_ratio=acc_ratio,
                                       method=control_data.TELE_TASK_TCP))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def MoveTeleLRec(self, tpos, vel_ratio=0.8, acc_ratio=7.0):
         response = self.__control_stub.MoveTeleL(
             control_data.MoveTeleLReq(tpos=tpos, vel_ratio=vel_ratio, acc_ratio=acc_ratio,
                                       method=control_data.TELE_RECORD_ABSOLUTE))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetTeleFileList(self):
         response = self.__control_stub.GetTeleFileList(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SaveTeleMotion(self, name: str):
         response = self.__control_stub.SaveTeleMotion(control_data.TeleFileReq(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def LoadTeleMotion(self, name: str):
         response = self.__control_stub.LoadTeleMotion(control_data.TeleFileReq(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def DeleteTeleMotion(self, name: str):
         response = self.__control_stub.DeleteTeleMotion(control_data.TeleFileReq(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def MoveFL(self, tpos,
                blending_type=NO_BLENDING,
@@ -1547,25 +1273,16 @@ class ControlSocketClient:
             post_condition=post_cond,
             teaching_mode=teaching_mode
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def GetTransformedFTSensorData(self):
         response = self.__control_stub.GetTransformedFTSensorData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def FTZero(self):
         response = self.__control_stub.FTZero(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ############################
     # Private
@@ -7,6 +7,7 @@ import glob
 import grpc
 import threading
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple, Optional
 
@@ -47,6 +48,7 @@ from .indyeye_socket_client import IndyEyeSocketClient as IndyEyeClient
 from .linear_control_client import LinearControlClient as LinearClient
 from .cri_client import CRIClient
 from .autotune_client import autotune_control_gain
+from .resource_monitor import ProcessTreeMonitor
 
 # from utils.motion_timer import MotionTimer
 from common.utils import get_abs_path, load_json, write_json, try_wrap
@@ -54,7 +56,7 @@ from common.security import hash_data
 
 import platform
 if platform.system() == 'Linux':
-    from common.system import get_process_resources, get_pids, get_ancestor_pids, extract_name_from_cmd, get_tree, NO_PROCESS
+    from common.system import extract_name_from_cmd
 
 from pyModbusTCP.client import ModbusClient  # use for check modbus connection
 
@@ -65,6 +67,7 @@ NetworkManager = Managers.NetworkManager
 class ContySocketServicer(conty_grpc.HRIServicer):
     CHUNK_SIZE = 1024 * 1024  # 1 MB
     UPDATE_PERIOD = 0.05  # 0.05  # 50 msec
+    SLOW_UPDATE_PERIOD = 1.0  # slow-changing config (device info, path config, safety limits)
     RECONNECT_PERIOD = 2  # 0.05  # 50 msec
     CONTY_UPDATE_TIMEOUT = 1.0  # 0.5 sec
     CONTY_INIT_PERIOD = 5.0  # 2 sec
@@ -144,7 +147,31 @@ class ContySocketServicer(conty_grpc.HRIServicer):
         self._has_framework_connected = False
         self._has_boot_server_connected = False
         self._has_linear_axis = None  # None means not determined
-        self._lock_data_updating = threading.Lock()
+        self._lock_data_updating = threading.Lock()  # guards swapping of _framework_data only
+        self._framework_data = self._build_framework_data()  # double-buffered snapshot for readers
+        self._slow_data_time = 0.0
+        self._slow_data_dirty = True
+
+        # fast tier: fetched concurrently every cycle, slow tier: on change or every SLOW_UPDATE_PERIOD
+        self._fast_data_getters = [
+            ('_control_data', self._rtde_client.GetControlData),
+            ('_motion_data', self._rtde_client.GetMotionData),
+            ('_io_data', self._rtde_client.GetIOData),
+            ('_servo_data', self._rtde_client.GetServoData),
+            ('_program_data', self._rtde_client.GetProgramData),
+            ('_safety_control_data', self._device_client.GetSafetyControlData),
+            ('_violation_data', self._rtde_client.GetViolationData),
+            ('_violation_queue_data', self._rtde_client.GetViolationMessageQueue),
+            ('_collision_model_state', self._rtde_client.GetCollisionModelState),
+            ('_reduced_ratio', self._config_client.GetReducedRatio),
+        ]
+        self._slow_data_getters = [
+            ('_device_info', self._device_client.GetDeviceInfo),
+            ('_path_config', self._config_client.GetPathConfig),
+            ('_safety_limits', self._config_client.GetSafetyLimits),
+        ]
+        self._data_fetch_executor = ThreadPoolExecutor(max_workers=len(self._fast_data_getters),
+                                                       thread_name_prefix='framework_data')
 
         self._is_data_update_running = True
         self._thread_data_updating = threading.Thread(target=self._update_framework_data)
@@ -171,6 +198,7 @@ class ContySocketServicer(conty_grpc.HRIServicer):
         self._auto_prog_starting = False
         self._is_data_update_running = False
         self._thread_data_updating.join()
+        self._data_fetch_executor.shutdown(wait=False)
         self._is_resource_monitoring = False
         self._resource_monitor_thread.join()
 
@@ -2011,6 +2039,7 @@ class ContySocketServicer(conty_grpc.HRIServicer):
                 tcp_speed_limit=request.tcp_speed_limit, tcp_speed_limit_ratio=request.tcp_speed_limit_ratio
         ) is None:
             context.set_code(grpc.StatusCode.UNAVAILABLE)
+        self.request_slow_data_refresh()
 
         return conty_data.SetSafetyLimitConfigRes()
 
@@ -3530,82 +3559,81 @@ class ContySocketServicer(conty_grpc.HRIServicer):
 
     def get_framework_data(self) -> dict:
         with self._lock_data_updating:
-            framework_data = {
-                'boot_data': self._boot_data,
-                'device_info': self._device_info,
-                'path_config': self._path_config,
-                'safety_limits': self._safety_limits,
-                'reduced_ratio': self._reduced_ratio,
-                'control_data': self._control_data,
-                'motion_data': self._motion_data,
-                'io_data': self._io_data,
-                'servo_data': self._servo_data,
-                'program_data': self._program_data,
-                'safety_control_data': self._safety_control_data,
-                'violation_data': self._violation_data,
-                'violation_queue_data': self._violation_queue_data,
-                'collision_model_state': self._collision_model_state,
-                'linear_data': self._linear_data,
-                'data_id': self._data_id,
-            }
-            return framework_data
+            framework_data = self._framework_data
+        return dict(framework_data)
+
+    def request_slow_data_refresh(self):
+        """Refresh device info, path config and safety limits on the next update cycle"""
+        self._slow_data_dirty = True
+
+    def _build_framework_data(self) -> dict:
+        return {
+            'boot_data': self._boot_data,
+            'device_info': self._device_info,
+            'path_config': self._path_config,
+            'safety_limits': self._safety_limits,
+            'reduced_ratio': self._reduced_ratio,
+            'control_data': self._control_data,
+            'motion_data': self._motion_data,
+            'io_data': self._io_data,
+            'servo_data': self._servo_data,
+            'program_data': self._program_data,
+            'safety_control_data': self._safety_control_data,
+            'violation_data': self._violation_data,
+            'violation_queue_data': self._violation_queue_data,
+            'collision_model_state': self._collision_model_state,
+            'linear_data': self._linear_data,
+            'data_id': self._data_id,
+        }
+
+    def _fetch_framework_data(self, slow=False):
+        """
+        Fetch the fast tier concurrently on the executor; the slow tier is added on request,
+        on (re)connection or every SLOW_UPDATE_PERIOD. Network calls are made without holding _lock_data_updating.
+        """
+        getters = list(self._fast_data_getters)
+        now = time.time()
+        if slow or self._slow_data_dirty or now - self._slow_data_time >= self.SLOW_UPDATE_PERIOD:
+            getters += self._slow_data_getters
+            self._slow_data_dirty = False
+            self._slow_data_time = now
+        futures = [(name, self._data_fetch_executor.submit(getter)) for name, getter in getters]
+        for name, future in futures:
+            setattr(self, name, future.result())
 
     def _update_framework_data(self):
         framework_connected_prev = False
         control_on_prev = False
         while self._is_data_update_running:
-            with self._lock_data_updating:
-                sleep_time = self.UPDATE_PERIOD
-                self._boot_data = self._boot_client.GetBootStatus()
-                self._has_boot_server_connected = self._boot_data is not None
-                if self._has_boot_server_connected:
-                    control_on = 'control_on' in self._boot_data and self._boot_data['control_on']
-                    if control_on and not control_on_prev:
-                        time.sleep(self.RECONNECT_PERIOD)  # wait long for the first time to make sure services alive
-                    control_on_prev = control_on
-                    if control_on and control_on_prev:
-                        self._control_data = self._rtde_client.GetControlData()
-                        # print(self._control_data)
-                        self._motion_data = self._rtde_client.GetMotionData()
-                        self._io_data = self._rtde_client.GetIOData()
-                        self._servo_data = self._rtde_client.GetServoData()
-                        self._program_data = self._rtde_client.GetProgramData()
-                        self._safety_control_data = self._device_client.GetSafetyControlData()
-                        self._violation_data = self._rtde_client.GetViolationData()
-                        self._violation_queue_data = self._rtde_client.GetViolationMessageQueue()
-                        self._collision_model_state = self._rtde_client.GetCollisionModelState()
-                        self._device_info = self._device_client.GetDeviceInfo()
-                        self._path_config = self._config_client.GetPathConfig()
-                        self._safety_limits = self._config_client.GetSafetyLimits()
-                        self._reduced_ratio = self._config_client.GetReducedRatio()
-                        self._has_framework_connected = not (self._control_data is None
-                                                             or self._motion_data is None
-                                                             or self._io_data is None
-                                                             or self._servo_data is None
-                                                             or self._program_data is None
-                                                             or self._safety_control_data is None
-                                                             or self._violation_data is None
-                                                             or self._violation_queue_data is None
-                                                             or self._collision_model_state is None
-                                                             or self._device_info is None
-                                                             or self._path_config is None
-                                                             or self._safety_limits is None
-                                                             or self._reduced_ratio is None)
-                        if self._has_framework_connected:
-                            if self._has_linear_axis is not False:  # try if not determined as False
-                                self._linear_data = self._linear_client.get_axis_data()
-                            if self._has_linear_axis is None:  # determine if not determined (None)
-                                self._has_linear_axis = self._linear_data is not None
-                        if not self._has_framework_connected:
-                            sleep_time = self.RECONNECT_PERIOD  # wait long - framework down and accessed
-                            self._warn(f"Framework Connection Failed - Try reconnection after {sleep_time} s")
-                    else:
-                        self._has_framework_connected = False
-                        sleep_time = self.UPDATE_PERIOD  # no need to wait long - only alive boot service is accessed
+            cycle_start = time.time()
+            sleep_time = self.UPDATE_PERIOD
+            self._boot_data = self._boot_client.GetBootStatus()
+            self._has_boot_server_connected = self._boot_data is not None
+            if self._has_boot_server_connected:
+                control_on = 'control_on' in self._boot_data and self._boot_data['control_on']
+                if control_on and not control_on_prev:
+                    time.sleep(self.RECONNECT_PERIOD)  # wait long for the first time to make sure services alive
+                control_on_prev = control_on
+                if control_on and control_on_prev:
+                    self._fetch_framework_data(slow=not framework_connected_prev)
+                    self._has_framework_connected = not any(getattr(self, name) is None for name, _ in
+                                                            self._fast_data_getters + self._slow_data_getters)
+                    if self._has_framework_connected:
+                        if self._has_linear_axis is not False:  # try if not determined as False
+                            self._linear_data = self._linear_client.get_axis_data()
+                        if self._has_linear_axis is None:  # determine if not determined (None)
+                            self._has_linear_axis = self._linear_data is not None
+                    if not self._has_framework_connected:
+                        self._slow_data_dirty = True
+                        sleep_time = self.RECONNECT_PERIOD  # wait long - framework down and accessed
+                        self._warn(f"Framework Connection Failed - Try reconnection after {sleep_time} s")
                 else:
                     self._has_framework_connected = False
-                    sleep_time = self.RECONNECT_PERIOD  # wait long - boot service is also down and being accessed
-                    self._warn(f"Boot Service Connection Failed - Try reconnection after {sleep_time} s")
+                    sleep_time = self.UPDATE_PERIOD  # no need to wait long - only alive boot service is accessed
+            else:
+                self._has_framework_connected = False
+                sleep_time = self.RECONNECT_PERIOD  # wait long - boot service is also down and being accessed
+                self._warn(f"Boot Service Connection Failed - Try reconnection after {sleep_time} s")
 
             if self._has_framework_connected:
                 if self.has_conty_connected():
@@ -3673,74 +3701,48 @@ class ContySocketServicer(conty_grpc.HRIServicer):
             framework_connected_prev = self._has_framework_connected
 
             self._data_id += 1
-            time.sleep(sleep_time)
+            framework_data = self._build_framework_data()
+            with self._lock_data_updating:
+                self._framework_data = framework_data
+            time.sleep(max(0.0, sleep_time - (time.time() - cycle_start)))
 
         self._info('Stop Updating Framework Data')
 
     def __resource_monitor(self):
-        resource_exception_keys = ["EtherCAT", "logrotate", "IndyEye_main.py", NO_PROCESS]
+        resource_exception_keys = ["EtherCAT", "logrotate", "IndyEye_main.py"]
         SW_CPU_MEM_MISUSE = 0x8000000000
         MISUSE_STOP_CAT = 2
-        ID_CPU_OVERUSE = 0
-        ID_RAM_OVERUSE = 1
         CPU_CUT = 30.0
         MEM_CUT = 15.0
-        root_pid_set = set(get_pids("indy_run.py")).union(get_pids("UDEVMonitor"))
-        self._info(f"Start Resource Monitoring Except Root PIDs: {list(root_pid_set)}")
+        monitor = ProcessTreeMonitor(root_patterns=["indy_run.py", "UDEVMonitor"],
+                                     app_patterns=["IndyDeployment"],
+                                     exception_patterns=resource_exception_keys,
+                                     cpu_cut=CPU_CUT, mem_cut=MEM_CUT)
+        self._info(f"Start Resource Monitoring Except Root Processes: {['indy_run.py', 'UDEVMonitor']}")
         while self._is_resource_monitoring:
             try:
                 time.sleep(1)
                 if not self._has_framework_connected:
                     continue
-                self._process_resource_list = get_process_resources()
-                tree_str = ""
-                not_matched = None
-                misuse_type = -1
-                percentage = 0.0
-                app_pids = get_pids("IndyDeployment")
-                for proc_dict in self._process_resource_list:
-                    ancestors = get_ancestor_pids(proc_dict['pid'])
-                    # print(f"ancestors {ancestors}")
-                    if root_pid_set.union(app_pids).isdisjoint(ancestors):  # non-root sharing busy process
-                        is_exception = False
-                        tree_str = get_tree(proc_dict['pid'])
-                        for exception_key in resource_exception_keys:
-                            if exception_key in tree_str or exception_key in proc_dict['name']:
-                                is_exception = True
-                                self._debug(f"Resource Misuse Detected (PID: {proc_dict['pid']}) But Ignored - Command: '{proc_dict['name']}'")
-                                if NO_PROCESS in tree_str:
-                                    self._debug(f"Process Disappeared")
-                                else:
-                                    self._debug(f"Process Tree: \n{tree_str}")
-                                break;
-                        if not is_exception:
-                            if proc_dict['cpu_percent'] >= CPU_CUT:
-                                not_matched = proc_dict
-                                misuse_type = ID_CPU_OVERUSE
-                                percentage = proc_dict['cpu_percent']
-                                break
-                            elif proc_dict['mem_percent'] >= MEM_CUT:
-                                not_matched = proc_dict
-                                misuse_type = ID_MEM_OVERUSE
-                                percentage = proc_dict['mem_percent']
-                                break
-                if not_matched is not None:
-                    process_name = extract_name_from_cmd(not_matched['name'])
+                misuse = monitor.sample()
+                self._process_resource_list = monitor.resources
+                if misuse is not None:
+                    process_name = extract_name_from_cmd(misuse['name'])
                     self._device_client.CommitViolation(violation_type=SW_CPU_MEM_MISUSE,
                                                         stop_category=MISUSE_STOP_CAT,
                                                         source=0,
                                                         axis_idx=0,
-                                                        misc_fvalue=percentage,
-                                                        misc_ivalue=misuse_type,
+                                                        misc_fvalue=misuse['percentage'],
+                                                        misc_ivalue=misuse['misuse_type'],
                                                         misc_min=0.0,
                                                         misc_max=0.0,
                                                         misc_text=process_name
                     )
-                    self._error(f"Resource Misuse From CMD: '{not_matched['name']}' (PID: {proc_dict['pid']})")
-                    self._warn(f"Process Tree: \n{tree_str}")
+                    self._error(f"Resource Misuse From CMD: '{misuse['name']}' (PID: {misuse['pid']})")
+                    self._warn(f"Process Tree: \n{misuse['tree']}")
                     time.sleep(10)
             except Exception as e:
-                self._err(f"Error in Resource Monitor: {e}")
+                self._error(f"Error in Resource Monitor: {e}")
 
         self._info('Stop Resource Monitoring')
 
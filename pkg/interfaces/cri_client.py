@@ -26,12 +26,17 @@ except:
 import struct
 import requests
 
+try:
+    from .channel_pool import get_channel
+except ImportError:
+    from channel_pool import get_channel
+
 ETHERNET_LIST = ["eth1", "enp2s0"]
 
 class CRIClient:
     def __init__(self, ip_addr, port=Common.Config().CRI_SOCKET_PORT):
         try:
-            cri_channel = grpc.insecure_channel("{}:{}".format(ip_addr, port))
+            cri_channel = get_channel(ip_addr, port)
             cri_stub = CRIStub(cri_channel)
             self.__cri_stub = Common.Utils.StubWithTimeout(stub=cri_stub, timeout=Common.Limits.GRPCTimeOut)
         except Exception as e:
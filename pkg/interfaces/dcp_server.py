@@ -0,0 +1,296 @@
+"""
+Single-thread, selector-based TCP server for IndyDCP frames.
+
+    - All listening sockets (one per interface address) and client sockets are served by one selector loop
+    - Each connection receives into a preallocated bytearray with recv_into; a frame is copied once when complete
+    - Header fields are read with precompiled struct.Struct at fixed offsets
+    - Per-command latency (frame complete -> response queued) is recorded
+
+Frame layout (offsets are given by common.dcp_addr):
+    [header ... data_length(int32) ... cmd(int32)][data: data_length bytes]
+    extended command: [header][data: data_length bytes, ext_frame_length(int32) at +4][ext data: ext_frame_length bytes]
+"""
+import selectors
+import socket
+import struct
+import time
+
+_INT32 = struct.Struct('<i')
+
+
+class CommandLatency:
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def to_dict(self):
+        return {'count': self.count,
+                'avg_ms': self.total / self.count * 1000.0 if self.count else 0.0,
+                'max_ms': self.max * 1000.0}
+
+
+class _DcpConnection:
+    __slots__ = ('sock', 'address', 'buffer', 'view', 'filled', 'frame_start', 'outbox')
+
+    def __init__(self, sock, address, buffer_size):
+        self.sock = sock
+        self.address = address
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.filled = 0
+        self.frame_start = None     # time when the first byte of a pending frame arrived
+        self.outbox = bytearray()   # response bytes not yet accepted by the socket
+
+    def grow(self, size):
+        """Enlarge the receive buffer to at least size bytes (doubling)"""
+        capacity = len(self.buffer)
+        while capacity < size:
+            capacity *= 2
+        buffer = bytearray(capacity)
+        buffer[:self.filled] = self.view[:self.filled]
+        self.view.release()
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+
+    def consume(self, size):
+        """Drop the first size bytes, keeping any bytes of the next frame"""
+        rest = self.filled - size
+        if rest > 0:
+            self.buffer[:rest] = self.view[size:self.filled]
+        self.filled = rest
+
+
+class DcpServer:
+    def __init__(self, handler, error_response, get_hosts, port=6066,
+                 header_size=56, data_length_offset=36, cmd_offset=52, invoke_id_range=(34, 36),
+                 extended_cmd=None, frame_timeout=1.0, buffer_size=4096, max_frame_size=16 * 1024 * 1024,
+                 logger=None):
+        """
+        :param handler: handler(frame: bytes) -> bytes, response of one complete frame
+        :param error_response: error_response(invoke_id: bytes, frame_error: str) -> bytes or None,
+                               frame_error is 'timeout' (incomplete frame), 'too_large' or 'failed' (handler raised)
+        :param get_hosts: get_hosts() -> list of interface addresses to listen on (checked every second)
+        :param extended_cmd: cmd id of extended frames (None if not used)
+        :param frame_timeout: max time to complete a frame after its first byte (sec)
+        :param logger: object with info/warn methods (content, data=None)
+        """
+        self.handler = handler
+        self.error_response = error_response
+        self.get_hosts = get_hosts
+        self.port = port
+        self.header_size = header_size
+        self.data_length_offset = data_length_offset
+        self.cmd_offset = cmd_offset
+        self.invoke_id_range = invoke_id_range
+        self.extended_cmd = extended_cmd
+        self.frame_timeout = frame_timeout
+        self.buffer_size = buffer_size
+        self.max_frame_size = max_frame_size
+        self.logger = logger
+        self.latency = {}           # cmd id -> CommandLatency
+        self._selector = selectors.DefaultSelector()
+        self._listeners = {}        # host -> listening socket
+        self._connections = set()
+        self._hosts_checked = 0.0
+
+    # --- logging ---
+    def _info(self, content, data=None):
+        if self.logger is not None:
+            self.logger._info(content, data)
+
+    def _warn(self, content, data=None):
+        if self.logger is not None:
+            self.logger._warn(content, data)
+
+    # --- listening sockets ---
+    def update_listeners(self):
+        hosts = set(self.get_hosts())
+        for host in hosts - set(self._listeners):
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind((host, self.port))
+                sock.listen(8)
+                sock.setblocking(False)
+            except OSError as ex:
+                self._warn("Failed to open DCP on address: {} - ".format(host), ex)
+                continue
+            self._selector.register(sock, selectors.EVENT_READ, None)
+            self._listeners[host] = sock
+            self._info("Open DCP on address: ", host)
+        for host in set(self._listeners) - hosts:
+            sock = self._listeners.pop(host)
+            self._selector.unregister(sock)
+            sock.close()
+            self._info("Close DCP on address: ", host)
+
+    def _accept(self, listener):
+        try:
+            sock, address = listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection = _DcpConnection(sock, str(address), self.buffer_size)
+        self._selector.register(sock, selectors.EVENT_READ, connection)
+        self._connections.add(connection)
+        self._info("Connection established with {}".format(address))
+
+    def _close(self, connection, reason=None):
+        if connection not in self._connections:
+            return
+        self._connections.discard(connection)
+        try:
+            self._selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        connection.sock.close()
+        connection.view.release()
+        self._info("Client disconnected from {} ".format(connection.address), reason)
+
+    # --- frames ---
+    def _frame_size(self, connection):
+        """Total size of the pending frame, or None if not enough bytes to know it yet"""
+        if connection.filled < self.header_size:
+            return None
+        buffer = connection.buffer
+        size = self.header_size + _INT32.unpack_from(buffer, self.data_length_offset)[0]
+        if self.extended_cmd is not None and _INT32.unpack_from(buffer, self.cmd_offset)[0] == self.extended_cmd:
+            if connection.filled < self.header_size + 8:
+                return None
+            size += _INT32.unpack_from(buffer, self.header_size + 4)[0]
+        return size
+
+    def _invoke_id(self, connection):
+        start, end = self.invoke_id_range
+        return bytes(connection.buffer[start:end])
+
+    def _send(self, connection, response):
+        if not response:
+            return
+        if connection.outbox:
+            connection.outbox += response
+            return
+        try:
+            sent = connection.sock.send(response)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError as ex:
+            self._close(connection, ex)
+            return
+        if sent < len(response):
+            connection.outbox += response[sent:]
+            self._selector.modify(connection.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, connection)
+
+    def _flush(self, connection):
+        try:
+            sent = connection.sock.send(connection.outbox)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as ex:
+            self._close(connection, ex)
+            return
+        del connection.outbox[:sent]
+        if not connection.outbox:
+            self._selector.modify(connection.sock, selectors.EVENT_READ, connection)
+
+    def _receive(self, connection):
+        if connection.filled == len(connection.buffer):
+            connection.grow(len(connection.buffer) * 2)
+        try:
+            received = connection.sock.recv_into(connection.view[connection.filled:])
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as ex:
+            self._close(connection, ex)
+            return
+        if received == 0:
+            self._close(connection)
+            return
+        if connection.frame_start is None:
+            connection.frame_start = time.time()
+        connection.filled += received
+
+        while True:
+            size = self._frame_size(connection)
+            if size is None:
+                return
+            if size < self.header_size or size > self.max_frame_size:
+                self._send(connection, self.error_response(self._invoke_id(connection), 'too_large'))
+                self._close(connection, "invalid frame size {}".format(size))
+                return
+            if size > len(connection.buffer):
+                connection.grow(size)
+            if connection.filled < size:
+                return
+
+            frame = bytes(connection.view[:size])
+            cmd = _INT32.unpack_from(frame, self.cmd_offset)[0]
+            connection.consume(size)
+            connection.frame_start = time.time() if connection.filled else None
+
+            start = time.perf_counter()
+            try:
+                response = self.handler(frame)
+            except Exception as ex:
+                self._warn("Exception: ", ex)
+                start_id, end_id = self.invoke_id_range
+                response = self.error_response(frame[start_id:end_id], 'failed')
+            elapsed = time.perf_counter() - start
+            latency = self.latency.get(cmd)
+            if latency is None:
+                latency = self.latency[cmd] = CommandLatency()
+            latency.add(elapsed)
+            self._send(connection, response)
+            if connection not in self._connections:
+                return
+
+    def _check_timeouts(self, now):
+        for connection in list(self._connections):
+            if connection.frame_start is not None and now - connection.frame_start > self.frame_timeout:
+                self._send(connection, self.error_response(self._invoke_id(connection), 'timeout'))
+                connection.filled = 0
+                connection.frame_start = None
+
+    # --- loop ---
+    def serve(self, is_running, poll_interval=0.2):
+        """Run the event loop while is_running() is True"""
+        try:
+            while is_running():
+                now = time.time()
+                if now - self._hosts_checked >= 1.0:
+                    self._hosts_checked = now
+                    self.update_listeners()
+                for key, events in self._selector.select(timeout=poll_interval):
+                    connection = key.data
+                    if connection is None:
+                        self._accept(key.fileobj)
+                        continue
+                    if events & selectors.EVENT_WRITE:
+                        self._flush(connection)
+                    if events & selectors.EVENT_READ:
+                        self._receive(connection)
+                self._check_timeouts(time.time())
+        finally:
+            self.close()
+
+    def get_latency(self):
+        """{cmd id: {count, avg_ms, max_ms}}"""
+        return {cmd: latency.to_dict() for cmd, latency in self.latency.items()}
+
+    def close(self):
+        for connection in list(self._connections):
+            self._close(connection)
+        for sock in self._listeners.values():
+            self._selector.unregister(sock)
+            sock.close()
+        self._listeners.clear()
@@ -16,14 +16,25 @@ while impl_path in sys.path:
     sys.path.remove(impl_path)
 ## relative import can cause error in python grpc. add impl to path to import and remove to prevent side-effect
 
+try:
+    from .channel_pool import get_channel
+    from .response_view import ResponseModeMixin, RESPONSE_DICT, _field
+except ImportError:
+    from channel_pool import get_channel
+    from response_view import ResponseModeMixin, RESPONSE_DICT, _field
 
-class DeviceSocketClient:
+
+class DeviceSocketClient(ResponseModeMixin):
     """
     gRPC client to Device Server in C++ IndyFramework v3.0
     """
 
-    def __init__(self, ip_addr, port=Common.Config().DEVICE_SOCKET_PORT):
-        device_channel = grpc.insecure_channel("{}:{}".format(ip_addr, port))
+    def __init__(self, ip_addr, port=Common.Config().DEVICE_SOCKET_PORT, response_mode=RESPONSE_DICT):
+        """
+        :param response_mode: RESPONSE_DICT (MessageToDict), RESPONSE_VIEW (MessageView) or RESPONSE_RAW (protobuf message)
+        """
+        self._init_response_mode(response_mode)
+        device_channel = get_channel(ip_addr, port)
         device_stub = device_grpc.DeviceStub(device_channel)
         self.__device_stub = Common.Utils.StubWithTimeout(stub=device_stub, timeout=Common.Limits.GRPCTimeOut)
         self._logger = Managers.LogManager()
@@ -42,10 +53,7 @@ class DeviceSocketClient:
         response = self.__device_stub.SetBrakes(device_data.MotorList(
             motors=list(motor_list)
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetGripperControl(self,command,gripper_type,pvt_data):
@@ -53,10 +61,7 @@ class DeviceSocketClient:
         brake_state_list -> bool[6]
         """
         response = self.__device_stub.SetGripperCommand(device_data.GripperCommand(gripper_command = command, gripper_type = gripper_type, gripper_pvt_data =pvt_data))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)                                         
+        return self._decode(response)                                         
     @Common.Utils.exception_handler
     def set_endtool_led_dim(self, led_dim):
         """
@@ -72,10 +77,7 @@ class DeviceSocketClient:
         enable -> bool
         """
         response = self.__device_stub.SetServoAll(common_data.State(enable=enable))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetServo(self, index, enable=True):
@@ -84,40 +86,28 @@ class DeviceSocketClient:
         enable -> bool
         """
         response = self.__device_stub.SetServo(device_data.Servo(index=index, enable=enable))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetDI(self, di_signal_list: list):
         response = self.__device_stub.SetDI(device_data.DigitalList(
             signals=di_signal_list,
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetDO(self, do_signal_list: list):
         response = self.__device_stub.SetDO(device_data.DigitalList(
             signals=do_signal_list,
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetEndDI(self, end_di_signal_list: list):
         response = self.__device_stub.SetEndDI(device_data.EndtoolSignalList(
             signals=end_di_signal_list,
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetEndDO(self, end_do_signal_list: list):
@@ -125,182 +115,119 @@ class DeviceSocketClient:
         response = self.__device_stub.SetEndDO(device_data.EndtoolSignalList(
             signals=end_do_signal_list,
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetAI(self, ai_signal_list: list):
         response = self.__device_stub.SetAI(device_data.AnalogList(
             signals=ai_signal_list,
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetAO(self, ao_signal_list: list):
         response = self.__device_stub.SetAO(device_data.AnalogList(
             signals=ao_signal_list,
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetEndAI(self, end_ai_signal_list: list):
         response = self.__device_stub.SetEndAI(device_data.AnalogList(
             signals=end_ai_signal_list,
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetEndAO(self, end_ao_signal_list: list):
         response = self.__device_stub.SetEndAO(device_data.AnalogList(
             signals=end_ao_signal_list,
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def SetEnd485Comm(self, txWord1, txWord2):
         response = self.__device_stub.SetEnd485Comm(device_data.Endtool485CommTxList(
             TxWord1=txWord1,
             TxWord2=txWord2,
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetEndRS485Rx(self, word1: int, word2: int):
         response = self.__device_stub.SetEndRS485Rx(common_data.EndtoolRS485Rx(
             word1=word1, word2=word2
         ))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetDI(self) -> list:
         response = self.__device_stub.GetDI(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['signals']
+        return _field(self._decode(response), 'signals')
 
     @Common.Utils.exception_handler
     def GetGripperData(self) -> list:
         response = self.__device_stub.GetGripperData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetDO(self) -> list:
         response = self.__device_stub.GetDO(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['signals']
+        return _field(self._decode(response), 'signals')
 
     @Common.Utils.exception_handler
     def GetEndDI(self) -> list:
         response = self.__device_stub.GetEndDI(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['signals']
+        return _field(self._decode(response), 'signals')
 
     @Common.Utils.exception_handler
     def GetEndDO(self) -> list:
         response = self.__device_stub.GetEndDO(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['signals']
+        return _field(self._decode(response), 'signals')
 
     @Common.Utils.exception_handler
     def GetAI(self) -> list:
         response = self.__device_stub.GetAI(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['signals']
+        return _field(self._decode(response), 'signals')
 
     @Common.Utils.exception_handler
     def GetAO(self) -> list:
         response = self.__device_stub.GetAO(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['signals']
+        return _field(self._decode(response), 'signals')
 
     @Common.Utils.exception_handler
     def GetEndAI(self) -> list:
         response = self.__device_stub.GetEndAI(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['signals']
+        return _field(self._decode(response), 'signals')
 
     @Common.Utils.exception_handler
     def GetEndAO(self) -> list:
         response = self.__device_stub.GetEndAO(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)['signals']
+        return _field(self._decode(response), 'signals')
 
     @Common.Utils.exception_handler
     def GetEndRS485Rx(self) -> dict:
         response = self.__device_stub.GetEndRS485Rx(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetEndRS485Tx(self) -> dict:
         response = self.__device_stub.GetEndRS485Tx(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetEL5001(self):
         response = self.__device_stub.GetEL5001(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetEL5101(self):
         response = self.__device_stub.GetEL5101(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetBrakeControlStyle(self):
         response = self.__device_stub.GetBrakeControlStyle(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetDeviceInfo(self):
@@ -315,42 +242,27 @@ class DeviceSocketClient:
             response  -> {code: int64, msg: string}
         """
         response = self.__device_stub.GetDeviceInfo(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetFTSensorData(self):
         response = self.__device_stub.GetFTSensorData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetConveyor(self):
         response = self.__device_stub.GetConveyor(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorName(self, name: str):
         response = self.__device_stub.SetConveyorName(common_data.Name(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorByName(self, name: str):
         response = self.__device_stub.SetConveyorByName(common_data.Name(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorEncoder(self, encoder_type, channel1: int, channel2: int, sample_num: int,
@@ -361,126 +273,84 @@ class DeviceSocketClient:
                                 mm_per_tick=mm_per_tick, vel_const_mmps=vel_const_mmps,
                                 reversed=reversed)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorTrigger(self, trigger_type, channel: int, detect_rise: bool):
         response = self.__device_stub.SetConveyorTrigger(
             device_data.Trigger(type=trigger_type, channel=channel, detect_rise=detect_rise)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorOffset(self, offset_mm):
         response = self.__device_stub.SetConveyorOffset(common_data.Float(value=offset_mm))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorLockedJoint(self, locked_joint: int):
         response = self.__device_stub.SetConveyorLockedJoint(
             common_data.Int(value=int(locked_joint))
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorToolLink(self, tool_link: int):
         response = self.__device_stub.SetConveyorToolLink(
             common_data.Int(value=int(tool_link))
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorStartingPose(self, jpos, tpos):
         response = self.__device_stub.SetConveyorStartingPose(
             common_data.PosePair(q=jpos, p=tpos)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetConveyorTerminalPose(self, jpos, tpos):
         response = self.__device_stub.SetConveyorTerminalPose(
             common_data.PosePair(q=jpos, p=tpos)
         )
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetConveyorState(self):
         response = self.__device_stub.GetConveyorState(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetConveyorObjectDistances(self):
         response = self.__device_stub.GetConveyorObjectDistances(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetSanderCommand(self, sander_type, ip, speed, state):
         response = self.__device_stub.SetSanderCommand(
             device_data.SanderCommand(type=sander_type, ip=ip, speed=speed, state=state))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetSanderCommand(self):
         response = self.__device_stub.GetSanderCommand(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def AddPhotoneoCalibPoint(self, vision_name, px, py, pz):
         response = self.__device_stub.AddPhotoneoCalibPoint(
             device_data.AddPhotoneoCalibPointReq(vision_name=vision_name, px=px, py=py, pz=pz))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def GetPhotoneoDetection(self, vision_server, object, frame_type, solution_id, vision_id):
         response = self.__device_stub.GetPhotoneoDetection(
             device_data.VisionRequest(vision_server=vision_server, object=object, frame_type=frame_type, solution_id=solution_id, vision_id=vision_id))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def GetPhotoneoRetrieval(self, vision_server, object, frame_type, solution_id, vision_id):
         response = self.__device_stub.GetPhotoneoRetrieval(
             device_data.VisionRequest(vision_server=vision_server, object=object, frame_type=frame_type, solution_id=solution_id, vision_id=vision_id))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def GetLoadFactors(self):
         """
@@ -494,75 +364,48 @@ class DeviceSocketClient:
             response  -> {code: int64, msg: string}
         """
         response = self.__device_stub.GetLoadFactors(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def ExecuteTool(self, name: str):
         response = self.__device_stub.ExecuteTool(common_data.Name(name=name))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def SetAutoMode(self, on: bool):
         response = self.__device_stub.SetAutoMode(device_data.SetAutoModeReq(on=on))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def CheckAutoMode(self):
         response = self.__device_stub.CheckAutoMode(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def CheckReducedMode(self):
         response = self.__device_stub.CheckReducedMode(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetSafetyFunctionState(self):
         response = self.__device_stub.GetSafetyFunctionState(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def RequestSafetyFunction(self, id, state):
         response = self.__device_stub.RequestSafetyFunction(
             device_data.SafetyFunctionState(id = id, state = state))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetSafetyControlData(self):
         response = self.__device_stub.GetSafetyControlData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetRTTaskTimes(self):
         response = self.__device_stub.GetRTTaskTimes(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def CommitViolation(self,
@@ -585,10 +428,7 @@ class DeviceSocketClient:
                                          misc_min=misc_min,
                                          misc_max=misc_max,
                                          misc_text=misc_text))
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     ############################
     # Console Logging
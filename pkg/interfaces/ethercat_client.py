@@ -17,6 +17,11 @@ import common as Common
 import grpc
 import time
 
+try:
+    from .channel_pool import get_channel
+except ImportError:
+    from channel_pool import get_channel
+
 OP_MODE_NO_MODE = 0x00
 OP_MODE_PROFILE_POSITION = 0x01
 OP_MODE_VELOCITY = 0x02
@@ -111,7 +116,7 @@ class EtherCATClient(metaclass=Common.SingletonMeta):
     """
 
     def __init__(self, ip_addr, port=20000):
-        ecat_channel = grpc.insecure_channel("{}:{}".format(ip_addr, port))
+        ecat_channel = get_channel(ip_addr, port)
         ecat_stub = EtherCATStub(ecat_channel)
 
         self.__ethercat_stub = Common.Utils.StubWithTimeout(stub=ecat_stub, timeout=Common.Limits.GRPCTimeOut)
@@ -0,0 +1,132 @@
+"""
+Benchmark of IndyDCP command handling (no controller needed).
+
+Replays a DCP command mix through IndyDcpServicer._command_analysis with in-process fake gRPC clients,
+so the measured time is header check + dispatch + request unpack + response packing only.
+The mix is either the built-in PLC polling mix or a capture file of raw request frames
+(client -> server TCP payload, frames back to back, e.g. exported from Wireshark "Follow TCP Stream" as raw).
+
+Usage (from the repository root, with the framework python environment):
+    python -m pkg.interfaces.indydcp_dispatch_benchmark --count 20000
+    python -m pkg.interfaces.indydcp_dispatch_benchmark --capture dcp_requests.bin
+"""
+import argparse
+import copy
+import time
+from struct import pack
+
+from .indydcp_servicer import IndyDcpServicer, _INT32
+import common as Common
+from common.dcp_addr import *
+
+_CANNED = {
+    'GetControlData': {'q': [0.0, -15.0, -90.0, 0.0, -75.0, 0.0], 'qdot': [0.0] * 6,
+                       'p': [350.0, -186.5, 522.1, 180.0, 0.0, 90.0], 'pdot': [0.0] * 6, 'op_state': 5,
+                       'running_hours': 120, 'running_mins': 30, 'running_secs': 12},
+    'GetMotionData': {'is_in_motion': False, 'is_target_reached': True},
+    'GetServoData': {'servo_actives': [True] * 6, 'brake_actives': [False] * 6, 'currents': [0.5] * 6},
+    'GetViolationData': {'violation_code': 0, 'j_index': 0, 'i_args': [0], 'f_args': [0.0]},
+    'GetProgramData': {'program_state': 0},
+    'GetHomePos': {'jpos': [0.0, -15.0, -90.0, 0.0, -75.0, 0.0]},
+    'GetIOData': {'di': [False] * 32, 'do': [False] * 32, 'ai': [0] * 2, 'ao': [0] * 2},
+    'GetIntVariable': [{'addr': addr, 'value': str(addr)} for addr in range(100)],
+    'GetFloatVariable': [{'addr': addr, 'value': float(addr)} for addr in range(100)],
+    'GetBoolVariable': [{'addr': addr, 'value': False} for addr in range(100)],
+    'GetModbusVariable': [{'addr': addr, 'value': addr} for addr in range(100)],
+}
+
+
+class _FakeClient:
+    """Answers every RPC immediately with a canned response"""
+
+    def __getattr__(self, name):
+        response = _CANNED.get(name, {})
+        return lambda *args, **kwargs: copy.deepcopy(response)
+
+
+def build_frame(cmd_id, payload=b'', invoke_id=0):
+    robot_model = Common.Config().ROBOT_MODEL.encode('utf-8')
+    frame = bytearray(HEADER_CMD_SIZE)
+    frame[HEADER_ROBOT_NAME[0]:HEADER_ROBOT_NAME[0] + len(robot_model)] = robot_model
+    frame[HEADER_STEP_INFO[0]:HEADER_STEP_INFO[1]] = STEP_INFO_byte
+    frame[HEADER_INVOKE_ID[0]:HEADER_INVOKE_ID[1]] = (invoke_id & 0xFFFF).to_bytes(2, 'little')
+    _INT32.pack_into(frame, HEADER_DATA_LENGTH[0], len(payload))
+    _INT32.pack_into(frame, HEADER_CMD[0], cmd_id)
+    return bytes(frame) + payload
+
+
+def default_mix():
+    """Typical PLC polling cycle: status flags and positions every cycle, variables and IO less often"""
+    mix = [
+        (CMD_IS_BUSY, b'', 4),
+        (CMD_IS_MOVE_FINISHED, b'', 4),
+        (CMD_GET_JOINT_POSITION, b'', 4),
+        (CMD_GET_TASK_POSITION, b'', 4),
+        (CMD_READ_DIRECT_VARIABLE, pack('ii', DIRECT_VAR_TYPE_DWORD, 10), 3),
+        (CMD_READ_DIRECT_VARIABLES, pack('iii', DIRECT_VAR_TYPE_DWORD, 0, 8), 2),
+        (CMD_WRITE_DIRECT_VARIABLE, pack('iii', DIRECT_VAR_TYPE_DWORD, 20, 1), 2),
+        (CMD_GET_SMART_DIS, b'', 2),
+        (CMD_SET_SMART_DO, pack('I?', 3, True), 1),
+        (CMD_GET_RUNNING_TIME, b'', 1),
+        (CMD_CHECK, b'', 1),
+    ]
+    frames = []
+    for cmd_id, payload, weight in mix:
+        frames += [build_frame(cmd_id, payload, len(frames)) for _ in range(weight)]
+    return frames
+
+
+def load_capture(path):
+    """Split a raw capture of back-to-back request frames. Raises ValueError at a malformed or truncated frame"""
+    with open(path, 'rb') as capture:
+        data = capture.read()
+    frames = []
+    offset = 0
+    while offset + HEADER_CMD_SIZE <= len(data):
+        size = HEADER_CMD_SIZE + _INT32.unpack_from(data, offset + HEADER_DATA_LENGTH[0])[0]
+        if (_INT32.unpack_from(data, offset + HEADER_CMD[0])[0] == CMD_FOR_EXTENDED
+                and offset + HEADER_CMD_SIZE + 8 <= len(data)):
+            size += _INT32.unpack_from(data, offset + HEADER_CMD_SIZE + 4)[0]
+        if size < HEADER_CMD_SIZE or offset + size > len(data):
+            raise ValueError(f"{path}: malformed or truncated frame at byte {offset} (size {size})")
+        frames.append(data[offset:offset + size])
+        offset += size
+    return frames
+
+
+def run(servicer, frames, count):
+    """Average handling time per command id (us)"""
+    totals = {}
+    for _ in range(max(1, count // len(frames))):
+        for frame in frames:
+            cmd_id = _INT32.unpack_from(frame, HEADER_CMD[0])[0]
+            start = time.perf_counter()
+            servicer._command_analysis(frame)
+            elapsed = time.perf_counter() - start
+            total = totals.setdefault(cmd_id, [0, 0.0])
+            total[0] += 1
+            total[1] += elapsed
+    return {cmd_id: (n, elapsed / n * 1e6) for cmd_id, (n, elapsed) in totals.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IndyDCP command handling benchmark")
+    parser.add_argument('--count', type=int, default=20000, help="number of frames to replay")
+    parser.add_argument('--capture', default=None, help="raw capture of request frames (default: built-in mix)")
+    args = parser.parse_args()
+
+    Common.Config().configure_robot(robot_name='indy7', robot_dof=6)
+    servicer = IndyDcpServicer(*[_FakeClient() for _ in range(7)])
+    frames = load_capture(args.capture) if args.capture else default_mix()
+    names = {value: name for name, value in globals().items() if name.startswith('CMD_')}
+
+    results = run(servicer, frames, args.count)
+    total_n = sum(n for n, _ in results.values())
+    total_us = sum(n * usec for n, usec in results.values())
+    for cmd_id, (n, usec) in sorted(results.items(), key=lambda item: -item[1][1]):
+        print(f"{names.get(cmd_id, cmd_id):<32} {n:>7}  {usec:8.2f} us")
+    print(f"{'total':<32} {total_n:>7}  {total_us / total_n:8.2f} us/frame  ({total_n / total_us * 1e6:.0f} frames/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -17,10 +17,15 @@ from google.protobuf import json_format
 import threading
 import common as Common
 
+try:
+    from .channel_pool import get_channel
+except ImportError:
+    from channel_pool import get_channel
+
 
 class LinearControlClient:
     def __init__(self, ip_addr, port=Common.Config().LINEAR_SOCKET_PORT):
-        linear_channel = grpc.insecure_channel("{}:{}".format(ip_addr, port))
+        linear_channel = get_channel(ip_addr, port)
         linear_stub = linear_grpc.LinearControlStub(linear_channel)
         self.__linear_stub = Common.Utils.StubWithTimeout(stub=linear_stub, timeout=Common.Limits.GRPCTimeOut)
         #
@@ -0,0 +1,155 @@
+"""
+Incremental process-tree resource monitor.
+
+Replaces the per-round get_process_resources() / get_ancestor_pids() / get_tree() scan of ContySocketServicer:
+    - psutil.Process objects are created once per PID and reused, so cpu_percent() is a cheap delta read
+    - parent PID and command line are read once when a PID appears, ancestors are resolved from the cached parent map
+    - root / application / exception patterns are compiled once into single regular expressions
+    - tree strings are built only for the process that is actually reported
+"""
+import re
+import time
+
+import psutil
+
+NO_PROCESS = "[NO PROCESS]"
+
+ID_CPU_OVERUSE = 0
+ID_RAM_OVERUSE = 1
+
+
+def compile_patterns(patterns):
+    """Compile substrings into one regex matching any of them (None if empty)"""
+    patterns = [p for p in patterns if p]
+    if not patterns:
+        return None
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+class _TrackedProcess:
+    __slots__ = ('process', 'ppid', 'cmd', 'is_root', 'is_app', 'is_exception')
+
+    def __init__(self, process, ppid, cmd):
+        self.process = process
+        self.ppid = ppid
+        self.cmd = cmd
+        self.is_root = False
+        self.is_app = False
+        self.is_exception = False
+
+
+class ProcessTreeMonitor:
+    """
+    Tracks all processes and reports the first process outside the root/application trees
+    that uses more than cpu_cut % CPU or mem_cut % RAM.
+    """
+
+    def __init__(self, root_patterns, app_patterns, exception_patterns, cpu_cut=30.0, mem_cut=15.0, top_n=30):
+        """
+        :param root_patterns: command substrings of root processes (e.g. indy_run.py); their descendants are allowed
+        :param app_patterns: command substrings of application processes; their descendants are allowed
+        :param exception_patterns: command substrings ignored when found in the process or its ancestors
+        :param top_n: number of entries kept in resources (sorted by CPU usage)
+        """
+        self.root_matcher = compile_patterns(root_patterns)
+        self.app_matcher = compile_patterns(app_patterns)
+        self.exception_matcher = compile_patterns(exception_patterns)
+        self.cpu_cut = cpu_cut
+        self.mem_cut = mem_cut
+        self.top_n = top_n
+        self.resources = []         # [{pid, name, cpu_percent, mem_mb, mem_percent}], latest sample
+        self.sample_time = 0.0      # duration of the latest sample (sec)
+        self._procs = {}            # pid -> _TrackedProcess
+        self._mem_total = psutil.virtual_memory().total
+
+    # --- process table ---
+    def _add(self, pid):
+        try:
+            process = psutil.Process(pid)
+            with process.oneshot():
+                ppid = process.ppid()
+                cmd = " ".join(process.cmdline()) or process.name()
+            process.cpu_percent(None)   # first call primes the CPU time delta
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+        tracked = _TrackedProcess(process, ppid, cmd)
+        tracked.is_root = self.root_matcher is not None and self.root_matcher.search(cmd) is not None
+        tracked.is_app = self.app_matcher is not None and self.app_matcher.search(cmd) is not None
+        tracked.is_exception = self.exception_matcher is not None and self.exception_matcher.search(cmd) is not None
+        self._procs[pid] = tracked
+        return tracked
+
+    def refresh(self):
+        """Update the process table from new/exited PIDs only"""
+        pids = set(psutil.pids())
+        for pid in list(self._procs):
+            if pid not in pids:
+                del self._procs[pid]
+        for pid in pids:
+            if pid not in self._procs:
+                self._add(pid)
+
+    def ancestors(self, pid):
+        """[pid, parent, grandparent, ...] from the cached parent map"""
+        chain = []
+        while pid in self._procs and pid not in chain:
+            chain.append(pid)
+            pid = self._procs[pid].ppid
+        return chain
+
+    def is_allowed(self, pid):
+        """True if the process is under a root/application process or matches an exception pattern"""
+        for ancestor in self.ancestors(pid):
+            tracked = self._procs[ancestor]
+            if tracked.is_root or tracked.is_app or tracked.is_exception:
+                return True
+        return False
+
+    def get_tree(self, pid):
+        """Ancestor chain as an indented string, root first"""
+        chain = self.ancestors(pid)
+        if not chain:
+            return NO_PROCESS
+        lines = []
+        for depth, ancestor in enumerate(reversed(chain)):
+            lines.append("{}[{}] {}".format("  " * depth, ancestor, self._procs[ancestor].cmd))
+        return "\n".join(lines)
+
+    # --- sampling ---
+    def sample(self):
+        """
+        Refresh the table, read CPU/RAM usage of every process and return the first misuse found.
+        :return: None or {pid, name, cpu_percent, mem_mb, mem_percent, misuse_type, percentage, tree}
+        """
+        start = time.perf_counter()
+        self.refresh()
+        resources = []
+        misuse = None
+        for pid, tracked in list(self._procs.items()):
+            try:
+                with tracked.process.oneshot():
+                    cpu_percent = tracked.process.cpu_percent(None)
+                    rss = tracked.process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                self._procs.pop(pid, None)
+                continue
+            mem_percent = 100.0 * rss / self._mem_total
+            entry = {'pid': pid, 'name': tracked.cmd, 'cpu_percent': cpu_percent,
+                     'mem_mb': rss / (1024.0 * 1024.0), 'mem_percent': mem_percent}
+            resources.append(entry)
+
+            if misuse is not None:
+                continue
+            if cpu_percent >= self.cpu_cut:
+                misuse_type, percentage = ID_CPU_OVERUSE, cpu_percent
+            elif mem_percent >= self.mem_cut:
+                misuse_type, percentage = ID_RAM_OVERUSE, mem_percent
+            else:
+                continue
+            if not self.is_allowed(pid):
+                misuse = dict(entry, misuse_type=misuse_type, percentage=percentage, tree=self.get_tree(pid))
+
+        resources.sort(key=lambda item: item['cpu_percent'], reverse=True)
+        self.resources = resources[:self.top_n]
+        self.sample_time = time.perf_counter() - start
+        return misuse
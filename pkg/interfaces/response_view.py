@@ -0,0 +1,214 @@
+"""
+Response decoding modes for the IndyFramework gRPC clients.
+
+    RESPONSE_DICT   -> json_format.MessageToDict (default, compatible with existing callers)
+    RESPONSE_RAW    -> the protobuf message itself
+    RESPONSE_VIEW   -> MessageView, a lazy read-only wrapper supporting both view['q'] and view.q
+
+MessageToDict walks every field of the message by reflection and allocates a new dict/list tree on every call.
+RAW/VIEW modes only touch the fields that are actually read.
+Differences of VIEW from DICT mode:
+    - int64/uint64 fields are int (DICT mode gives str)
+    - float fields keep full precision (DICT mode may round float32 values)
+    - nested messages and lists are converted on access, not in advance
+"""
+import threading
+from contextlib import contextmanager
+
+from google.protobuf import json_format
+from google.protobuf.descriptor import FieldDescriptor
+
+RESPONSE_DICT = 'dict'
+RESPONSE_RAW = 'raw'
+RESPONSE_VIEW = 'view'
+RESPONSE_MODES = (RESPONSE_DICT, RESPONSE_RAW, RESPONSE_VIEW)
+
+# field kind per (message full name, field name)
+_SCALAR = 0
+_MESSAGE = 1
+_REPEATED_SCALAR = 2
+_REPEATED_MESSAGE = 3
+_MAP = 4
+_field_kinds = {}
+
+
+def message_to_dict(message):
+    return json_format.MessageToDict(message,
+                                     including_default_value_fields=True,
+                                     preserving_proto_field_name=True,
+                                     use_integers_for_enums=True)
+
+
+def _field_kind(descriptor, name):
+    key = (descriptor.full_name, name)
+    kind = _field_kinds.get(key)
+    if kind is None:
+        field = descriptor.fields_by_name.get(name)
+        if field is None:
+            return None
+        is_message = field.type == FieldDescriptor.TYPE_MESSAGE
+        if field.label == FieldDescriptor.LABEL_REPEATED:
+            if is_message and field.message_type.GetOptions().map_entry:
+                kind = _MAP
+            else:
+                kind = _REPEATED_MESSAGE if is_message else _REPEATED_SCALAR
+        else:
+            kind = _MESSAGE if is_message else _SCALAR
+        _field_kinds[key] = kind
+    return kind
+
+
+def _convert(kind, value):
+    if kind == _SCALAR:
+        return value
+    if kind == _MESSAGE:
+        return MessageView(value)
+    if kind == _REPEATED_SCALAR:
+        return list(value)
+    if kind == _REPEATED_MESSAGE:
+        return [MessageView(item) for item in value]
+    return {k: (MessageView(v) if hasattr(v, 'DESCRIPTOR') else v) for k, v in value.items()}
+
+
+class MessageView:
+    """
+    Read-only view of a protobuf message.
+    Supports the dict access used by existing callers (view['q'], view.get('q'), 'q' in view)
+    as well as attribute access (view.q). Repeated fields are returned as lists, nested messages as MessageView.
+    """
+    __slots__ = ('_message',)
+
+    def __init__(self, message):
+        object.__setattr__(self, '_message', message)
+
+    @property
+    def raw(self):
+        """Underlying protobuf message"""
+        return self._message
+
+    @property
+    def DESCRIPTOR(self):
+        return self._message.DESCRIPTOR
+
+    def __getitem__(self, name):
+        kind = _field_kind(self._message.DESCRIPTOR, name)
+        if kind is None:
+            raise KeyError(name)
+        return _convert(kind, getattr(self._message, name))
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        kind = _field_kind(self._message.DESCRIPTOR, name)
+        if kind is None:
+            raise AttributeError(name)
+        return _convert(kind, getattr(self._message, name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('MessageView is read-only')
+
+    def __contains__(self, name):
+        return name in self._message.DESCRIPTOR.fields_by_name
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [field.name for field in self._message.DESCRIPTOR.fields]
+
+    def items(self):
+        return [(name, self[name]) for name in self.keys()]
+
+    def to_dict(self):
+        return message_to_dict(self._message)
+
+    def __repr__(self):
+        return 'MessageView({})'.format(type(self._message).__name__)
+
+
+class ResponseModeMixin:
+    """
+    Adds a selectable response mode to a gRPC client.
+    Per client: Client(ip, response_mode=RESPONSE_VIEW)
+    Per call:   with client.response_mode(RESPONSE_RAW): data = client.GetControlData()
+    The per-call override is thread-local, so other threads using the same client keep their mode.
+    """
+    def _init_response_mode(self, response_mode=RESPONSE_DICT):
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError('Unknown response mode: {}'.format(response_mode))
+        self._response_mode = response_mode
+        self._response_override = threading.local()
+
+    def set_response_mode(self, response_mode):
+        self._init_response_mode(response_mode)
+
+    def get_response_mode(self):
+        return getattr(self._response_override, 'mode', None) or self._response_mode
+
+    @contextmanager
+    def response_mode(self, response_mode):
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError('Unknown response mode: {}'.format(response_mode))
+        previous = getattr(self._response_override, 'mode', None)
+        self._response_override.mode = response_mode
+        try:
+            yield self
+        finally:
+            self._response_override.mode = previous
+
+    def _decode(self, response):
+        mode = self.get_response_mode()
+        if mode == RESPONSE_DICT:
+            return message_to_dict(response)
+        if mode == RESPONSE_VIEW:
+            return MessageView(response)
+        return response
+
+
+############################
+# Typed accessors for hot fields (work on dict, MessageView and raw message alike)
+############################
+def _field(data, name):
+    if isinstance(data, dict):
+        return data[name]
+    return getattr(data, name)
+
+
+def get_q(control_data):
+    """Joint positions [deg] from ControlData"""
+    return list(_field(control_data, 'q'))
+
+
+def get_p(control_data):
+    """Task pose [mm, deg] from ControlData"""
+    return list(_field(control_data, 'p'))
+
+
+def get_op_state(control_data):
+    """OpState (int) from ControlData"""
+    return int(_field(control_data, 'op_state'))
+
+
+def get_signal_states(signals):
+    """{address: state} from a list of DigitalSignal"""
+    return {int(_field(signal, 'address')): int(_field(signal, 'state')) for signal in signals}
+
+
+def _signals(io_data, name):
+    """IOData has 'di'/'do' lists, Device GetDI/GetDO responses have 'signals'"""
+    if isinstance(io_data, dict):
+        return io_data[name] if name in io_data else io_data['signals']
+    return _field(io_data, name if name in io_data.DESCRIPTOR.fields_by_name else 'signals')
+
+
+def get_di(io_data):
+    """{address: state} of DI from IOData or DigitalList"""
+    return get_signal_states(_signals(io_data, 'di'))
+
+
+def get_do(io_data):
+    """{address: state} of DO from IOData or DigitalList"""
+    return get_signal_states(_signals(io_data, 'do'))
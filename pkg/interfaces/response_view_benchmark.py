@@ -0,0 +1,120 @@
+"""
+Benchmark of gRPC response decoding modes (no controller needed).
+
+Decodes typical RTDE responses (ControlData, IOData with 32 DI/DO, ProgramData) and reads the hot fields
+(q, p, op_state, di, do, program_state) in DICT (MessageToDict), VIEW (MessageView) and RAW (protobuf) modes.
+Before timing, checks that the list fields returned by the Control/Device clients
+(Get*Variable 'variables', GetDI/GetDO 'signals') read the same in all three modes.
+
+Usage:
+    python pkg/interfaces/response_view_benchmark.py --count 20000
+"""
+## relative import can cause error in python grpc. add impl to path to import and remove to prevent side-effect
+import os
+import sys
+impl_path = os.path.join(os.path.dirname(__file__), 'impl')
+sys.path.append(impl_path)
+
+import common_msgs_pb2 as common_data
+import control_msgs_pb2 as control_data
+import device_msgs_pb2 as device_data
+import rtde_msgs_pb2 as rtde_data
+
+while impl_path in sys.path:
+    sys.path.remove(impl_path)
+## relative import can cause error in python grpc. add impl to path to import and remove to prevent side-effect
+
+import argparse
+import time
+
+from google.protobuf.internal import api_implementation
+
+try:
+    from .response_view import (RESPONSE_DICT, RESPONSE_RAW, RESPONSE_VIEW, ResponseModeMixin, message_to_dict,
+                                _field, get_q, get_p, get_op_state, get_di, get_do)
+except ImportError:
+    from response_view import (RESPONSE_DICT, RESPONSE_RAW, RESPONSE_VIEW, ResponseModeMixin, message_to_dict,
+                               _field, get_q, get_p, get_op_state, get_di, get_do)
+
+
+def build_responses():
+    """Serialized responses as received from the wire"""
+    control = rtde_data.ControlData(running_hours=120, running_mins=30, running_secs=12, op_state=5, sim_mode=False,
+                                    q=[168.5, -35.8, -37.4, -168.6, 88.4, -0.3],
+                                    qdot=[0.1] * 6, p=[350.0, -186.5, 522.1, 180.0, 0.0, 90.0], pdot=[0.2] * 6,
+                                    ref_frame=[0.0] * 6, tool_frame=[0.0] * 6)
+    io = rtde_data.IOData()
+    for address in range(32):
+        io.di.add(address=address, state=address % 2)
+        io.do.add(address=address, state=(address + 1) % 2)
+    program = rtde_data.ProgramData(program_state=common_data.PROG_RUNNING, cmd_id=3, program_name='main.indy7')
+    return [(rtde_data.ControlData, control.SerializeToString()),
+            (rtde_data.IOData, io.SerializeToString()),
+            (rtde_data.ProgramData, program.SerializeToString())]
+
+
+class _Decoder(ResponseModeMixin):
+    def __init__(self, response_mode):
+        self._init_response_mode(response_mode)
+
+
+def build_list_responses():
+    """(response, list field) pairs of the Control/Device client methods that return a list field"""
+    int_vars = control_data.IntVars()
+    for addr in range(8):
+        int_vars.variables.add(addr=addr, value=addr * 1000)
+    jpos_vars = control_data.JPosVars()
+    jpos_vars.variables.add(addr=0, jpos=[0.0, -15.0, -90.0, 0.0, -75.0, 0.0])
+    signals = device_data.DigitalList()
+    for address in range(16):
+        signals.signals.add(address=address, state=address % 2)
+    return [(int_vars, 'variables'), (jpos_vars, 'variables'), (signals, 'signals')]
+
+
+def _as_dicts(items):
+    return [item if isinstance(item, dict) else message_to_dict(getattr(item, 'raw', item)) for item in items]
+
+
+def check_list_fields():
+    """List fields read through _field() give the same items in DICT, VIEW and RAW modes"""
+    decoders = {mode: _Decoder(mode) for mode in (RESPONSE_DICT, RESPONSE_VIEW, RESPONSE_RAW)}
+    for response, name in build_list_responses():
+        expected = _as_dicts(_field(decoders[RESPONSE_DICT]._decode(response), name))
+        for mode, decoder in decoders.items():
+            items = _as_dicts(_field(decoder._decode(response), name))
+            if items != expected:
+                raise AssertionError(f"{type(response).__name__}.{name} differs in {mode} mode: {items} != {expected}")
+        print(f"{type(response).__name__ + '.' + name:>20}: dict/view/raw OK ({len(expected)} items)")
+
+
+def run(count, response_mode):
+    decoder = _Decoder(response_mode)
+    responses = build_responses()
+    start = time.perf_counter()
+    for _ in range(count):
+        control, io, program = [decoder._decode(message_type.FromString(data)) for message_type, data in responses]
+        get_q(control)
+        get_p(control)
+        get_op_state(control)
+        get_di(io)
+        get_do(io)
+        program['program_state'] if response_mode != RESPONSE_RAW else program.program_state
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="gRPC response decoding benchmark")
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args()
+
+    check_list_fields()
+    # the ratios depend heavily on the protobuf runtime (python / cpp / upb) and vary run to run
+    print(f"protobuf runtime: {api_implementation.Type()}")
+    results = {mode: run(args.count, mode) for mode in (RESPONSE_DICT, RESPONSE_VIEW, RESPONSE_RAW)}
+    baseline = results[RESPONSE_DICT]
+    for mode, usec in results.items():
+        print(f"{mode:>5}: {usec:8.2f} us/cycle  (x{baseline / usec:.1f})")
+
+
+if __name__ == '__main__':
+    main()
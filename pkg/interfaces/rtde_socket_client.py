@@ -12,8 +12,17 @@ while impl_path in sys.path:
     sys.path.remove(impl_path)
 ## relative import can cause error in python grpc. add impl to path to import and remove to prevent side-effect
 
+try:
+    from .channel_pool import get_channel
+    from .response_view import ResponseModeMixin, RESPONSE_DICT
+except ImportError:
+    from channel_pool import get_channel
+    from response_view import ResponseModeMixin, RESPONSE_DICT
+
 import math
 import sys
+import threading
+import time
 
 from google.protobuf import json_format
 import grpc
@@ -21,7 +30,7 @@ import grpc
 import common as Common
 
 
-class RTDESocketClient:
+class RTDESocketClient(ResponseModeMixin):
     """
     gRPC client to RTDE Server in C++ IndyFramework v3.0
     """
@@ -35,8 +44,12 @@ class RTDESocketClient:
     CTRL_SYSTEM_OFF = common_data.OpState.OP_SYSTEM_OFF
     CTRL_BRAKE = common_data.OpState.OP_BRAKE_CONTROL
 
-    def __init__(self, ip_addr, port=Common.Config().RTDE_SOCKET_PORT):
-        rtde_channel = grpc.insecure_channel("{}:{}".format(ip_addr, port))
+    def __init__(self, ip_addr, port=Common.Config().RTDE_SOCKET_PORT, response_mode=RESPONSE_DICT):
+        """
+        :param response_mode: RESPONSE_DICT (MessageToDict), RESPONSE_VIEW (MessageView) or RESPONSE_RAW (protobuf message)
+        """
+        self._init_response_mode(response_mode)
+        rtde_channel = get_channel(ip_addr, port)
         rtde_stub = rtde_grpc.RTDataExchangeStub(rtde_channel)
         self.__rtde_stub = Common.Utils.StubWithTimeout(stub=rtde_stub, timeout=Common.Limits.GRPCTimeOut)
 
@@ -59,10 +72,7 @@ class RTDESocketClient:
             response  -> Response
         """
         response = self.__rtde_stub.GetMotionData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetControlData(self):
@@ -82,18 +92,12 @@ class RTDESocketClient:
             response  -> Response
         """
         response = self.__rtde_stub.GetControlData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
     @Common.Utils.exception_handler
     def GetControlState(self):
 
         response = self.__rtde_stub.GetControlState(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetControlState(self):
@@ -120,10 +124,7 @@ class RTDESocketClient:
             response -> Response
         """
         response = self.__rtde_stub.GetControlState(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetIOData(self):
@@ -140,10 +141,7 @@ class RTDESocketClient:
             response  -> Response
         """
         response = self.__rtde_stub.GetIOData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetServoData(self):
@@ -159,10 +157,7 @@ class RTDESocketClient:
             torques -> float[]
         """
         response = self.__rtde_stub.GetServoData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetControlState(self):
@@ -186,10 +181,7 @@ class RTDESocketClient:
              tau_jts  -> float[]
          """
         response = self.__rtde_stub.GetControlState(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetViolationData(self):
@@ -203,10 +195,7 @@ class RTDESocketClient:
             response  -> Response
         """
         response = self.__rtde_stub.GetViolationData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetViolationMessageQueue(self):
@@ -220,10 +209,7 @@ class RTDESocketClient:
             response  -> Response
         """
         response = self.__rtde_stub.GetViolationMessageQueue(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetProgramData(self):
@@ -241,36 +227,24 @@ class RTDESocketClient:
             response  -> Response
         """
         response = self.__rtde_stub.GetProgramData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetStopState(self):
         response = self.__rtde_stub.GetStopState(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     @Common.Utils.exception_handler
     def GetCollisionModelState(self):
         response = self.__rtde_stub.GetCollisionModelState(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
 
     def TestFunction(self, code: int, msg: str):
         try:
             response = self.__rtde_stub.TestFunction(rtde_data.TestRequest(
                 intVal=code, strVal=msg
             ))
-            return json_format.MessageToDict(response,
-                                             including_default_value_fields=True,
-                                             preserving_proto_field_name=True,
-                                             use_integers_for_enums=True)
+            return self._decode(response)
         except grpc.RpcError as ex:
             print('GRPC Exception: code ' + str(ex.code()) + ' - details: ' + str(ex.details()))
             return None
@@ -291,10 +265,140 @@ class RTDESocketClient:
             taures2  -> float[6]
         """
         response = self.__rtde_stub.GetReservedData(common_data.Empty())
-        return json_format.MessageToDict(response,
-                                         including_default_value_fields=True,
-                                         preserving_proto_field_name=True,
-                                         use_integers_for_enums=True)
+        return self._decode(response)
+
+    def Subscribe(self, topics=('control', 'io', 'program'), min_period=0.002, max_period=0.05):
+        """
+        Start a background RTDESubscriber on this client.
+        Consumers read subscriber.get('control') etc. instead of calling GetControlData() themselves.
+        """
+        return RTDESubscriber(self, topics=topics, min_period=min_period, max_period=max_period).start()
+
+
+class RTDESnapshot:
+    """
+    Immutable decoded RTDE data published by RTDESubscriber.
+        seq         -> int, incremented on every successful poll
+        timestamp   -> float, time.time() when the poll started
+        data        -> dict, topic -> decoded message (e.g. 'control' -> GetControlData())
+    """
+    __slots__ = ('seq', 'timestamp', 'data')
+
+    def __init__(self, seq, timestamp, data):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.data = data
+
+    def get(self, topic, default=None):
+        return self.data.get(topic, default)
+
+    def age(self, now=None):
+        return (time.time() if now is None else now) - self.timestamp
+
+
+class RTDESubscriber:
+    """
+    Keeps the latest RTDE data in a single slot refreshed by a dedicated poller thread.
+
+    RTDE server exposes unary calls only, so one thread polls the selected topics and publishes
+    a new RTDESnapshot by replacing one reference. Readers call latest()/get() in O(1) without
+    locking or issuing their own RPC.
+    The polling period adapts between min_period and max_period:
+    it resets to min_period whenever the data changes and doubles while nothing changes or the server is down.
+    """
+    TOPICS = {
+        'control': 'GetControlData',
+        'motion': 'GetMotionData',
+        'io': 'GetIOData',
+        'program': 'GetProgramData',
+        'servo': 'GetServoData',
+        'violation': 'GetViolationData',
+    }
+
+    def __init__(self, client, topics=('control', 'io', 'program'), min_period=0.002, max_period=0.05):
+        """
+        :param client: RTDESocketClient
+        :param topics: keys of TOPICS to poll
+        :param min_period: polling period while data is changing (sec)
+        :param max_period: polling period while data is idle or server is down (sec)
+        """
+        unknown = [topic for topic in topics if topic not in self.TOPICS]
+        if unknown:
+            raise ValueError('Unknown RTDE topics: {}'.format(unknown))
+        self._getters = [(topic, getattr(client, self.TOPICS[topic])) for topic in topics]
+        self.min_period = min_period
+        self.max_period = max_period
+        self.period = min_period
+        self.poll_count = 0
+        self.error_count = 0
+        self._latest = None             # RTDESnapshot, replaced atomically
+        self._updated = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='rtde_subscriber', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def is_running(self):
+        return self._running
+
+    def latest(self):
+        """Latest RTDESnapshot, None before the first successful poll"""
+        return self._latest
+
+    def get(self, topic, default=None):
+        """Latest decoded message of a topic"""
+        snapshot = self._latest
+        return default if snapshot is None else snapshot.data.get(topic, default)
+
+    def wait_update(self, after_seq=0, timeout=None):
+        """Block until a snapshot newer than after_seq is published. Returns the snapshot or None on timeout"""
+        with self._updated:
+            self._updated.wait_for(lambda: self._latest is not None and self._latest.seq > after_seq, timeout)
+        snapshot = self._latest
+        return snapshot if snapshot is not None and snapshot.seq > after_seq else None
+
+    def poll_once(self):
+        """Poll all topics once and publish a snapshot. Returns True if any value changed"""
+        timestamp = time.time()
+        data = {}
+        for topic, getter in self._getters:
+            message = getter()
+            if message is None:     # exception_handler returns None on RPC failure
+                self.error_count += 1
+                return False
+            data[topic] = message
+        self.poll_count += 1
+
+        previous = self._latest
+        changed = previous is None or previous.data != data
+        self._latest = RTDESnapshot((previous.seq + 1) if previous else 1, timestamp, data)
+        with self._updated:
+            self._updated.notify_all()
+        return changed
+
+    def _run(self):
+        while self._running:
+            started = time.time()
+            try:
+                changed = self.poll_once()
+            except Exception as ex:
+                self.error_count += 1
+                changed = False
+                print('RTDESubscriber poll error: {}'.format(ex))
+            self.period = self.min_period if changed else min(self.period * 2, self.max_period)
+            time.sleep(max(0.0, self.period - (time.time() - started)))
 
 
 ############################
@@ -36,9 +36,40 @@ class GlobalBlackboard(py_trees.blackboard.Blackboard, metaclass=SingletonMeta):
     def __init__(self, json_file_path=""):
         super().__init__()
         self.config_path = json_file_path
+        self._absolute_names = {}
         if json_file_path:
             initialize_blackboard_from_json(self, json_file_path)
 
+    def set_many(self, values: dict):
+        """Set several top-level keys with one storage update (nested 'a.b' names fall back to set)"""
+        names = self._absolute_names
+        updates = {}
+        for key, value in values.items():
+            name = names.get(key)
+            if name is None:
+                if "." in key:
+                    self.set(key, value)
+                    continue
+                name = names[key] = self.absolute_name(self.separator, key)
+                self.metadata.setdefault(name, py_trees.blackboard.KeyMetaData())
+            updates[name] = value
+        self.storage.update(updates)
+
+    def get_many(self, keys) -> list:
+        """Values of several top-level keys (None for missing keys)"""
+        names = self._absolute_names
+        storage = self.storage
+        values = []
+        for key in keys:
+            name = names.get(key)
+            if name is None:
+                if "." in key:
+                    values.append(self.get(key))
+                    continue
+                name = names[key] = self.absolute_name(self.separator, key)
+            values.append(storage.get(name))
+        return values
+
 def initialize_global_blackboard(json_file_path):
     """Create the singleton instance before other modules import it."""
     instance = GlobalBlackboard(json_file_path)
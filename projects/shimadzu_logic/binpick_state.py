@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import deque
+
+DEBUG_MODE = False
+
+# Blackboard 키 (변경된 값만 갱신)
+BB_BINPICK_PHASE = "binpick/state/phase"
+BB_BINPICK_HIGH_STATE = "binpick/state/high_state"
+BB_BINPICK_JOB_ID = "binpick/state/job_id"
+BB_BINPICK_DETECTION_COUNT = "binpick/state/detection_count"
+BB_BINPICK_DETECTIONS = "binpick/state/detections"
+BB_BINPICK_ERROR = "binpick/state/error"
+BB_BINPICK_UPDATED_AT = "binpick/state/updated_at"
+
+# 상태 필드 -> Blackboard 키
+FIELD_BB_KEYS = {
+    "phase": BB_BINPICK_PHASE,
+    "high_state": BB_BINPICK_HIGH_STATE,
+    "job_id": BB_BINPICK_JOB_ID,
+    "detection_count": BB_BINPICK_DETECTION_COUNT,
+    "detections": BB_BINPICK_DETECTIONS,
+    "error": BB_BINPICK_ERROR,
+}
+
+
+class BinpickState:
+    """Bin Picking 시스템의 최신 상태입니다. (이벤트마다 JSON을 다시 해석하지 않도록 필드로 보관)"""
+    __slots__ = ("phase", "high_state", "job_id", "detection_count", "detections", "error",
+                 "status_time", "detection_time", "error_time", "updated_time", "event_count")
+
+    def __init__(self):
+        self.phase = None
+        self.high_state = None
+        self.job_id = None
+        self.detection_count = 0
+        self.detections = []        # [{...}, ...] 최근 detection 이벤트의 검출 목록
+        self.error = None           # {"code", "message"} 또는 None
+        self.status_time = 0.0      # 마지막 status 이벤트 수신 시각 (time.time)
+        self.detection_time = 0.0
+        self.error_time = 0.0
+        self.updated_time = 0.0
+        self.event_count = 0
+
+    def copy(self):
+        state = BinpickState()
+        for name in self.__slots__:
+            setattr(state, name, getattr(self, name))
+        state.detections = list(self.detections)
+        return state
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class BinpickStateTracker:
+    """
+    Bin Picking 이벤트(status/detection/error)를 BinpickState로 반영하고,
+    변경된 필드만 Blackboard에 갱신하며 변경 이력을 링 버퍼로 보관합니다.
+    """
+    def __init__(self, bb=None, history_size: int = 256):
+        """
+        :param bb: Blackboard (None이면 Blackboard 갱신 안 함)
+        :param history_size: 변경 이력 최대 보관 개수
+        """
+        self.bb = bb
+        self.state = BinpickState()
+        self.history = deque(maxlen=history_size)  # (timestamp, evt, {필드: 새 값})
+        self._lock = threading.Lock()
+
+    def update(self, evt: str, payload: dict, timestamp: float = None) -> dict:
+        """
+        이벤트 1건을 반영합니다. status/detection 이벤트가 정상 수신되면 이전 에러 상태는 해제됩니다.
+        :param evt: "status" | "detection" | "error"
+        :return: 변경된 필드 {필드: 새 값}
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        if evt == "status":
+            fields = {"phase": payload.get("phase"), "high_state": payload.get("high_state")}
+            if "job_id" in payload:
+                fields["job_id"] = payload.get("job_id")
+            fields["error"] = None
+            time_field = "status_time"
+        elif evt == "detection":
+            detections = payload.get("detections", payload.get("objects")) or []
+            fields = {"detections": list(detections),
+                      "detection_count": payload.get("count", len(detections)),
+                      "error": None}
+            time_field = "detection_time"
+        elif evt == "error":
+            fields = {"error": {"code": payload.get("code", payload.get("error_code")),
+                                "message": payload.get("message", payload.get("reason"))}}
+            time_field = "error_time"
+        else:
+            return {}
+
+        with self._lock:
+            state = self.state
+            changes = {name: value for name, value in fields.items() if getattr(state, name) != value}
+            for name, value in changes.items():
+                setattr(state, name, value)
+            setattr(state, time_field, timestamp)
+            state.updated_time = timestamp
+            state.event_count += 1
+            if changes:
+                self.history.append((timestamp, evt, changes))
+
+        if self.bb is not None:
+            for name, value in changes.items():
+                self.bb.set(FIELD_BB_KEYS[name], value)
+            self.bb.set(BB_BINPICK_UPDATED_AT, timestamp)
+        if DEBUG_MODE and changes: print(f"INFO: Bin Picking 상태 변경 ({evt}): {changes}")
+        return changes
+
+    def clear_error(self):
+        """에러 상태를 해제합니다. (Bin Picking reset 명령 성공 시)"""
+        timestamp = time.time()
+        with self._lock:
+            changed = self.state.error is not None
+            self.state.error = None
+            if changed:
+                self.history.append((timestamp, "error", {"error": None}))
+        if changed and self.bb is not None:
+            self.bb.set(BB_BINPICK_ERROR, None)
+
+    def snapshot(self) -> BinpickState:
+        """현재 상태의 복사본"""
+        with self._lock:
+            return self.state.copy()
+
+    def get_history(self, count: int = None) -> list:
+        """최근 변경 이력 (오래된 순). count가 주어지면 마지막 count개"""
+        with self._lock:
+            items = list(self.history)
+        return items if count is None else items[-count:]
+
+    def age(self, now: float = None) -> float:
+        """마지막 status 이벤트 이후 경과 시간 (초). 수신 이력이 없으면 inf"""
+        with self._lock:
+            status_time = self.state.status_time
+        if not status_time:
+            return float('inf')
+        return (time.time() if now is None else now) - status_time
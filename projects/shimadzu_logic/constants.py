@@ -237,6 +237,7 @@ class RobotEvent(OpEvent):
     AUTO_MOTION_APPROACH_SCRAP_DONE = 32        # 스크랩 통 위치 앞 이동 완료
     AUTO_MOTION_ENTER_SCRAP_DONE = 33           # 스크랩 통 진입 완료
     AUTO_MOTION_RETRACT_FROM_SCRAP_DONE = 34    # 스크랩 통 위치 앞 후퇴 완료
+    AUTO_MOTION_ENTER_THICKNESS_FAIL = 35       # 두께측정 위치 측정 실패 (시간 초과 / 게이지 측정 실패)
     
     # 명령 실행 이벤트 (DO_Command)
     DO_AUTO_MOTION_PROGRAM_AUTO_ON = 40     # 로봇 프로그램 켜기 실행
@@ -3,6 +3,7 @@ import threading
 import time
 import os
 import json
+import queue
 
 DEBUG_MODE = False
 
@@ -21,6 +22,38 @@ def load_config(filepath: str) -> dict:
         if DEBUG_MODE: print(f"❌ Failed to load config: {e}")
         return {}
 
+class LineFramer:
+    """
+    수신 바이트 스트림을 CR 기준으로 한 줄씩 잘라내는 증분 프레이머입니다.
+    feed() 호출마다 버퍼 앞부분을 한 번만 잘라내므로 줄 수에 비례한 버퍼 복사가 없습니다.
+    """
+    def __init__(self, terminator: bytes = b'\r', max_buffer: int = 65536):
+        self.terminator = terminator
+        self.max_buffer = max_buffer
+        self._buffer = bytearray()
+
+    def clear(self):
+        self._buffer.clear()
+
+    def feed(self, data: bytes) -> list:
+        """데이터를 추가하고 완성된 줄(구분 문자 제외, bytes) 목록을 반환합니다."""
+        self._buffer += data
+        lines = []
+        start = 0
+        while True:
+            idx = self._buffer.find(self.terminator, start)
+            if idx < 0:
+                break
+            lines.append(bytes(self._buffer[start:idx]))
+            start = idx + len(self.terminator)
+        if start:
+            del self._buffer[:start]
+        if len(self._buffer) > self.max_buffer:
+            # 구분 문자 없이 쌓이는 쓰레기 데이터 방지
+            del self._buffer[:-self.max_buffer]
+        return lines
+
+
 class QRReader:
     """
     TCP/IP를 통해 QR 리더기(Server)에 접속하여 제어 및 데이터를 수신하는 클래스입니다.
@@ -40,11 +73,16 @@ class QRReader:
         self.is_connected = False
         self.running = False
         self.receiver_thread = None
-        self.buffer = ""
+        self.framer = LineFramer()
         
-        # 테스트 결과 동기화를 위한 변수
-        self._test_result_event = threading.Event()
-        self._test_success = False
+        # 테스트 응답(ER/데이터) 전달 큐와 요청 직렬화 락
+        # 요청 진행 중에만 채우며, 항목은 (수신 monotonic 시각, 성공 여부, 결과)
+        self._response_queue = queue.Queue(maxsize=10)
+        self._request_lock = threading.Lock()
+        self._request_sent_at = None    # 진행 중인 TESTn 전송 시각 (monotonic), 요청이 없으면 None
+        # 파싱된 QR 결과 전달 큐 (dict: index, name, score, timestamp). 가득 차면 오래된 결과부터 버림
+        self.result_queue = queue.Queue(maxsize=100)
+        self.last_result = None
 
         # 외부에서 등록 가능한 콜백 함수
         self.on_qr_data = None      # QR 데이터 수신 시 호출: func(data_str)
@@ -57,6 +95,7 @@ class QRReader:
             self.client_socket.settimeout(self.timeout)
             self.client_socket.connect((self.host, self.port))
             
+            self.framer.clear()
             self.is_connected = True
             self.running = True
             self.receiver_thread = threading.Thread(target=self._receive_loop, daemon=True)
@@ -88,13 +127,9 @@ class QRReader:
                     if DEBUG_MODE: print("⚠️ QR Reader: Connection closed by server.")
                     break
                 
-                # ASCII 디코딩 (에러 무시)
-                self.buffer += data.decode('ascii', errors='ignore')
-                
-                # [CR] (\r) 기준으로 메시지 분리
-                while '\r' in self.buffer:
-                    line, self.buffer = self.buffer.split('\r', 1)
-                    line = line.strip()
+                # [CR] (\r) 기준으로 메시지 분리 후 ASCII 디코딩 (에러 무시)
+                for raw_line in self.framer.feed(data):
+                    line = raw_line.decode('ascii', errors='ignore').strip()
                     if line:
                         self._process_message(line)
                         
@@ -142,14 +177,14 @@ class QRReader:
             return
         elif line.startswith("ER,"):
             # 에러 응답 수신
-            self._test_success = False
-            self._test_result_event.set()
+            self._put_response(False, None)
         else:
             # 실제 QR 데이터 (예: 002,TEST_002:01:100%:98)
             parsed_dict = self.parse_qr_data(line)
-            
-            self._test_success = True
-            self._test_result_event.set()
+            parsed_dict["timestamp"] = time.time()
+            self.last_result = parsed_dict
+            self._put_result(parsed_dict)
+            self._put_response(True, parsed_dict)
             
             # 점수(score)가 80점 이상이면 QUIT 명령을 전송하여 리더기를 멈춤
             if 'score' in parsed_dict:
@@ -164,6 +199,49 @@ class QRReader:
             if self.on_qr_data:
                 self.on_qr_data(parsed_dict)
 
+    @staticmethod
+    def _put_latest(target: queue.Queue, item):
+        """큐에 추가합니다. 큐가 가득 차면 가장 오래된 항목을 버립니다."""
+        while True:
+            try:
+                target.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    target.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _put_result(self, result: dict):
+        """결과 큐에 추가합니다. 큐가 가득 차면 가장 오래된 결과를 버립니다."""
+        self._put_latest(self.result_queue, result)
+
+    def _put_response(self, success: bool, result):
+        """
+        request_test 응답 큐에 추가합니다. 요청이 진행 중일 때만 넣으므로
+        LON 연속 읽기 등 요청 없이 들어온 결과는 쌓이지 않습니다.
+        """
+        if self._request_sent_at is None:
+            return
+        self._put_latest(self._response_queue, (time.monotonic(), success, result))
+
+    def get_result(self, timeout: float = None):
+        """
+        결과 큐에서 QR 결과 1개를 꺼냅니다.
+        :return: {'index', 'name', 'score', 'timestamp'} 또는 timeout 내 결과가 없으면 None
+        """
+        try:
+            return self.result_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _clear_responses(self):
+        while True:
+            try:
+                self._response_queue.get_nowait()
+            except queue.Empty:
+                return
+
     def send_command(self, cmd: str) -> bool:
         """명령어 전송 (뒤에 \r 추가)"""
         if not self.is_connected:
@@ -188,33 +266,57 @@ class QRReader:
         """LOFF 명령 전송 (리더기 끄기)"""
         return self.send_command("LOFF")
 
-    def request_test(self, test_no: int) -> bool:
+    def request_test(self, test_no: int, timeout: float = 5.0, attempt_timeout: float = 2.0,
+                     retry_interval: float = 0.5) -> bool:
         """
-        TESTn 명령을 전송하고 최대 5초간 결과를 확인합니다.
-        계속해서 ER 응답이 오거나 응답이 없으면 False를 반환합니다.
+        TESTn 명령을 전송하고 최대 timeout(초)까지 결과를 확인합니다.
+        ER 응답이나 attempt_timeout 내 무응답이면 남은 시간 안에서 재시도합니다.
+        동시에 호출되면 요청 단위로 직렬화됩니다. 성공 시 결과는 last_result에 저장됩니다.
         """
-        start_time = time.time()
-        timeout_limit = 5.0
-        
-        while time.time() - start_time < timeout_limit:
-            self._test_result_event.clear()
-            self._test_success = False
-            
-            if not self.send_command(f"TEST{test_no}"):
-                self.quit()
-                return False
-            
-            # 응답 대기 (최대 2초)
-            remaining = timeout_limit - (time.time() - start_time)
-            if self._test_result_event.wait(timeout=min(2.0, remaining)):
-                if self._test_success:
-                    return True
-            
-            time.sleep(0.5)  # 재시도 전 대기
+        deadline = time.monotonic() + timeout
+        with self._request_lock:
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    # 이전 요청의 늦은 응답 제거. 전송 시각 이전에 수신된 응답은 아래에서도 무시
+                    self._clear_responses()
+                    sent_at = self._request_sent_at = time.monotonic()
+                    
+                    if not self.send_command(f"TEST{test_no}"):
+                        self.quit()
+                        return False
+                    
+                    # 응답 대기 (최대 attempt_timeout, 남은 시간 이내)
+                    if self._wait_response(sent_at, min(attempt_timeout, remaining)):
+                        return True
+                    
+                    # 재시도 전 대기 (남은 시간 이내)
+                    wait = min(retry_interval, deadline - time.monotonic())
+                    if wait > 0:
+                        time.sleep(wait)
+            finally:
+                self._request_sent_at = None
             
         self.quit()
         return False
 
+    def _wait_response(self, sent_at: float, timeout: float) -> bool:
+        """sent_at 이후 수신된 응답을 timeout 동안 기다립니다. 성공 데이터면 True"""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                received_at, success, _ = self._response_queue.get(timeout=remaining)
+            except queue.Empty:
+                return False
+            if received_at < sent_at:
+                continue    # 이전 요청의 결과
+            return success
+
     def quit(self):
         """QUIT 명령 전송 (종료)"""
         return self.send_command("QUIT")
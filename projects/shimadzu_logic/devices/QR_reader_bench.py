@@ -0,0 +1,91 @@
+"""
+QRReader.request_test() 종단 간 지연 벤치마크 (가상 QR 리더기 사용)
+
+사용 예:
+    python QR_reader_bench.py --count 200 --latency 0.05 --failure-rate 0.1
+    python QR_reader_bench.py --timeout 3 --attempt-timeout 1 --retry-interval 0.2
+"""
+import argparse
+import time
+
+try:
+    from .QR_reader import QRReader
+    from .QR_reader_sim import QRReaderSimulator
+    from .bench_utils import percentile
+except ImportError:
+    from QR_reader import QRReader
+    from QR_reader_sim import QRReaderSimulator
+    from bench_utils import percentile
+
+
+def run_benchmark(count: int = 100, timeout: float = 5.0, attempt_timeout: float = 2.0,
+                  retry_interval: float = 0.5, **sim_kwargs) -> dict:
+    """
+    가상 QR 리더기를 띄우고 request_test()를 count회 호출하여 결과 통계를 반환합니다.
+    """
+    sim = QRReaderSimulator(**sim_kwargs)
+    port = sim.start()
+    reader = QRReader(host='127.0.0.1', port=port)
+    if not reader.connect():
+        sim.stop()
+        raise RuntimeError("가상 QR 리더기 접속 실패")
+
+    latencies = []
+    failures = 0
+    scores = []
+    try:
+        start = time.perf_counter()
+        for _ in range(count):
+            t0 = time.perf_counter()
+            ok = reader.request_test(1, timeout=timeout, attempt_timeout=attempt_timeout,
+                                     retry_interval=retry_interval)
+            latencies.append(time.perf_counter() - t0)
+            if ok:
+                try:
+                    scores.append(int(reader.last_result.get('score')))
+                except (TypeError, ValueError):
+                    pass
+            else:
+                failures += 1
+        elapsed = time.perf_counter() - start
+    finally:
+        reader.disconnect()
+        sim.stop()
+
+    latencies.sort()
+    return {
+        "count": count,
+        "failures": failures,
+        "elapsed_s": elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else float('nan'),
+        "mean_score": sum(scores) / len(scores) if scores else float('nan'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QRReader.request_test() latency benchmark")
+    parser.add_argument('--count', type=int, default=100)
+    parser.add_argument('--timeout', type=float, default=5.0)
+    parser.add_argument('--attempt-timeout', type=float, default=2.0)
+    parser.add_argument('--retry-interval', type=float, default=0.5)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--score-mean', type=float, default=95.0)
+    parser.add_argument('--score-std', type=float, default=3.0)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--heartbeat', type=float, default=1.0)
+    args = parser.parse_args()
+
+    result = run_benchmark(args.count, args.timeout, args.attempt_timeout, args.retry_interval,
+                           read_latency=args.latency, latency_jitter=args.jitter,
+                           score_mean=args.score_mean, score_std=args.score_std,
+                           failure_rate=args.failure_rate, heartbeat_interval=args.heartbeat, seed=0)
+    for key, value in result.items():
+        print(f"{key:>12}: {value:.3f}" if isinstance(value, float) else f"{key:>12}: {value}")
+
+
+if __name__ == '__main__':
+    main()
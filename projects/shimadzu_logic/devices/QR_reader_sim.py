@@ -0,0 +1,176 @@
+import random
+import socket
+import threading
+import time
+
+DEBUG_MODE = False
+
+
+class QRReaderSimulator:
+    """
+    QRReader가 접속하는 QR 리더기 서버를 흉내 내는 로컬 TCP 서버입니다.
+    LON/LOFF/TESTn/QUIT 명령에 'OK,<cmd>' 또는 'ER,<cmd>,<code>'로 응답하고,
+    TESTn 성공 시 읽기 지연 후 '002,TEST_002:01:100%:98' 형식의 데이터 줄을 전송합니다.
+    주기적으로 'HeartBeat' 줄을 전송합니다.
+    """
+    def __init__(self, codes=None, read_latency: float = 0.05, latency_jitter: float = 0.0,
+                 score_mean: float = 95.0, score_std: float = 3.0, failure_rate: float = 0.0,
+                 heartbeat_interval: float = 1.0, seed=None):
+        """
+        :param codes: 순서대로 읽힐 코드 이름 목록. None이면 TEST_001, TEST_002 ... 자동 생성
+        :param read_latency: TESTn 수신 후 데이터 전송까지의 읽기 지연 (초)
+        :param latency_jitter: 읽기 지연 편차 (초, 0~jitter 균등 분포 추가)
+        :param score_mean: 인식 점수 평균 (0~100)
+        :param score_std: 인식 점수 표준편차
+        :param failure_rate: TESTn에 ER 응답할 확률 (0~1)
+        :param heartbeat_interval: HeartBeat 전송 주기 (초). 0 이하이면 전송 안 함
+        :param seed: 난수 시드
+        """
+        self.codes = list(codes) if codes else None
+        self.read_latency = read_latency
+        self.latency_jitter = latency_jitter
+        self.score_mean = score_mean
+        self.score_std = score_std
+        self.failure_rate = failure_rate
+        self.heartbeat_interval = heartbeat_interval
+        self.random = random.Random(seed)
+        self.trigger_on = False
+        self.read_count = 0
+        self.command_log = []
+        self.running = False
+        self._server = None
+        self._threads = []
+
+    def _next_data_line(self) -> str:
+        self.read_count += 1
+        if self.codes:
+            name = self.codes[(self.read_count - 1) % len(self.codes)]
+        else:
+            name = f"TEST_{self.read_count:03d}"
+        score = int(min(100, max(0, round(self.random.gauss(self.score_mean, self.score_std)))))
+        return f"{self.read_count % 1000:03d},{name}:01:100%:{score}"
+
+    def _handle_command(self, cmd: str, send):
+        self.command_log.append(cmd)
+        if DEBUG_MODE: print(f"[QR SIM RX] {cmd}")
+        if cmd == "LON":
+            self.trigger_on = True
+            send(f"OK,{cmd}")
+        elif cmd == "LOFF" or cmd == "QUIT":
+            self.trigger_on = False
+            send(f"OK,{cmd}")
+        elif cmd.startswith("TEST"):
+            if self.failure_rate > 0 and self.random.random() < self.failure_rate:
+                send(f"ER,{cmd},01")
+                return
+            send(f"OK,{cmd}")
+            delay = self.read_latency
+            if self.latency_jitter > 0:
+                delay += self.random.uniform(0.0, self.latency_jitter)
+            if delay > 0:
+                time.sleep(delay)
+            send(self._next_data_line())
+        else:
+            send(f"ER,{cmd},00")
+
+    def start(self, host: str = '127.0.0.1', port: int = 0) -> int:
+        """TCP 서버를 시작하고 실제 바인딩된 포트 번호를 반환합니다."""
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self._server.listen(5)
+        self._server.settimeout(0.2)
+        self.running = True
+        thread = threading.Thread(target=self._accept_loop, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        return self._server.getsockname()[1]
+
+    def _accept_loop(self):
+        while self.running:
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.settimeout(0.05)
+            thread = threading.Thread(target=self._serve_client, args=(conn,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _serve_client(self, conn):
+        send_lock = threading.Lock()
+
+        def send(line: str):
+            with send_lock:
+                conn.sendall(f"{line}\r".encode('ascii'))
+
+        buffer = bytearray()
+        next_heartbeat = time.monotonic() + self.heartbeat_interval
+        try:
+            while self.running:
+                if self.heartbeat_interval > 0 and time.monotonic() >= next_heartbeat:
+                    send("HeartBeat")
+                    next_heartbeat = time.monotonic() + self.heartbeat_interval
+                try:
+                    data = conn.recv(1024)
+                except socket.timeout:
+                    continue
+                if not data:
+                    break
+                buffer += data
+                while True:
+                    idx = buffer.find(b'\r')
+                    if idx < 0:
+                        break
+                    cmd = bytes(buffer[:idx]).decode('ascii', errors='ignore').strip()
+                    del buffer[:idx + 1]
+                    if cmd:
+                        self._handle_command(cmd, send)
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    def stop(self):
+        self.running = False
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="QR reader TCP simulator")
+    parser.add_argument('--port', type=int, default=9004)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--score-mean', type=float, default=95.0)
+    parser.add_argument('--score-std', type=float, default=3.0)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--heartbeat', type=float, default=1.0)
+    parser.add_argument('--codes', nargs='*', default=None)
+    args = parser.parse_args()
+
+    sim = QRReaderSimulator(codes=args.codes, read_latency=args.latency, latency_jitter=args.jitter,
+                            score_mean=args.score_mean, score_std=args.score_std,
+                            failure_rate=args.failure_rate, heartbeat_interval=args.heartbeat)
+    port = sim.start('0.0.0.0', args.port)
+    print(f"Virtual QR reader listening on TCP port {port}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.stop()
+        print(f"reads served: {sim.read_count}")
+
+
+if __name__ == '__main__':
+    main()
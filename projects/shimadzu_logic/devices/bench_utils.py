@@ -0,0 +1,9 @@
+"""장치 시뮬레이터 벤치마크 / 부하 테스트 공용 함수"""
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """정렬된 값 목록의 p 백분위수 (최근접 순위). 값이 없으면 nan"""
+    if not sorted_values:
+        return float('nan')
+    idx = min(len(sorted_values) - 1, int(round(p / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
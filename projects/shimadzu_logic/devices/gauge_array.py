@@ -0,0 +1,166 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .mitutoyogauge import MitutoyoGauge
+    from .gauge_stream import GaugeStreamSampler
+except ImportError:
+    from mitutoyogauge import MitutoyoGauge
+    from gauge_stream import GaugeStreamSampler
+
+DEBUG_MODE = False
+
+
+class GaugeChannel:
+    """게이지 1대와 해당 게이지의 스트리밍 샘플러를 묶은 채널입니다."""
+    def __init__(self, name: str, gauge, sampler: GaugeStreamSampler, offset: float = 0.0):
+        """
+        :param name: 게이지 이름 (프로파일 키로 사용)
+        :param gauge: MitutoyoGauge 인스턴스
+        :param sampler: 해당 게이지의 GaugeStreamSampler
+        :param offset: 측정값 보정 오프셋 (mm)
+        """
+        self.name = name
+        self.gauge = gauge
+        self.sampler = sampler
+        self.offset = offset
+
+
+class ThicknessProfile:
+    """
+    시편 1개의 두께 측정 결과를 (측정 위치, 게이지)별로 타임스탬프와 함께 보관합니다.
+    """
+    def __init__(self, specimen_id=None):
+        self.specimen_id = specimen_id
+        self.points = []    # [{"position", "gauge", "value", "timestamp"}, ...]
+
+    def add(self, position: int, gauge_name: str, value: float, timestamp: float = None):
+        self.points.append({
+            "position": position,
+            "gauge": gauge_name,
+            "value": value,
+            "timestamp": time.time() if timestamp is None else timestamp,
+        })
+
+    def positions(self) -> list:
+        """측정된 위치 번호 목록 (중복 제거, 오름차순)"""
+        return sorted({p["position"] for p in self.points})
+
+    def values(self) -> list:
+        """(위치, 게이지 이름) 순으로 정렬된 측정값 목록"""
+        return [p["value"] for p in sorted(self.points, key=lambda p: (p["position"], p["gauge"]))]
+
+    def mean(self):
+        values = self.values()
+        return sum(values) / len(values) if values else None
+
+    def to_dict(self) -> dict:
+        values = self.values()
+        return {
+            "specimen_id": self.specimen_id,
+            "points": sorted(self.points, key=lambda p: (p["position"], p["gauge"])),
+            "mean": self.mean(),
+            "min": min(values) if values else None,
+            "max": max(values) if values else None,
+        }
+
+
+class GaugeArray:
+    """
+    N개의 게이지를 각자의 Serial/Socket 통신으로 관리하고 동시에 폴링하는 클래스입니다.
+    스트리밍 시 게이지마다 독립된 폴링 스레드가 동작하며, 1회 측정은 스레드 풀로 병렬 요청합니다.
+    """
+    def __init__(self, channels: list):
+        self.channels = channels
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(channels)), thread_name_prefix="gauge")
+
+    def __len__(self):
+        return len(self.channels)
+
+    @classmethod
+    def from_config(cls, full_config: dict, stream_config: dict = None):
+        """
+        MitutoyoGauge.json 설정으로부터 게이지 배열을 생성합니다.
+        GAUGES 항목이 없으면 기존과 동일하게 SERIAL_CONFIG 게이지 1대로 구성합니다.
+
+        GAUGES 항목 예시:
+            {"name": "gauge1", "connection_type": 1, "config": "SERIAL_CONFIG", "offset": 0.0}
+            {"name": "gauge2", "connection_type": 2, "config": {"host": "...", "port": 4001, "timeout": 1}}
+        config가 문자열이면 같은 파일의 해당 섹션을 사용합니다.
+        """
+        stream_config = stream_config or {}
+        entries = full_config.get('GAUGES') or [{"name": "gauge1", "connection_type": 1, "config": "SERIAL_CONFIG"}]
+        channels = []
+        for i, entry in enumerate(entries):
+            config = entry.get('config')
+            if isinstance(config, str):
+                config = full_config.get(config, {})
+            gauge = MitutoyoGauge(connection_type=entry.get('connection_type', 1), config=config)
+            sampler = GaugeStreamSampler(gauge,
+                                         capacity=stream_config.get('capacity', 2048),
+                                         poll_interval=stream_config.get('poll_interval', 0.0),
+                                         outlier_k=stream_config.get('outlier_k', 3.5))
+            channels.append(GaugeChannel(entry.get('name', f"gauge{i + 1}"), gauge, sampler, entry.get('offset', 0.0)))
+            if DEBUG_MODE: print(f"INFO: 게이지 채널 추가: {channels[-1].name}")
+        return cls(channels)
+
+    def start_stream(self):
+        for channel in self.channels:
+            channel.sampler.reset()
+            channel.sampler.start()
+
+    def stop_stream(self):
+        for channel in self.channels:
+            channel.sampler.stop()
+
+    def reset(self):
+        """모든 채널의 스트리밍 버퍼를 초기화합니다."""
+        for channel in self.channels:
+            channel.sampler.reset()
+
+    @property
+    def streaming(self) -> bool:
+        return any(channel.sampler.running for channel in self.channels)
+
+    def request_all(self) -> dict:
+        """
+        모든 게이지에 동시에 1회 측정을 요청합니다.
+        :return: {게이지 이름: 측정값(mm) 또는 None}
+        """
+        futures = {channel.name: self._executor.submit(channel.sampler.request) for channel in self.channels}
+        result = {}
+        for channel in self.channels:
+            value = futures[channel.name].result()
+            result[channel.name] = None if value is None else value + channel.offset
+        return result
+
+    def latest(self) -> dict:
+        """스트리밍 중 각 게이지의 최근 샘플 {이름: (timestamp, value) 또는 None}"""
+        return {channel.name: channel.sampler.latest() for channel in self.channels}
+
+    def statistics(self, window_ms: float) -> dict:
+        return {channel.name: channel.sampler.statistics(window_ms) for channel in self.channels}
+
+    def settled_values(self, tolerance_um: float, hold_ms: float):
+        """
+        모든 게이지가 안정되었으면 {이름: 안정값(mm)}을, 하나라도 안정되지 않았으면 None을 반환합니다.
+        """
+        result = {}
+        for channel in self.channels:
+            value = channel.sampler.settled_value(tolerance_um, hold_ms)
+            if value is None:
+                return None
+            result[channel.name] = value + channel.offset
+        return result
+
+    def record(self, profile: ThicknessProfile, position: int, values: dict, timestamp: float = None):
+        """측정 위치 1곳의 게이지별 값을 프로파일에 추가합니다."""
+        timestamp = time.time() if timestamp is None else timestamp
+        for name, value in values.items():
+            profile.add(position, name, value, timestamp)
+
+    def close(self):
+        self.stop_stream()
+        for channel in self.channels:
+            channel.gauge.disconnect()
+        self._executor.shutdown(wait=False)
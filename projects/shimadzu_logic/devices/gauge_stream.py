@@ -0,0 +1,205 @@
+import threading
+import time
+
+import numpy as np
+
+DEBUG_MODE = False
+
+
+class GaugeRingBuffer:
+    """
+    게이지 측정값을 타임스탬프와 함께 저장하는 고정 크기 NumPy 링 버퍼입니다.
+    타임스탬프는 time.monotonic() 기준(초)이며, 측정값 단위는 게이지 출력(mm) 그대로입니다.
+    """
+    def __init__(self, capacity: int = 2048):
+        self.capacity = int(capacity)
+        self._t = np.zeros(self.capacity, dtype=np.float64)
+        self._v = np.zeros(self.capacity, dtype=np.float64)
+        self._idx = 0       # 다음 쓰기 위치
+        self._count = 0     # 저장된 샘플 수
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        with self._lock:
+            self._idx = 0
+            self._count = 0
+
+    def append(self, timestamp: float, value: float):
+        with self._lock:
+            self._t[self._idx] = timestamp
+            self._v[self._idx] = value
+            self._idx = (self._idx + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+
+    def latest(self):
+        """가장 최근 샘플 (timestamp, value)을 반환합니다. 비어 있으면 None."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            i = (self._idx - 1) % self.capacity
+            return float(self._t[i]), float(self._v[i])
+
+    def oldest(self):
+        """저장된 가장 오래된 샘플의 timestamp를 반환합니다. 비어 있으면 None."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            i = 0 if self._count < self.capacity else self._idx
+            return float(self._t[i])
+
+    def window(self, duration: float, now: float = None):
+        """
+        최근 duration(초) 구간의 (timestamps, values) 배열을 시간 순서대로 복사해 반환합니다.
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            if self._count < self.capacity:
+                t = self._t[:self._count].copy()
+                v = self._v[:self._count].copy()
+            else:
+                t = np.concatenate((self._t[self._idx:], self._t[:self._idx]))
+                v = np.concatenate((self._v[self._idx:], self._v[:self._idx]))
+        start = np.searchsorted(t, now - duration, side='left')
+        return t[start:], v[start:]
+
+
+def reject_outliers(values: np.ndarray, k: float = 3.5) -> np.ndarray:
+    """
+    중앙값 절대 편차(MAD) 기준으로 이상치를 제거한 배열을 반환합니다.
+    |x - median| > k * 1.4826 * MAD 인 샘플을 제외합니다. (MAD가 0이면 그대로 반환)
+    """
+    if values.size < 3 or k <= 0:
+        return values
+    median = np.median(values)
+    deviation = np.abs(values - median)
+    mad = np.median(deviation)
+    if mad == 0:
+        return values
+    return values[deviation <= k * 1.4826 * mad]
+
+
+def window_statistics(values: np.ndarray) -> dict:
+    """측정값 배열의 통계(mean, median, std, min, max, count)를 dict로 반환합니다."""
+    if values.size == 0:
+        return {"count": 0}
+    return {
+        "count": int(values.size),
+        "mean": float(np.mean(values)),
+        "median": float(np.median(values)),
+        "std": float(np.std(values)),
+        "min": float(np.min(values)),
+        "max": float(np.max(values)),
+    }
+
+
+class GaugeStreamSampler:
+    """
+    백그라운드 스레드에서 게이지를 최대 속도로 폴링하여 링 버퍼에 저장하고,
+    구간 통계와 안정(settle) 판정을 제공하는 클래스입니다.
+    """
+    def __init__(self, gauge, capacity: int = 2048, poll_interval: float = 0.0, outlier_k: float = 3.5):
+        """
+        :param gauge: request_data() -> float | None 을 제공하는 게이지 객체 (MitutoyoGauge)
+        :param capacity: 링 버퍼 크기 (샘플 수)
+        :param poll_interval: 폴링 간 추가 대기 시간 (초). 0이면 응답 즉시 다음 요청
+        :param outlier_k: 이상치 제거 MAD 배수. 0 이하이면 이상치 제거 안 함
+        """
+        self.gauge = gauge
+        self.buffer = GaugeRingBuffer(capacity)
+        self.poll_interval = poll_interval
+        self.outlier_k = outlier_k
+        self.sample_count = 0
+        self.fail_count = 0
+        self.running = False
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """폴링 스레드를 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다."""
+        if self.running:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self._thread.start()
+        if DEBUG_MODE: print("INFO: 게이지 스트리밍 시작")
+
+    def stop(self):
+        """폴링 스레드를 정지합니다."""
+        self.running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if DEBUG_MODE: print("INFO: 게이지 스트리밍 정지")
+
+    def reset(self):
+        """버퍼와 카운터를 초기화합니다. (측정 위치가 바뀔 때 호출)"""
+        self.buffer.clear()
+        self.sample_count = 0
+        self.fail_count = 0
+
+    def request(self):
+        """
+        게이지에 1회 측정을 요청합니다. 폴링 스레드와 같은 락을 사용하므로
+        스트리밍 중에도 안전하게 호출할 수 있습니다.
+        """
+        with self._lock:
+            return self.gauge.request_data()
+
+    def _poll_loop(self):
+        while self.running:
+            value = self.request()
+            if value is None:
+                self.fail_count += 1
+                time.sleep(0.05)  # 통신 실패 시 재시도 전 짧은 대기
+                continue
+            self.buffer.append(time.monotonic(), value)
+            self.sample_count += 1
+            if self.poll_interval > 0:
+                time.sleep(self.poll_interval)
+
+    def latest(self):
+        """가장 최근 샘플 (timestamp, value)을 반환합니다."""
+        return self.buffer.latest()
+
+    def statistics(self, window_ms: float) -> dict:
+        """최근 window_ms 구간의 이상치 제거 후 통계를 반환합니다."""
+        _, values = self.buffer.window(window_ms / 1000.0)
+        return window_statistics(reject_outliers(values, self.outlier_k))
+
+    def settled_value(self, tolerance_um: float, hold_ms: float, min_samples: int = 3):
+        """
+        최근 hold_ms 동안 (이상치 제거 후) 측정값 범위가 tolerance_um 이내이면 중앙값(mm)을 반환합니다.
+        안정되지 않았거나 샘플이 hold_ms 구간을 채우지 못했으면 None을 반환합니다.
+        """
+        now = time.monotonic()
+        hold = hold_ms / 1000.0
+        _, values = self.buffer.window(hold, now)
+        if values.size < min_samples:
+            return None
+        # 버퍼가 hold 구간 전체를 덮고 있는지 확인 (reset 이후 hold_ms가 지나야 판정)
+        oldest = self.buffer.oldest()
+        if oldest is None or oldest > now - hold:
+            return None
+        values = reject_outliers(values, self.outlier_k)
+        if values.size < min_samples:
+            return None
+        if (np.max(values) - np.min(values)) * 1000.0 > tolerance_um:
+            return None
+        return float(np.median(values))
+
+    def wait_settled(self, tolerance_um: float, hold_ms: float, timeout: float, check_interval: float = 0.01):
+        """
+        측정값이 안정될 때까지 최대 timeout(초) 대기하고 안정값(mm)을 반환합니다. 실패 시 None.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            value = self.settled_value(tolerance_um, hold_ms)
+            if value is not None:
+                return value
+            time.sleep(check_interval)
+        return None
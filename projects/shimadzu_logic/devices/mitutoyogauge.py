@@ -37,34 +37,112 @@ def load_config(filepath: str) -> dict:
         sys.exit(1)
 
 
+class GaugeLineReader:
+    """
+    Serial/Socket 공통으로 사용하는 CR 단위 버퍼 리더입니다.
+    수신 가능한 만큼 한 번에 읽어 bytearray에 누적하고, CR 기준으로 한 줄씩 꺼냅니다.
+    줄을 꺼내고 남은 데이터는 다음 요청을 위해 버퍼에 보관합니다.
+    """
+    CHUNK_SIZE = 4096
+
+    def __init__(self, read_chunk, terminator: bytes = b'\r', max_buffer: int = 4096):
+        """
+        :param read_chunk: func(timeout) -> bytes. 타임아웃 시 b'', 연결 종료 시 None을 반환
+        :param terminator: 줄 구분 문자 (기본값 CR)
+        :param max_buffer: 구분 문자 없이 누적될 수 있는 최대 바이트 수
+        """
+        self._read_chunk = read_chunk
+        self.terminator = terminator
+        self.max_buffer = max_buffer
+        self._buffer = bytearray()
+
+    def clear(self):
+        """버퍼에 남은 데이터를 모두 비웁니다."""
+        self._buffer.clear()
+
+    def peek(self) -> bytes:
+        """버퍼에 남아 있는 데이터를 반환합니다. (디버그용)"""
+        return bytes(self._buffer)
+
+    def _pop_line(self):
+        idx = self._buffer.find(self.terminator)
+        if idx < 0:
+            return None
+        end = idx + len(self.terminator)
+        line = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return line
+
+    def discard_lines(self) -> list:
+        """
+        이미 도착한 데이터를 블로킹 없이 읽어들인 뒤, 완성된 줄을 모두 꺼내 버립니다.
+        (이전 요청이 타임아웃된 뒤 늦게 도착한 응답 제거용) 미완성 데이터는 유지합니다.
+        """
+        chunk = self._read_chunk(0)
+        if chunk:
+            self._buffer += chunk
+        lines = []
+        line = self._pop_line()
+        while line is not None:
+            lines.append(line)
+            line = self._pop_line()
+        return lines
+
+    def read_line(self, timeout: float):
+        """
+        CR까지의 한 줄(CR 포함)을 반환합니다.
+        timeout(초) 안에 완성된 줄이 없거나 연결이 닫히면 None을 반환합니다.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            line = self._pop_line()
+            if line is not None:
+                return line
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            chunk = self._read_chunk(remaining)
+            if chunk is None:
+                return None
+            if chunk:
+                self._buffer += chunk
+                if len(self._buffer) > self.max_buffer:
+                    # 구분 문자 없이 쌓이는 쓰레기 데이터 방지
+                    del self._buffer[:-self.max_buffer]
+
+
 class MitutoyoGauge:
     """
     미쓰도요 게이지의 RS232 통신을 처리하는 클래스입니다.
     Serial (1) 또는 Socket (2) 통신 방식을 지원합니다.
     """
-    def __init__(self, connection_type: int, debug_mode: int = 0):
+    def __init__(self, connection_type: int, debug_mode: int = 0, config: dict = None):
         """
         클래스를 초기화하고 통신 타입에 맞는 설정을 JSON 파일에서 로드합니다.
 
         :param connection_type: 1 (Serial) 또는 2 (Socket)
         :param debug_mode: 1로 설정 시 디버그 로그 출력, 0(기본값) 시 출력 안 함
+        :param config: 통신 설정 dict. 지정 시 JSON 파일의 SERIAL_CONFIG/SOCKET_CONFIG 대신 사용 (다중 게이지용)
         """
         self.connection_type = connection_type
         self.connection = None
+        self.reader = None
         self.config = {}
         self.debug_mode = debug_mode
         
         # 1. 설정 파일에서 모든 설정 로드
-        full_config = load_config(CONFIG_FILE_PATH)
+        full_config = {} if config else load_config(CONFIG_FILE_PATH)
         
         # 2. 통신 타입에 맞는 설정 선택
-        if connection_type == 1:
+        if config:
+            self.config = config
+        elif connection_type == 1:
             self.config = full_config.get('SERIAL_CONFIG', {})
             if DEBUG_MODE: print("INFO: 통신 방식이 Serial (COM/USB)로 설정되었습니다.")
         elif connection_type == 2:
             self.config = full_config.get('SOCKET_CONFIG', {})
             if DEBUG_MODE: print("INFO: 통신 방식이 Socket (TCP/IP)로 설정되었습니다.")
-        else:
+        if connection_type not in (1, 2):
             if DEBUG_MODE: print(f"ERROR: 잘못된 통신 방식 입력 ({connection_type}). 1(Serial) 또는 2(Socket)를 선택하세요.")
             sys.exit(1)
             
@@ -135,10 +213,16 @@ class MitutoyoGauge:
     def connect(self) -> bool:
         """설정된 통신 타입에 따라 연결을 시작합니다."""
         if self.connection_type == 1:
-            return self._connect_serial()
+            connected = self._connect_serial()
+            read_chunk = self._read_serial_chunk
         elif self.connection_type == 2:
-            return self._connect_socket()
-        return False
+            connected = self._connect_socket()
+            read_chunk = self._read_socket_chunk
+        else:
+            return False
+        if connected:
+            self.reader = GaugeLineReader(read_chunk)
+        return connected
 
     def disconnect(self):
         """통신 연결을 해제합니다."""
@@ -146,21 +230,47 @@ class MitutoyoGauge:
             self.connection.close()
             if DEBUG_MODE: print("통신 연결 해제.")
             self.connection = None
+            self.reader = None
+
+    def _read_serial_chunk(self, timeout: float):
+        """시리얼 포트에서 현재 수신 가능한 만큼 읽습니다. 대기 데이터가 없으면 timeout까지 1바이트를 기다립니다."""
+        waiting = self.connection.in_waiting
+        if waiting:
+            return self.connection.read(waiting)
+        if timeout <= 0:
+            return b''
+        if self.connection.timeout != timeout:
+            self.connection.timeout = timeout
+        return self.connection.read(1)
+
+    def _read_socket_chunk(self, timeout: float):
+        """소켓에서 현재 수신 가능한 만큼 읽습니다. 연결이 닫히면 None을 반환합니다."""
+        self.connection.settimeout(timeout)
+        try:
+            chunk = self.connection.recv(GaugeLineReader.CHUNK_SIZE)
+        except (socket.timeout, BlockingIOError):
+            return b''
+        return chunk if chunk else None
+
+    def _request_line(self, send):
+        """요청 명령을 전송하고 CR까지의 응답 한 줄을 버퍼 리더로 수신합니다."""
+        stale = self.reader.discard_lines()
+        if stale:
+            self._log_debug(f"이전 요청의 지연 응답 폐기: {stale}")
+        send(self.request_command)
+        raw_response = self.reader.read_line(self.config.get('timeout', 1))
+        if raw_response is None:
+            self._log_debug(f"수신 타임아웃 발생. 현재 버퍼: {repr(self.reader.peek())}")
+            if DEBUG_MODE: print("게이지로부터 응답을 받지 못했습니다. (타임아웃)")
+        return raw_response
 
     def _request_serial_data(self):
         """시리얼 통신으로 데이터를 요청하고 수신합니다."""
         self._log_debug(f"Serial 송신 RAW (Bytes): {repr(self.request_command)}")
         try:
-            # 요청 명령 전송
-            self.connection.write(self.request_command)
-            
-            # 응답 데이터 수신 (CR(\r)까지 읽음)
-            raw_response = self.connection.read_until(b'\r')
-            
-            # 디버깅: 수신 RAW 메시지 출력
+            raw_response = self._request_line(self.connection.write)
             if raw_response:
                 self._log_debug(f"Serial 수신 RAW (Bytes): {repr(raw_response)}")
-            
             return raw_response
         except serial.SerialException as e:
             if DEBUG_MODE: print(f"통신 중 시리얼 오류 발생: {e}")
@@ -170,35 +280,10 @@ class MitutoyoGauge:
         """소켓 통신으로 데이터를 요청하고 수신합니다."""
         self._log_debug(f"Socket 송신 RAW (Bytes): {repr(self.request_command)}")
         try:
-            # 1. 요청 명령 전송
-            self.connection.sendall(self.request_command)
-            
-            # 2. 응답 데이터 수신 (CR(\r)이 나올 때까지 읽음)
-            buffer = b''
-            start_time = time.time()
-            timeout = self.config.get('timeout', 1)
-            
-            while time.time() - start_time < timeout:
-                try:
-                    # 소켓의 settimeout()이 적용되므로, 작은 버퍼로 반복 수신
-                    chunk = self.connection.recv(1) # 1바이트씩 읽기
-                    if chunk:
-                        buffer += chunk
-                        if buffer.endswith(b'\r'):
-                            self._log_debug(f"Socket 수신 RAW (Bytes): {repr(buffer)}")
-                            return buffer # CR 포함하여 응답 반환
-                    else:
-                        # 연결이 닫혔거나 데이터가 없음
-                        time.sleep(0.01)
-                except socket.timeout:
-                    self._log_debug(f"Socket 수신 타임아웃 발생. 현재 버퍼: {repr(buffer)}")
-                    break # 타임아웃 발생
-                except BlockingIOError:
-                    time.sleep(0.01)
-                    
-            if DEBUG_MODE: print("게이지로부터 응답을 받지 못했습니다. (타임아웃)")
-            return None
-            
+            raw_response = self._request_line(self.connection.sendall)
+            if raw_response:
+                self._log_debug(f"Socket 수신 RAW (Bytes): {repr(raw_response)}")
+            return raw_response
         except socket.error as e:
             if DEBUG_MODE: print(f"통신 중 소켓 오류 발생: {e}")
             return None
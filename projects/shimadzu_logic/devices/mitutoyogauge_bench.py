@@ -0,0 +1,82 @@
+"""
+MitutoyoGauge.request_data() 처리량/지연 벤치마크 (가상 게이지 사용)
+
+사용 예:
+    python mitutoyogauge_bench.py --transport tcp --count 2000
+    python mitutoyogauge_bench.py --transport pty --latency 0.005 --error-rate 0.01
+"""
+import argparse
+import time
+
+try:
+    from .mitutoyogauge import MitutoyoGauge
+    from .mitutoyogauge_sim import MitutoyoGaugeSimulator
+    from .bench_utils import percentile
+except ImportError:
+    from mitutoyogauge import MitutoyoGauge
+    from mitutoyogauge_sim import MitutoyoGaugeSimulator
+    from bench_utils import percentile
+
+
+def run_benchmark(transport: str = 'tcp', count: int = 1000, timeout: float = 1.0, **sim_kwargs) -> dict:
+    """
+    가상 게이지를 띄우고 request_data()를 count회 호출하여 결과 통계를 반환합니다.
+    """
+    sim = MitutoyoGaugeSimulator(**sim_kwargs)
+    if transport == 'tcp':
+        port = sim.start_tcp()
+        gauge = MitutoyoGauge(connection_type=2, config={"host": "127.0.0.1", "port": port, "timeout": timeout})
+    else:
+        path = sim.start_pty()
+        gauge = MitutoyoGauge(connection_type=1, config={"port": path, "baudrate": 2400, "bytesize": 8,
+                                                         "parity": "N", "stopbits": 1, "timeout": timeout})
+    latencies = []
+    failures = 0
+    try:
+        start = time.perf_counter()
+        for _ in range(count):
+            t0 = time.perf_counter()
+            value = gauge.request_data()
+            latencies.append(time.perf_counter() - t0)
+            if value is None:
+                failures += 1
+        elapsed = time.perf_counter() - start
+    finally:
+        gauge.disconnect()
+        sim.stop()
+
+    latencies.sort()
+    return {
+        "transport": transport,
+        "count": count,
+        "failures": failures,
+        "elapsed_s": elapsed,
+        "throughput_hz": count / elapsed if elapsed > 0 else float('inf'),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else float('nan'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MitutoyoGauge.request_data() benchmark")
+    parser.add_argument('--transport', choices=['tcp', 'pty'], default='tcp')
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--timeout', type=float, default=1.0)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--noise', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--drop-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    result = run_benchmark(args.transport, args.count, args.timeout,
+                           latency=args.latency, latency_jitter=args.jitter, noise_std=args.noise,
+                           error_rate=args.error_rate, drop_rate=args.drop_rate, seed=0)
+    for key, value in result.items():
+        print(f"{key:>14}: {value:.3f}" if isinstance(value, float) else f"{key:>14}: {value}")
+
+
+if __name__ == '__main__':
+    main()
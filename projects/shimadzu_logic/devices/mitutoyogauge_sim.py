@@ -0,0 +1,224 @@
+import os
+import random
+import select
+import socket
+import threading
+import time
+
+DEBUG_MODE = False
+
+
+class MitutoyoGaugeSimulator:
+    """
+    미쓰도요 게이지 RS232 프로토콜을 흉내 내는 가상 게이지입니다.
+    요청(CR) 1개마다 정상 응답 '01A+000.1234<CR>' 또는 에러 응답 '91x<CR>'을 돌려줍니다.
+    pty(가상 시리얼 포트)와 로컬 TCP 소켓을 지원하며, 측정값/노이즈/드리프트/응답 지연/에러를 설정할 수 있습니다.
+    """
+    def __init__(self, value: float = 1.0, noise_std: float = 0.0, drift_per_s: float = 0.0,
+                 latency: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, error_code: str = '1', drop_rate: float = 0.0, seed=None):
+        """
+        :param value: 기준 측정값 (mm)
+        :param noise_std: 가우시안 노이즈 표준편차 (mm)
+        :param drift_per_s: 시작 후 초당 드리프트 (mm/s)
+        :param latency: 응답 지연 (초)
+        :param latency_jitter: 응답 지연 편차 (초, 0~jitter 균등 분포 추가)
+        :param error_rate: 에러 응답(91x) 확률 (0~1)
+        :param error_code: 에러 응답 코드 문자 (91 뒤 1글자)
+        :param drop_rate: 응답하지 않을 확률 (0~1, 타임아웃 재현용)
+        :param seed: 난수 시드
+        """
+        self.value = value
+        self.noise_std = noise_std
+        self.drift_per_s = drift_per_s
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.drop_rate = drop_rate
+        self.random = random.Random(seed)
+        self.request_count = 0
+        self.running = False
+        self._start_time = time.monotonic()
+        self._threads = []
+        self._server = None
+        self._master_fd = None
+        self._slave_fd = None
+
+    def set_value(self, value: float):
+        """기준 측정값을 변경하고 드리프트 기준 시각을 초기화합니다."""
+        self.value = value
+        self._start_time = time.monotonic()
+
+    def current_value(self) -> float:
+        drift = self.drift_per_s * (time.monotonic() - self._start_time)
+        noise = self.random.gauss(0.0, self.noise_std) if self.noise_std > 0 else 0.0
+        return self.value + drift + noise
+
+    @staticmethod
+    def format_value(value: float) -> bytes:
+        """측정값을 '01A+000.1234<CR>' 형식으로 인코딩합니다."""
+        sign = '-' if value < 0 else '+'
+        return f"01A{sign}{abs(value):08.4f}\r".encode('ascii')
+
+    def response(self):
+        """요청 1개에 대한 응답 바이트를 생성합니다. 응답하지 않는 경우 None."""
+        self.request_count += 1
+        if self.drop_rate > 0 and self.random.random() < self.drop_rate:
+            return None
+        if self.error_rate > 0 and self.random.random() < self.error_rate:
+            return f"91{self.error_code}\r".encode('ascii')
+        return self.format_value(self.current_value())
+
+    def _delay(self):
+        delay = self.latency
+        if self.latency_jitter > 0:
+            delay += self.random.uniform(0.0, self.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _serve(self, recv, send):
+        """수신 데이터의 CR 개수만큼 응답을 전송합니다."""
+        while self.running:
+            data = recv()
+            if data is None:
+                break
+            for _ in range(data.count(b'\r')):
+                self._delay()
+                reply = self.response()
+                if reply is not None:
+                    send(reply)
+
+    # --- TCP ---
+    def start_tcp(self, host: str = '127.0.0.1', port: int = 0) -> int:
+        """로컬 TCP 서버를 시작하고 실제 바인딩된 포트 번호를 반환합니다."""
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self._server.listen(5)
+        self._server.settimeout(0.2)
+        self.running = True
+        thread = threading.Thread(target=self._accept_loop, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        port = self._server.getsockname()[1]
+        if DEBUG_MODE: print(f"INFO: 가상 게이지 TCP 서버 시작 {host}:{port}")
+        return port
+
+    def _accept_loop(self):
+        while self.running:
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.settimeout(0.2)
+            thread = threading.Thread(target=self._serve_socket, args=(conn,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _serve_socket(self, conn):
+        def recv():
+            while self.running:
+                try:
+                    data = conn.recv(1024)
+                    return data if data else None
+                except socket.timeout:
+                    continue
+                except OSError:
+                    return None
+            return None
+        try:
+            self._serve(recv, conn.sendall)
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    # --- pty (가상 시리얼) ---
+    def start_pty(self) -> str:
+        """pty 쌍을 생성하고 시리얼 포트로 열 수 있는 slave 장치 경로를 반환합니다. (POSIX 전용)"""
+        import pty
+        import tty
+        self._master_fd, self._slave_fd = pty.openpty()
+        # CR -> LF 변환 등 라인 처리를 끄기 위해 raw 모드로 설정
+        tty.setraw(self._slave_fd)
+        tty.setraw(self._master_fd)
+        self.running = True
+        thread = threading.Thread(target=self._serve_pty, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        path = os.ttyname(self._slave_fd)
+        if DEBUG_MODE: print(f"INFO: 가상 게이지 pty 시작 {path}")
+        return path
+
+    def _serve_pty(self):
+        fd = self._master_fd
+
+        def recv():
+            while self.running:
+                readable, _, _ = select.select([fd], [], [], 0.2)
+                if readable:
+                    try:
+                        return os.read(fd, 1024)
+                    except OSError:
+                        return None
+            return None
+
+        def send(data):
+            os.write(fd, data)
+
+        try:
+            self._serve(recv, send)
+        except OSError:
+            pass
+
+    def stop(self):
+        """서버/pty를 정지합니다."""
+        self.running = False
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        for fd in (self._master_fd, self._slave_fd):
+            if fd is not None:
+                os.close(fd)
+        self._master_fd = self._slave_fd = None
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Mitutoyo gauge protocol simulator")
+    parser.add_argument('--transport', choices=['tcp', 'pty'], default='tcp')
+    parser.add_argument('--port', type=int, default=4000)
+    parser.add_argument('--value', type=float, default=1.0)
+    parser.add_argument('--noise', type=float, default=0.0)
+    parser.add_argument('--drift', type=float, default=0.0)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--drop-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    sim = MitutoyoGaugeSimulator(value=args.value, noise_std=args.noise, drift_per_s=args.drift,
+                                 latency=args.latency, error_rate=args.error_rate, drop_rate=args.drop_rate)
+    if args.transport == 'tcp':
+        port = sim.start_tcp('0.0.0.0', args.port)
+        print(f"Virtual gauge listening on TCP port {port}")
+    else:
+        print(f"Virtual gauge serial port: {sim.start_pty()}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.stop()
+        print(f"requests served: {sim.request_count}")
+
+
+if __name__ == '__main__':
+    main()
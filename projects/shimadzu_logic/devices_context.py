@@ -5,9 +5,11 @@ from pkg.utils.process_control import Flagger, reraise, FlagDelay
 from pkg.utils.file_io import load_json, save_json
 
 # Mitutoyogauge import 추가
-from .devices.mitutoyogauge import MitutoyoGauge
+from .devices.mitutoyogauge import MitutoyoGauge, load_config as load_gauge_config, CONFIG_FILE_PATH as GAUGE_CONFIG_PATH
+from .devices.gauge_array import GaugeArray, ThicknessProfile
 from .devices.remote_io import AutonicsEIPClient
 from .devices.shimadzu_client import ShimadzuClient
+from .devices.QR_reader import QRReader
 
 from pkg.configs.global_config import GlobalConfig
 global_config = GlobalConfig()
@@ -35,10 +37,22 @@ class DeviceContext(ContextBase):
         self.dev_gauge_enable = True
         self.dev_remoteio_enable = True
         self.dev_smz_enable = False 
+        self.dev_qr_enable = False
         
-        # MitutoyoGauge 장치 인스턴스 생성
+        # MitutoyoGauge 장치 인스턴스 생성 (MitutoyoGauge.json의 GAUGES 항목 수만큼, 없으면 시리얼 1대)
+        gauge_config = load_gauge_config(GAUGE_CONFIG_PATH) if self.dev_gauge_enable else {}
+        self.gauge_stream_config = gauge_config.get('STREAM_CONFIG', {})
+        self.gauge_profile_config = gauge_config.get('PROFILE_CONFIG', {})
+        self.gauge_array = None
+        self.gauge = None
+        self.gauge_sampler = None
         if self.dev_gauge_enable :
-            self.gauge = MitutoyoGauge(connection_type=1)  # 예: connection_type=1는 시리얼 통신을 의미
+            self.gauge_array = GaugeArray.from_config(gauge_config, self.gauge_stream_config)
+            # 단일 게이지 API 호환용 (첫 번째 게이지)
+            self.gauge = self.gauge_array.channels[0].gauge
+            self.gauge_sampler = self.gauge_array.channels[0].sampler
+            Logger.info(f"[device] Dial Gauges : {[channel.name for channel in self.gauge_array.channels]}")
+        self.thickness_profile = ThicknessProfile()
         # 측정, 상태 확인 명령 전송 방지 변수
         self.gauge_initial_check_done = False
         self.gauge_measurement_done = False
@@ -62,6 +76,12 @@ class DeviceContext(ContextBase):
             Logger.info(f"[ShimadzuClient] Init Response: {result}")
             time.sleep(0.5)
 
+        # QR 리더 장치 인스턴스 생성
+        self.qr_reader = None
+        if self.dev_qr_enable :
+            self.qr_reader = QRReader()
+            Logger.info(f"[device] QR Reader connect : {self.qr_reader.connect()}")
+
         # self.shimadzu_test()
         # Logger.info(f"[ShimadzuClient] AreYouThere Response: {result}")
         # time.sleep(0.5)
@@ -660,20 +680,25 @@ class DeviceContext(ContextBase):
     # dial gauge 측정 함수
     def get_dial_gauge_value(self) -> float:
         '''
-        Docstring for get_dial_gauge_value
-        
+        모든 게이지에 1회 측정을 요청하고 오프셋이 적용된 값의 평균을 반환합니다.
+        (게이지 1대이면 해당 게이지 값, 두께 프로파일과 같은 gauge_array 경로 사용)
         
         :return: gauge measurement valuee
         :rtype: float
         '''
         try:
             self.gauge_measurement_done = True
-            value = self.gauge.request_data()
-            bb.set("device/gauge/thickness", value)
-            Logger.info(f"[device] Dial Gauge Value: {value}")
+            values = self.gauge_array.request_all()
             self.gauge_measurement_done = False
+            if any(value is None for value in values.values()) :
+                Logger.error(f"[device] Dial Gauge read failed: {values}")
+                return -999.0
+            value = sum(values.values()) / len(values)
+            bb.set("device/gauge/thickness", value)
+            Logger.info(f"[device] Dial Gauge Value: {value} {values}")
             return value
         except Exception as e:
+            self.gauge_measurement_done = False
             Logger.error(f"[device] Error in get_dial_gauge_value: {e}")
             reraise(e)
             return -999.0  # 오류 시 반환 값
@@ -689,16 +714,108 @@ class DeviceContext(ContextBase):
             if self.gauge_measurement_done :
                 return
             
-            value = self.gauge.request_data()
-            if value is not None :
-                return True 
-            else :
-                return False
+            # 스트리밍 중에는 추가 요청 없이 최근 샘플 수신 여부로 판단
+            if self.gauge_array.streaming :
+                now = time.monotonic()
+                return all(latest is not None and now - latest[0] < 1.0
+                           for latest in self.gauge_array.latest().values())
+
+            values = self.gauge_array.request_all()
+            return all(value is not None for value in values.values())
         except Exception as e:
             Logger.error(f"[device] Error in get_dial_gauge_status: {e}")
             reraise(e)
             return False
 
+    def start_dial_gauge_stream(self) -> bool :
+        '''
+        dial gauge 연속 측정(백그라운드 폴링)을 모든 게이지에 대해 시작합니다. 버퍼는 초기화됩니다.
+        :return: sucess True, fail False
+        '''
+        try:
+            self.gauge_array.start_stream()
+            Logger.info(f"[device] Dial Gauge Stream Started")
+            return True
+        except Exception as e:
+            Logger.error(f"[device] Error in start_dial_gauge_stream: {e}")
+            reraise(e)
+            return False
+
+    def stop_dial_gauge_stream(self) -> bool :
+        '''
+        dial gauge 연속 측정을 정지합니다.
+        :return: sucess True, fail False
+        '''
+        try:
+            self.gauge_array.stop_stream()
+            for channel in self.gauge_array.channels :
+                Logger.info(f"[device] Dial Gauge Stream Stopped [{channel.name}] "
+                            f"(samples: {channel.sampler.sample_count}, fails: {channel.sampler.fail_count})")
+            return True
+        except Exception as e:
+            Logger.error(f"[device] Error in stop_dial_gauge_stream: {e}")
+            reraise(e)
+            return False
+
+    def get_dial_gauge_settled_values(self) :
+        '''
+        연속 측정 버퍼에서 모든 게이지의 안정된 두께 값을 조회합니다. (블로킹 없음)
+        STREAM_CONFIG의 tolerance_um 이내로 hold_ms 동안 유지되면 게이지별 중앙값을 반환합니다.
+
+        :return: {gauge name: settled value (mm)}, 하나라도 안정되지 않았으면 None
+        '''
+        try:
+            hold_ms = self.gauge_stream_config.get('hold_ms', 300)
+            values = self.gauge_array.settled_values(self.gauge_stream_config.get('tolerance_um', 2.0), hold_ms)
+            if values is not None :
+                bb.set("device/gauge/stats", self.gauge_array.statistics(hold_ms))
+            return values
+        except Exception as e:
+            Logger.error(f"[device] Error in get_dial_gauge_settled_values: {e}")
+            reraise(e)
+            return None
+
+    def start_thickness_profile(self, specimen_id=None) :
+        '''
+        시편 1개의 두께 프로파일 기록을 새로 시작합니다.
+        '''
+        self.thickness_profile = ThicknessProfile(specimen_id)
+        bb.set("device/gauge/thickness/profile", self.thickness_profile.to_dict())
+
+    def record_thickness_profile(self, position: int, values: dict) :
+        '''
+        측정 위치 1곳의 게이지별 값을 두께 프로파일에 추가하고 blackboard에 반영합니다.
+        :param position: 로봇 두께 측정 위치 번호
+        :param values: {gauge name: value (mm)}
+        '''
+        self.gauge_array.record(self.thickness_profile, position, values)
+        profile = self.thickness_profile.to_dict()
+        bb.set("device/gauge/thickness/profile", profile)
+        bb.set("device/gauge/thickness/points", self.thickness_profile.values())
+        bb.set("device/gauge/thickness", profile["mean"])
+
+    # QR reader 관련 함수
+    def read_specimen_qr(self, test_no: int = 1) :
+        '''
+        QR 리더에 TESTn 을 요청하고 인식된 시편 ID를 blackboard(device/specimen/id)에 기록합니다.
+        :return: {'index', 'name', 'score', 'timestamp'}, 실패 시 None
+        '''
+        try:
+            if not self.qr_reader.request_test(test_no) :
+                Logger.error(f"[device] QR read failed (TEST{test_no})")
+                return None
+            result = self.qr_reader.last_result
+            if not result or "name" not in result :
+                Logger.error(f"[device] QR result parse failed: {result}")
+                return None
+            bb.set("device/specimen/id", result["name"])
+            Logger.info(f"[device] QR Specimen ID: {result['name']} (score: {result.get('score')})")
+            return result
+        except Exception as e:
+            Logger.error(f"[device] Error in read_specimen_qr: {e}")
+            reraise(e)
+            return None
+
     # shimadzu client 래핑 함수들
     def smz_ask_register(self, regist_data: dict, **params) -> Optional[Dict[str, Any]]:
         '''
@@ -176,12 +176,17 @@ class ReadQRStrategy(Strategy):
     def prepare(self, context: DeviceContext, **kwargs):
         Logger.info("[device] enter ReadQRStrategy")
         Logger.info("[device] Device: Reading QR Code.")
+        # 이전 시편 ID가 두께 프로파일에 남지 않도록 초기화
+        bb.set("device/specimen/id", "")
 
     def operate(self, context: DeviceContext) -> DeviceEvent:
-        # QR 리딩 로직 수행
-        # 성공 시:
+        # QR 리더 미사용 시 시편 ID 없이 진행
+        if context.qr_reader is None:
+            return DeviceEvent.QR_READ_DONE
+        # 인식된 시편 ID는 device/specimen/id 에 기록되어 두께 프로파일에 사용됨
+        if context.read_specimen_qr() is None:
+            return DeviceEvent.QR_READ_FAIL
         return DeviceEvent.QR_READ_DONE
-        # 실패 시: return DeviceEvent.QR_READ_FAIL
     
     def exit(self, context: DeviceContext, event: DeviceEvent) -> None:
         Logger.info("[device] exit ReadQRStrategy")
@@ -190,12 +195,78 @@ class MeasureThicknessStrategy(Strategy):
     def prepare(self, context: DeviceContext, **kwargs):
         Logger.info("[device] enter MeasureThicknessStrategy")
         Logger.info("[device] Device: Measuring Thickness.")
+        # 로봇 측정 위치 수 (RobotEnterThicknessPos1..3). 게이지를 여러 대 두면 위치 수를 줄일 수 있음
+        # position_wait 동안 로봇 위치가 한 번도 들어오지 않으면 측정 실패.
+        # single_read_fallback이 켜져 있거나 robot_positions가 0이면 대신 현재 위치에서 1회 측정
+        self.position_count = context.gauge_profile_config.get('robot_positions', 3)
+        self.position_wait = context.gauge_profile_config.get('position_wait', 10.0)
+        self.single_read_fallback = context.gauge_profile_config.get('single_read_fallback', False)
+        self.position = 0
+        self.start = self.position_start = time.monotonic()
+        self.deadline = self.start + context.gauge_profile_config.get('measure_timeout', 60.0)
+        self.measured = set()
+        bb.set("device/gauge/thickness/settled_pos", 0)
+        bb.set("device/gauge/thickness/failed", False)
+        context.start_thickness_profile(bb.get("device/specimen/id"))
+        context.start_dial_gauge_stream()
 
     def operate(self, context: DeviceContext) -> DeviceEvent:
-        # 게이지 측정 로직
+        now = time.monotonic()
+        if now > self.deadline:
+            Logger.error(f"[device] Thickness measurement timeout. measured: {sorted(self.measured)}")
+            return self._fail()
+
+        # 로봇이 측정 위치에 진입하면 버퍼를 비우고, 모든 게이지 값이 안정되는 즉시 해당 위치의 두께로 확정
+        position = bb.get("robot/thickness/position")
+        if position and position != self.position:
+            self.position = position
+            self.position_start = now
+            context.gauge_array.reset()
+
+        if not self.position and self.position_count <= 0:
+            return self._measure_once(context)
+        if not self.position and now - self.start > self.position_wait:
+            if self.single_read_fallback:
+                return self._measure_once(context)
+            Logger.error(f"[device] No robot thickness position in {self.position_wait} s.")
+            return self._fail()
+
+        if self.position and self.position not in self.measured:
+            values = context.get_dial_gauge_settled_values()
+            if values is not None:
+                self.measured.add(self.position)
+                context.record_thickness_profile(self.position, values)
+                bb.set("device/gauge/thickness/settled_pos", self.position)
+                Logger.info(f"[device] Thickness Pos{self.position} settled: {values} "
+                            f"({(now - self.position_start) * 1000:.0f} ms)")
+            elif now - self.position_start > context.gauge_stream_config.get('settle_timeout', 5.0):
+                Logger.error(f"[device] Thickness Pos{self.position} not settled in time. "
+                             f"stats: {context.gauge_array.statistics(1000)}")
+                return self._fail()
+
+        if len(self.measured) >= self.position_count:
+            Logger.info(f"[device] Thickness Profile: {context.thickness_profile.to_dict()}")
+            return DeviceEvent.THICKNESS_MEASURE_DONE
+        return DeviceEvent.NONE
+
+    def _measure_once(self, context: DeviceContext) -> DeviceEvent:
+        # 로봇 위치 정보 없이 현재 위치에서 모든 게이지를 1회 측정
+        Logger.warn("[device] No robot thickness position. Falling back to single measurement.")
+        values = context.gauge_array.request_all()
+        if any(value is None for value in values.values()):
+            Logger.error(f"[device] Single thickness measurement failed: {values}")
+            return self._fail()
+        context.record_thickness_profile(1, values)
+        Logger.info(f"[device] Thickness Profile: {context.thickness_profile.to_dict()}")
         return DeviceEvent.THICKNESS_MEASURE_DONE
+
+    def _fail(self) -> DeviceEvent:
+        # Robot FSM(RobotEnterThicknessPosStrategy)에 실패를 알림
+        bb.set("device/gauge/thickness/failed", True)
+        return DeviceEvent.GAUGE_MEASURE_FAIL
     
     def exit(self, context: DeviceContext, event: DeviceEvent) -> None:
+        context.stop_dial_gauge_stream()
         Logger.info("[device] exit MeasureThicknessStrategy")
 
 class AlignerOpenStrategy(Strategy):
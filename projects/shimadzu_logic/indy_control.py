@@ -3,6 +3,7 @@ import time
 import datetime
 import re
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pkg.utils.blackboard import GlobalBlackboard
 
 from neuromeka import IndyDCP3
@@ -64,6 +65,114 @@ class GripperControl:
         return current_state, close_failure, open_failure
 
 
+class IntVariableMirror:
+    """
+    Conty Int 변수의 로컬 미러입니다.
+    - fetch(): get_int_variable 1회 호출 결과를 주소 -> 값 dict로 색인 (주소 조회 O(1))
+    - write(): 마지막으로 읽은 값(없으면 마지막으로 쓴 값)과 다른 주소만 모아 set_int_variable 1회로 전송
+    - 초당 RPC 호출 수 집계
+    """
+    def __init__(self, indy):
+        self.indy = indy
+        self.values = {}        # 주소 -> 마지막으로 읽은 값
+        self.written = {}       # 주소 -> 마지막으로 쓴 값 (shadow)
+        self.get_count = 0
+        self.set_count = 0
+        self.entry_count = 0
+        self._stats_time = time.time()
+
+    def fetch(self) -> dict:
+        """Conty Int 변수 전체를 읽어 주소별로 색인합니다."""
+        int_var = self.indy.get_int_variable()['variables']
+        self.get_count += 1
+        self.values = {int(item['addr']): int(item['value']) for item in int_var}
+        return self.values
+
+    def get(self, addr: int, default=None):
+        return self.values.get(addr, default)
+
+    def write(self, values: dict, force: bool = False) -> int:
+        """
+        {주소: 값} 중 바뀐 주소만 한 번에 전송합니다.
+        :param force: True면 비교 없이 모두 전송 (초기화 용도)
+        :return: 전송한 주소 개수
+        """
+        changed = []
+        for addr, value in values.items():
+            value = int(value)
+            if force or self.values.get(addr, self.written.get(addr)) != value:
+                changed.append({'addr': addr, 'value': value})
+        if not changed:
+            return 0
+
+        self.indy.set_int_variable(changed)
+        self.set_count += 1
+        self.entry_count += len(changed)
+        for item in changed:
+            self.written[item['addr']] = item['value']
+            self.values[item['addr']] = item['value']
+        return len(changed)
+
+    def get_rpc_stats(self, reset: bool = True) -> dict:
+        """마지막 집계 이후 초당 get/set 호출 수 및 전송 주소 수"""
+        now = time.time()
+        elapsed = max(now - self._stats_time, 1e-6)
+        stats = {
+            "get_per_sec": round(self.get_count / elapsed, 1),
+            "set_per_sec": round(self.set_count / elapsed, 1),
+            "entries_per_sec": round(self.entry_count / elapsed, 1),
+        }
+        if reset:
+            self.get_count = self.set_count = self.entry_count = 0
+            self._stats_time = now
+        return stats
+
+
+class RobotStateSnapshot:
+    """한 주기에 읽은 로봇 상태 (control/program data, DO/DI)와 취득 시각입니다."""
+    __slots__ = ("control", "program", "do", "di", "acquired_at", "duration")
+
+    def __init__(self, control: dict, program: dict, do: list, di: list, acquired_at: float, duration: float):
+        self.control = control
+        self.program = program
+        self.do = do
+        self.di = di
+        self.acquired_at = acquired_at    # 취득 시작 시각 (time.time)
+        self.duration = duration          # 취득에 걸린 시간 (초)
+
+
+class RobotStateReader:
+    """
+    주기마다 로봇 상태를 한 번씩만 읽어 RobotStateSnapshot으로 묶습니다.
+    parallel=True면 4개의 RPC를 스레드 풀에서 동시에 호출합니다.
+    """
+    def __init__(self, indy, parallel: bool = False, workers: int = 4):
+        self.indy = indy
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="indy_state") if parallel else None
+
+    def fetch(self) -> RobotStateSnapshot:
+        acquired_at = time.time()
+        start = time.perf_counter()
+        if self.executor is None:
+            control = self.indy.get_control_data()
+            program = self.indy.get_program_data()
+            do = self.indy.get_do()['signals']  # type: ignore
+            di = self.indy.get_di()['signals']  # type: ignore
+        else:
+            futures = [self.executor.submit(self.indy.get_control_data),
+                       self.executor.submit(self.indy.get_program_data),
+                       self.executor.submit(self.indy.get_do),
+                       self.executor.submit(self.indy.get_di)]
+            control, program, do, di = [f.result() for f in futures]
+            do, di = do['signals'], di['signals']  # type: ignore
+        return RobotStateSnapshot(control, program, do, di, acquired_at, time.perf_counter() - start)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+
 class RobotCommunication:
     def __init__(self, config_file="projects/shimadzu_logic/configs/indy_command.json", *args, **kwargs):
         ''' Thread related '''
@@ -84,6 +193,11 @@ class RobotCommunication:
             self.indy.set_auto_mode(True)
             time.sleep(0.5)
 
+        # 주기마다 로봇 상태를 한 번만 읽음 (indy_communication)
+        self.state_reader = RobotStateReader(self.indy,
+                                             parallel=self.config.get("state_fetch/parallel", False),
+                                             workers=self.config.get("state_fetch/workers", 4))
+        self.snapshot = None
 
         ''' Home and packaging pose '''
         self.check_home_min = -10
@@ -103,13 +217,20 @@ class RobotCommunication:
         self.int_var_init = 0
         self.int_var_motion_done = 0
 
-        self.indy.set_int_variable([
-            {'addr': int(self.config["int_var/cmd/addr"]), 'value': 0},
-            {'addr': int(self.config["int_var/init/addr"]), 'value': 0},
-            {'addr': int(self.config["int_var/grip_state/addr"]), 'value': 0},
-            {'addr': int(self.config["int_var/recover_done/addr"]), 'value': 0},
-            {'addr': int(self.config["int_var/pull_done/addr"]), 'value': 0},
-        ])
+        # Int 변수 주소는 설정 파일에서 한 번만 변환 ("int_var/cmd/addr" -> intvar_addr["int_var/cmd"])
+        self.intvar_addr = {key[:-len("/addr")]: int(value) for key, value in self.config.items()
+                            if key.endswith("/addr")}
+        self.int_vars = IntVariableMirror(self.indy)
+        self.intvar_stats_interval = 10.0   # RPC 통계 보고 주기 (초)
+        self.intvar_stats_time = time.time()
+
+        self.int_vars.write({
+            self.intvar_addr["int_var/cmd"]: 0,
+            self.intvar_addr["int_var/init"]: 0,
+            self.intvar_addr["int_var/grip_state"]: 0,
+            self.intvar_addr["int_var/recover_done"]: 0,
+            self.intvar_addr["int_var/pull_done"]: 0,
+        }, force=True)
 
         ''' Indy ioboard '''
         self.btn_direct_teaching = 0
@@ -151,10 +272,11 @@ class RobotCommunication:
                     Logger.error("Stop program fail")
 
             self.indy.stop_motion(stop_category=2)
-            self.indy.set_int_variable([{'addr': int(self.config["int_var/cmd/addr"]), 'value': 0}])
+            self.int_vars.write({self.intvar_addr["int_var/cmd"]: 0}, force=True)
 
             if self.thread:
                 self.thread.join()
+            self.state_reader.close()
 
     def run(self):
         """ Thread's target function """
@@ -169,9 +291,6 @@ class RobotCommunication:
     def get_dio_channel(self, di, ch):
         return next((int(item['state']) for item in di if item['address'] == ch), None)
 
-    def get_intvar_address(self, int_var, addr):
-        return next((int(item['value']) for item in int_var if item['addr'] == addr), None)
-
     def get_tposvar_address(self, tpos_var, addr):
         return next((item['tpos'] for item in tpos_var if item['addr'] == addr), None)
 
@@ -409,65 +528,81 @@ class RobotCommunication:
                 - pickup_done (102)                
         '''
 
-        ''' Reset variables '''
+        addr = self.intvar_addr
+
+        ''' Reset variables: 읽기 전에 초기화할 변수는 한 번에 전송 '''
+        resets = {}
         if bb.get("indy_command/reset_init_var"):
             bb.set("indy_command/reset_init_var", False)
-            self.indy.set_int_variable([{'addr': int(self.config["int_var/init/addr"]), 'value': 0}])
-        
+            resets[addr["int_var/init"]] = 0
+
         if bb.get("indy_command/reset_pull_done"):
             bb.set("indy_command/reset_pull_done", False)
-            self.indy.set_int_variable([{'addr': int(self.config["int_var/pull_done/addr"]), 'value': 0}])
-        
+            resets[addr["int_var/pull_done"]] = 0
+
+        if resets:
+            self.int_vars.write(resets, force=True)
 
         ''' Read Variables: Send int variable from Conty to bb '''
-        int_var = self.indy.get_int_variable()['variables']
+        self.int_vars.fetch()
+        get_var = self.int_vars.get
 
-        self.int_var_init = self.get_intvar_address(int_var, int(self.config["int_var/init/addr"]))
+        self.int_var_init = get_var(addr["int_var/init"])
         bb.set("int_var/init/val", self.int_var_init)
-        self.int_var_motion_done = self.get_intvar_address(int_var, int(self.config["int_var/motion_done/addr"]))
+        self.int_var_motion_done = get_var(addr["int_var/motion_done"])
         bb.set("int_var/motion_done/val", self.int_var_motion_done)
 
-        bb.set("recipe/pot1/shift/basket",self.get_intvar_address(int_var, int(self.config[f"int_var/left_pull_done/addr"])))
-        bb.set("recipe/pot2/shift/basket",self.get_intvar_address(int_var, int(self.config[f"int_var/right_pull_done/addr"])))
+        bb.set("recipe/pot1/shift/basket", get_var(addr["int_var/left_pull_done"]))
+        bb.set("recipe/pot2/shift/basket", get_var(addr["int_var/right_pull_done"]))
 
-        bb.set(f"int_var/robot/position/val", self.get_intvar_address(int_var, int(self.config[f"int_var/robot/position/addr"])))
-        # bb.set(f"int_var/pickup_done/val", self.get_intvar_address(int_var, int(self.config[f"int_var/pickup_done/addr"])))
-        # bb.set(f"int_var/putin_done/val", self.get_intvar_address(int_var, int(self.config[f"int_var/putin_done/addr"])))
-        # bb.set(f"int_var/current_pos/val", self.get_intvar_address(int_var, int(self.config[f"int_var/current_pos/addr"])))
-        bb.set(f"int_var/pull_done/val", self.get_intvar_address(int_var, int(self.config[f"int_var/pull_done/addr"])))
+        bb.set(f"int_var/robot/position/val", get_var(addr["int_var/robot/position"]))
+        # bb.set(f"int_var/pickup_done/val", get_var(addr["int_var/pickup_done"]))
+        # bb.set(f"int_var/putin_done/val", get_var(addr["int_var/putin_done"]))
+        bb.set(f"int_var/pull_done/val", get_var(addr["int_var/pull_done"]))
         if bb.get(f"int_var/pull_done/val") == 1 :
             bb.set("process/robot/pull_done",1)
 
-        ''' Write Variables: Set Int variable from bb to Conty '''
-        self.indy.set_int_variable([
-            {'addr': int(self.config["int_var/cmd/addr"]),                  'value': int(bb.get("int_var/cmd/val"))},
-            {'addr': int(self.config["int_var/grip_state/addr"]),           'value': int(bb.get("int_var/grip_state/val"))},
-            {'addr': int(self.config["indy_command/place/go_home/addr"]),   'value': bb.get("indy_command/place/go_home")},
-            {'addr': int(self.config["int_var/recover_done/addr"]),         'value': bb.get("int_var/recover_done/val")},
-            {'addr': int(self.config["left_basket_stack_num/addr"]),        'value': bb.get("process/pot1/basket_stack_num")},
-            {'addr': int(self.config["right_basket_stack_num/addr"]),       'value': bb.get("process/pot2/basket_stack_num")},
-            {'addr': int(self.config["recover_pose/addr"]),                 'value': bb.get("process/recover_pose")}
-        ])
+        ''' Write Variables: Set Int variable from bb to Conty (바뀐 주소만 1회 전송) '''
+        writes = {
+            addr["int_var/cmd"]:                int(bb.get("int_var/cmd/val")),
+            addr["int_var/grip_state"]:         int(bb.get("int_var/grip_state/val")),
+            addr["indy_command/place/go_home"]: bb.get("indy_command/place/go_home"),
+            addr["int_var/recover_done"]:       bb.get("int_var/recover_done/val"),
+            addr["left_basket_stack_num"]:      bb.get("process/pot1/basket_stack_num"),
+            addr["right_basket_stack_num"]:     bb.get("process/pot2/basket_stack_num"),
+            addr["recover_pose"]:               bb.get("process/recover_pose")
+        }
 
         if bb.get("recipe/pot1/shift/basket/init") :
             Logger.info("Reset pot1 basket stack num to 0")
             bb.set("recipe/pot1/shift/basket/init", False)
-            self.indy.set_int_variable([
-                {'addr': int(self.config["left_basket_stack_num/addr"]), 'value': 0}
-            ])
+            writes[addr["left_basket_stack_num"]] = 0
 
         if bb.get("recipe/pot2/shift/basket/init") :  
             Logger.info("Reset pot2 basket stack num to 0")
             bb.set("recipe/pot2/shift/basket/init", False)
-            self.indy.set_int_variable([
-                {'addr': int(self.config["right_basket_stack_num/addr"]), 'value': 0}
-            ])
+            writes[addr["right_basket_stack_num"]] = 0
+
+        self.int_vars.write(writes)
+
+        ''' RPC 통계 보고 '''
+        now = time.time()
+        if now - self.intvar_stats_time >= self.intvar_stats_interval:
+            self.intvar_stats_time = now
+            stats = self.int_vars.get_rpc_stats()
+            bb.set("robot/int_var/rpc_stats", stats)
+            Logger.info(f"[Robot] Int variable RPC/s get: {stats['get_per_sec']}, set: {stats['set_per_sec']}, "
+                        f"entries: {stats['entries_per_sec']}")
 
 
     def indy_communication(self):
-        ''' Get Indy status '''
-        control_data = self.indy.get_control_data()
-        program_data = self.indy.get_program_data()
+        ''' Get Indy status: control/program data, DO/DI를 한 번에 읽은 스냅샷 '''
+        snapshot = self.state_reader.fetch()
+        self.snapshot = snapshot
+        bb.set("robot/state/acquired_at", snapshot.acquired_at)
+
+        control_data = snapshot.control
+        program_data = snapshot.program
         # Logger.info(f"Nuri data :\n{control_data}\n{program_data}")
         self.robot_current_pos = control_data['p'][0:3]
         self.robot_state = control_data["op_state"]
@@ -477,15 +612,14 @@ class RobotCommunication:
         self.program_state = program_data["program_state"]
         self.program_name = program_data["program_name"]
 
-        q = self.indy.get_control_data()["q"]
+        q = control_data["q"]
         self.is_home_pos = all(self.check_home_min <= a - b <= self.check_home_max for a, b in zip(q, self.home_pos))
         self.is_packaging_pos = all(
             self.check_home_min <= a - b <= self.check_home_max for a, b in zip(q, self.packaging_pos))
 
         ''' Get Indy ioboard data '''
-        do = self.indy.get_do()['signals']  # type: ignore
-        di = self.indy.get_di()['signals']  # type: ignore
-
+        do = snapshot.do
+        di = snapshot.di
 
         ''' Gripper state '''
         read_signal = do
@@ -4,8 +4,21 @@ import time
 import os
 import random 
 import threading 
+import queue
+from collections import OrderedDict
 from uuid import uuid4
 from pkg.fsm.base import *
+from pkg.utils.logging import LogLevel
+from pkg.utils.file_io import get_proj_path
+
+try:
+    from .mqtt_status import StatusPublisher
+    from .mqtt_spool import MqttSpool, PRIORITY_HIGH, PRIORITY_STATUS
+    from .binpick_state import BinpickStateTracker
+except ImportError:
+    from mqtt_status import StatusPublisher
+    from mqtt_spool import MqttSpool, PRIORITY_HIGH, PRIORITY_STATUS
+    from binpick_state import BinpickStateTracker
 
 # ==============================================================================
 # [Blackboard] 외부 상태 공유를 위한 글로벌 객체 정의 (최상단)
@@ -73,6 +86,7 @@ BB_STATUS_GRIPPER_RELEASE = "gripper/is_release" # 0=base, 1=released (파일명
 BB_STATUS_ROBOT_HOME_POS = "robot/is_home_pos"
 BB_STATUS_MANUAL_COMPLETE_DONE = "process/manual_recover/is_done"
 BB_STATUS_BINPICK_DONE = "binpick/command/is_done" # Bin Picking 완료 플래그
+BB_STATUS_TENSILE_DONE = "process/auto/tensile/is_done" # 완료한 인장기 명령 값 (ACTION_MAP_TENSIL, 0=base)
 
 # DIO 배열을 Blackboard에 통째로 전송하는 키
 BB_STATUS_DI_ENTIRE = "device/remote/input/entire"
@@ -85,6 +99,153 @@ BB_KEY_GAUGE_STATE = "sys/gauge/comm/state"
 BB_KEY_REMOTEIO_STATE = "sys/remoteio/comm/state"
 EVENT_ID_SYSTEM_STATUS = "logic-evt-state-001"
 
+# UI 명령 종류 (payload.cmd)
+CMD_TENSILE = "tensile_control"
+CMD_SYSTEM = "system_control"
+CMD_BINPICK = "binpick_control"
+
+# system_control 완료 조건: action -> (BB 상태 키, 기대 값(None이면 truthy), 확인 후 초기화 값(None이면 유지))
+SYSTEM_DONE_CONDITIONS = {
+    "do_control": (BB_STATUS_DO_DONE, None, False),
+    "robot_recover": (BB_STATUS_ROBOT_RECOVER_DONE, None, False),
+    "process_auto_recover": (BB_STATUS_PROC_RECOVER_DONE, None, False),
+    "robot_direct_teaching_on": (BB_STATUS_DT_MODE, 1, None),
+    "robot_direct_teaching_off": (BB_STATUS_DT_MODE, 0, None),
+    "gripper_hold": (BB_STATUS_GRIPPER_HOLDING, 1, None),
+    "gripper_release": (BB_STATUS_GRIPPER_RELEASE, 1, False),
+    "go_home": (BB_STATUS_ROBOT_HOME_POS, None, False),
+    "manual_recover_complete": (BB_STATUS_MANUAL_COMPLETE_DONE, None, False),
+}
+
+def _binpick_route_key(payload: dict):
+    """Bin Picking 이벤트 라우팅 키 (ACK: "ack", 이벤트: evt, evt 없이 kind가 error인 에러 메시지: "error")"""
+    kind = payload.get("kind")
+    if kind == "ack":
+        return "ack"
+    return payload.get("evt") or ("error" if kind == "error" else None)
+
+# 라우팅 키 선택: 토픽 -> payload에서 라우팅 키를 꺼내는 함수
+ROUTE_SELECTORS = {
+    TOPIC_UI_CMD: lambda payload: payload.get("cmd"),
+    TOPIC_BINPICK_EVT: _binpick_route_key,
+}
+ROUTE_DEFAULT = "*"     # 등록되지 않은 라우팅 키를 처리하는 기본 경로
+
+
+def _debug_enabled() -> bool:
+    """메시지 단위 로그는 DEBUG 레벨에서만, 이 검사 후에 문자열을 만듭니다."""
+    return Logger.get_log_level().value >= LogLevel.DEBUG.value
+
+# 완료 신호 대기 설정 (초). 시간 내 완료 신호가 없으면 인장기 명령은 실패 ACK, 그 외는 시뮬레이션 결과로 ACK
+COMMAND_POLL_INTERVAL = 0.005
+TENSILE_DONE_TIMEOUT = 10.0
+BINPICK_DONE_TIMEOUT = 0.1
+SYSTEM_DONE_TIMEOUT = 0.1
+
+
+class MqttCommand:
+    """
+    UI로부터 수신한 명령 1건입니다. MQTT 콜백에서 생성되어 명령 큐를 통해 디스패처로 전달됩니다.
+    complete()로 완료를 알리면 디스패처가 다음 폴링에서 ACK를 발행합니다.
+    """
+    __slots__ = ("cmd", "action", "msg_id", "payload", "received_at", "done", "result",
+                 "key", "ack_id", "condition", "deadline")
+
+    def __init__(self, cmd: str, action: str, msg_id, payload: dict):
+        self.cmd = cmd
+        self.action = action
+        self.msg_id = msg_id
+        self.payload = payload
+        self.received_at = time.monotonic()
+        self.done = threading.Event()
+        self.result = None      # (success, reason, data)
+        # 디스패처가 할당 시 설정: BB 명령 키, ACK ID, BB 완료 조건, 완료 대기 기한
+        self.key = None
+        self.ack_id = None
+        self.condition = None
+        self.deadline = 0.0
+
+    def complete(self, success: bool, reason=None, data=None):
+        self.result = (success, reason, data)
+        self.done.set()
+
+
+class Route:
+    """(토픽, 라우팅 키)에 연결된 처리 함수와 payload 검증 조건입니다."""
+    __slots__ = ("handler", "actions", "required")
+
+    def __init__(self, handler, actions=None, required=()):
+        """
+        :param handler: handler(msg_id, key, payload)
+        :param actions: 허용되는 payload.action 집합 (None이면 검사하지 않음)
+        :param required: payload에 반드시 있어야 하는 필드 이름
+        """
+        self.handler = handler
+        self.actions = frozenset(actions) if actions is not None else None
+        self.required = tuple(required)
+
+
+class AckCache:
+    """
+    최근 처리한 명령의 msg_id와 발행한 ACK 메시지를 보관하는 LRU/TTL 캐시입니다.
+    QoS 재전송이나 UI 중복 전송으로 같은 msg_id가 다시 들어오면 명령을 재실행하지 않고 캐시된 ACK를 재발행합니다.
+    """
+    NEW = 0         # 처음 수신한 msg_id
+    PENDING = 1     # 큐 대기 또는 처리 중인 msg_id
+    DONE = 2        # 처리 완료되어 ACK가 캐시된 msg_id
+
+    def __init__(self, capacity: int = 256, ttl: float = 300.0):
+        """
+        :param capacity: 보관할 최대 msg_id 개수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+        :param ttl: 항목 유지 시간 (초)
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries = OrderedDict()   # msg_id -> (만료 시각, ack_json)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self.duplicate_count = 0        # 처리 완료 후 재수신 (ACK 재발행)
+        self.in_flight_duplicate_count = 0  # 처리 중 재수신 (무시)
+
+    def reserve(self, msg_id):
+        """
+        msg_id 수신을 기록합니다.
+        :return: (NEW | PENDING | DONE, DONE인 경우 캐시된 ACK JSON)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(msg_id)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(msg_id)
+                    self.duplicate_count += 1
+                    return self.DONE, entry[1]
+                del self._entries[msg_id]
+            if msg_id in self._pending:
+                self.in_flight_duplicate_count += 1
+                return self.PENDING, None
+            self._pending.add(msg_id)
+            return self.NEW, None
+
+    def store(self, msg_id, ack_json: str):
+        """처리 완료된 msg_id의 ACK를 저장합니다."""
+        with self._lock:
+            self._pending.discard(msg_id)
+            self._entries[msg_id] = (time.monotonic() + self.ttl, ack_json)
+            self._entries.move_to_end(msg_id)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def release(self, msg_id):
+        """ACK 없이 처리가 끝난 msg_id의 예약을 해제합니다. (재전송 시 다시 실행 가능)"""
+        with self._lock:
+            self._pending.discard(msg_id)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {"cached": len(self._entries), "pending": len(self._pending),
+                    "duplicates": self.duplicate_count, "in_flight_duplicates": self.in_flight_duplicate_count}
+
 
 # ==============================================================================
 # 2. MQTT 프로토콜 통신 클래스 (NRMK Logic 역할)
@@ -93,16 +254,21 @@ EVENT_ID_SYSTEM_STATUS = "logic-evt-state-001"
 class MqttComm:
     """
     인장기 및 Bin Picking 프로토콜을 처리하는 NRMK Logic 통신 클래스입니다.
-    UI로부터 명령을 수신(SUB)하고, 명령 수행을 위해 내부 변수에 상태를 할당합니다.
-    ACK 발행은 이 클래스를 사용하는 외부 메인 Logic이 담당합니다.
+    UI로부터 명령을 수신(SUB)하여 명령 큐에 넣고, 디스패처 스레드가 순서대로 상태를 할당합니다.
+    외부 Logic이 complete_command() 또는 BB 완료 플래그로 완료를 알리면 즉시 ACK를 발행합니다.
     """
-    def __init__(self, host="127.0.0.1", port=1883):
+    def __init__(self, host="127.0.0.1", port=1883, client_factory=None):
+        """
+        :param client_factory: MQTT 클라이언트 생성 함수 (None이면 paho mqtt.Client). 부하 테스트용 대체 브로커 연결 시 사용
+        """
         self.host = host
         self.port = port
-        self.client = mqtt.Client()
+        self.client = client_factory() if client_factory else mqtt.Client()
         self.client.on_connect = self._on_connect
         self.client.on_message = self._on_message
         self.client.on_publish = self._on_publish
+        self.client.on_disconnect = self._on_disconnect
+        self.connected = False
         self.current_batch_id = "B-TEST-20251208"
         
         self.logic_thread = None
@@ -125,6 +291,18 @@ class MqttComm:
         self.last_command_id = None           # 마지막으로 수신된 명령의 Msg ID
         self.last_command_ack_id = None       # 해당 명령에 대한 ACK ID (성공 기준)
         self.last_command_payload = {}        # 명령 수행에 필요한 Payload (batch_id, do_values 등)
+
+        # UI 명령 큐 (MQTT 콜백 -> 디스패처)와 완료 대기 중인 명령 {BB 명령 키: MqttCommand}
+        self.command_queue = queue.Queue()
+        self.pending_commands = {}
+        self._pending_lock = threading.Lock()
+        # 명령별 수신 -> ACK 발행 지연 통계 {"cmd/action": {...}}
+        self.command_metrics = {}
+        self._metrics_lock = threading.Lock()
+        # 중복 명령 억제용 msg_id/ACK 캐시 (_load_config 이후 설정 반영)
+        self.ack_cache = None
+        # Bin Picking 시스템 상태 (status/detection/error 이벤트 -> Blackboard 변경분 반영)
+        self.binpick_state = BinpickStateTracker(bb)
         
         # DIO 상태 초기화 (외부에서 업데이트되어야 함)
         self.current_di_values = [0] * DI_SIZE
@@ -132,6 +310,30 @@ class MqttComm:
 
         # 설정 파일에서 ACK ID 로드
         self._load_config()
+        # ACK ID/Reason 등 액션별 정보와 메시지 라우팅 테이블은 한 번만 구성
+        self._build_action_tables()
+        self.routes = {}
+        self._register_default_routes()
+
+        # 변경 감지 + 발행 주기 제한 상태 발행기
+        self.status_publisher = StatusPublisher(
+            lambda topic, payload, key: self._publish(topic, payload, PRIORITY_STATUS, key), TOPIC_LOGIC_EVT,
+            self.EVENT_ID_DIO_STATUS, self.EVENT_ID_SYSTEM_STATUS,
+            min_interval=self.status_config.get("min_interval", 0.05),
+            keepalive_interval=self.status_config.get("keepalive_interval", 2.0),
+            compact_dio=self.status_config.get("compact_dio", False))
+        # 브로커 연결 끊김 동안의 발행 메시지 스풀과 즉시 재발행 요청
+        self.spool = None
+        self._spool_replay_requested = threading.Event()
+        if self.spool_config.get("enabled", True):
+            # 상대 경로는 LOG/와 같은 프로젝트 런타임 디렉토리 기준 (소스 트리에 생성하지 않음)
+            spool_dir = self.spool_config.get("directory", "local/mqtt_spool")
+            if not os.path.isabs(spool_dir):
+                spool_dir = os.path.join(get_proj_path(), spool_dir)
+            self.spool = MqttSpool(spool_dir, segment_bytes=self.spool_config.get("segment_bytes", 1048576),
+                                   max_bytes=self.spool_config.get("max_bytes", 16777216))
+        self.ack_cache = AckCache(capacity=self.duplicate_cache_config.get("capacity", 256),
+                                  ttl=self.duplicate_cache_config.get("ttl", 300.0))
         
         Logger.info(f"MQTT client initialized: {self.host}:{self.port}")
 
@@ -151,9 +353,18 @@ class MqttComm:
             "BINPICK_GENERAL": "logic-ack-001" 
         }
         default_event_ids = {"DIO_STATUS": "logic-evt-dio-001", "SYSTEM_STATUS": "logic-evt-state-001"}
+        default_status_config = {"min_interval": 0.05, "keepalive_interval": 2.0, "sample_interval": 0.02,
+                                 "compact_dio": False, "simulate_dio": True}
+        
+        default_duplicate_cache_config = {"capacity": 256, "ttl": 300.0}
+        default_spool_config = {"enabled": True, "directory": "local/mqtt_spool", "segment_bytes": 1048576,
+                                "max_bytes": 16777216, "retry_interval": 1.0}
         
         ack_ids = default_ack_ids
         event_ids = default_event_ids
+        status_config = default_status_config
+        duplicate_cache_config = default_duplicate_cache_config
+        spool_config = default_spool_config
 
         if not os.path.exists(config_path):
             Logger.info(f"!!! [CRITICAL] Config file not found: {config_path} !!! (Using default values)")
@@ -164,6 +375,9 @@ class MqttComm:
                     # 파일에서 로드에 성공하면, 기본값을 덮어씁니다.
                     ack_ids = config.get("ACK_IDS", default_ack_ids)
                     event_ids = config.get("EVENT_IDS", default_event_ids)
+                    status_config = {**default_status_config, **config.get("STATUS_PUBLISH", {})}
+                    duplicate_cache_config = {**default_duplicate_cache_config, **config.get("DUPLICATE_CACHE", {})}
+                    spool_config = {**default_spool_config, **config.get("SPOOL", {})}
                 Logger.info(f"→ [INFO] Config file loaded successfully: {config_path}")
             except Exception as e:
                 Logger.info(f"!!! [CRITICAL] 설정 파일 로드 중 오류 발생 ({e}) !!! (기본값 사용)")
@@ -195,6 +409,13 @@ class MqttComm:
         self.EVENT_ID_DIO_STATUS = event_ids.get("DIO_STATUS")
         self.EVENT_ID_SYSTEM_STATUS = event_ids.get("SYSTEM_STATUS")
 
+        # 상태 발행 설정
+        self.status_config = status_config
+        # 중복 명령 캐시 설정
+        self.duplicate_cache_config = duplicate_cache_config
+        # 오프라인 발행 스풀 설정
+        self.spool_config = spool_config
+
 
     def _on_connect(self, client, userdata, flags, rc):
         """브로커 연결 시 호출되는 콜백 함수"""
@@ -208,75 +429,116 @@ class MqttComm:
             # 2. Bin Picking 이벤트 구독 (BINPICK 시스템으로부터의 이벤트)
             self.client.subscribe(TOPIC_BINPICK_EVT)
             Logger.info(f"→ [SUB] 토픽 구독 완료: {TOPIC_BINPICK_EVT}")
+
+            # 3. 연결 끊김 동안 스풀에 보관된 메시지 재발행 (ACK 등 -> 최신 상태 순)
+            self.connected = True
+            self._replay_spool()
             
-            # Logic 처리 루프와 상태 발행 루프를 별도의 스레드로 시작
-            self.logic_thread = threading.Thread(target=self._logic_processing_loop, daemon=True)
-            self.logic_thread.start()
+            # 명령 디스패처와 상태 발행 루프를 별도의 스레드로 시작 (재연결 시 중복 시작 방지)
+            if not (self.logic_thread and self.logic_thread.is_alive()):
+                self.logic_thread = threading.Thread(target=self._command_dispatch_loop, daemon=True)
+                self.logic_thread.start()
             
-            self.status_thread = threading.Thread(target=self._status_publishing_loop, daemon=True)
-            self.status_thread.start()
+            if not (self.status_thread and self.status_thread.is_alive()):
+                self.status_thread = threading.Thread(target=self._status_publishing_loop, daemon=True)
+                self.status_thread.start()
             
         else:
             Logger.info(f"→ [ERROR] 브로커 연결 실패: 반환 코드 {rc}")
 
+    def _on_disconnect(self, client, userdata, rc):
+        """브로커 연결 해제 시 호출되는 콜백 함수. 이후 발행 메시지는 스풀에 보관됩니다."""
+        self.connected = False
+        if rc != 0:
+            Logger.info(f"→ [WARN] 브로커 연결 끊김 (rc={rc}). 재연결 시까지 발행 메시지를 스풀에 보관합니다.")
+
+    def register_route(self, topic: str, key: str, handler, actions=None, required=()):
+        """
+        (토픽, 라우팅 키)에 처리 함수를 등록합니다. 라우팅 키는 ROUTE_SELECTORS로 payload에서 선택됩니다.
+        key에 ROUTE_DEFAULT를 주면 해당 토픽의 미등록 키를 처리합니다.
+        """
+        self.routes[(topic, key)] = Route(handler, actions, required)
+
+    def _register_default_routes(self):
+        # UI Command (tensile_control, system_control, binpick_control)
+        self.register_route(TOPIC_UI_CMD, CMD_TENSILE, self._route_ui_command, actions=ACTION_MAP_TENSIL)
+        self.register_route(TOPIC_UI_CMD, CMD_SYSTEM, self._route_ui_command, actions=self.system_actions)
+        self.register_route(TOPIC_UI_CMD, CMD_BINPICK, self._route_ui_command, actions=ACTION_MAP_BINPICK)
+        self.register_route(TOPIC_UI_CMD, ROUTE_DEFAULT, self._route_unknown_command)
+        # Bin Picking Event (ACK, status, detection, error)
+        self.register_route(TOPIC_BINPICK_EVT, "ack", self._route_binpick_ack, required=("ack_of", "status"))
+        self.register_route(TOPIC_BINPICK_EVT, "status", self._route_binpick_state)
+        self.register_route(TOPIC_BINPICK_EVT, "detection", self._route_binpick_state)
+        self.register_route(TOPIC_BINPICK_EVT, "error", self._route_binpick_state)
+        self.register_route(TOPIC_BINPICK_EVT, ROUTE_DEFAULT, self._route_binpick_other)
+
     def _on_message(self, client, userdata, msg):
-        """구독한 토픽에서 메시지가 도착했을 때 호출되는 함수"""
+        """구독한 토픽에서 메시지가 도착했을 때 호출되는 함수. 라우팅 테이블에 따라 처리 함수를 호출합니다."""
+        topic = msg.topic
         try:
-            topic = msg.topic
-            payload = json.loads(msg.payload.decode('utf-8'))
-            header = payload.get("header", {})
-            command = payload.get("payload", {})
-            
+            message = json.loads(msg.payload)
+        except ValueError:
+            Logger.warn(f"→ [ERROR] JSON decoding error on {topic}: {msg.payload[:200]!r}")
+            return
+
+        try:
+            # 공통 스키마 검증 (1회): header/payload는 dict
+            header = message.get("header") if isinstance(message, dict) else None
+            payload = message.get("payload") if isinstance(message, dict) else None
+            if not isinstance(header, dict) or not isinstance(payload, dict):
+                Logger.warn(f"  [WARN] Invalid message schema on {topic}: header/payload missing")
+                return
+
+            selector = ROUTE_SELECTORS.get(topic)
+            if selector is None:
+                Logger.warn(f"  [WARN] Message received on unexpected topic: {topic}")
+                return
+            key = selector(payload)
+            route = self.routes.get((topic, key)) or self.routes.get((topic, ROUTE_DEFAULT))
+
             msg_id = header.get("msg_id")
-            
-            Logger.info(f"\n--- [RCV] {topic} / ID: {msg_id} ---")
-
-            if topic == TOPIC_UI_CMD:
-                # UI Command 처리 (tensile_control, system_control, binpick_control)
-                cmd = command.get("cmd")
-                action = command.get("action")
-                
-                Logger.info(f"  CMD: {cmd} / ACTION: {action}")
-
-                if cmd == "tensile_control":
-                    self._handle_tensile_control(msg_id, action, command)
-                elif cmd == "system_control":
-                    self._handle_manual_control(msg_id, action, command)
-                elif cmd == "binpick_control":
-                    self._handle_binpick_control(msg_id, action, command)
-                else:
-                    Logger.info(f"  [WARN] Unknown command received on {TOPIC_UI_CMD}: {cmd}")
-
-            elif topic == TOPIC_BINPICK_EVT:
-                # Bin Picking Event 처리 (ACK, status, detection, error)
-                kind = command.get("kind")
-                evt = command.get("evt")
-                
-                Logger.info(f"  Source: BINPICK / Kind: {kind} / Event: {evt}")
-                
-                # --- BinPicking System에서 온 이벤트 처리 ---
-                if kind == "ack":
-                    status = command.get("status")
-                    ack_of = command.get("ack_of")
-                    Logger.info(f"  BINPICK ACK RCV: Status={status}, AckOf={ack_of}. (Logic Command Success)")
-                    # NOTE: 실제 Logic에서는 여기서 logic-cmd-001과 같은 명령의 완료를 확인하고 FSM 상태를 업데이트함.
-                elif evt == "status":
-                    phase = command.get("phase")
-                    high_state = command.get("high_state")
-                    Logger.info(f"  BINPICK Status RCV: Phase={phase}, HighState={high_state}. (Logic FSM update)")
-                    # TODO: Blackboard에 BinPick 상태 업데이트 로직 추가
-                else:
-                    Logger.info(f"  Received BINPICK Event/Error: {evt or kind}")
+            if _debug_enabled():
+                Logger.debug(f"--- [RCV] {topic} / ID: {msg_id} / {key} / {payload.get('action')} ---")
 
-            else:
-                 Logger.info(f"  [WARN] Message received on unexpected topic: {topic}")
+            if route is None:
+                return
+            if route.actions is not None and payload.get("action") not in route.actions:
+                Logger.warn(f"  [WARN] Unknown {key} action: {payload.get('action')}")
+                return
+            for field in route.required:
+                if field not in payload:
+                    Logger.warn(f"  [WARN] {topic} / {key}: required field '{field}' missing")
+                    return
 
+            route.handler(msg_id, key, payload)
 
-        except json.JSONDecodeError:
-            Logger.info(f"→ [ERROR] JSON decoding error: {msg.payload.decode('utf-8')}")
         except Exception as e:
             Logger.info(f"→ [ERROR] Error processing message: {e}")
 
+    def _route_ui_command(self, msg_id, cmd, payload):
+        # 명령은 큐에 넣고 디스패처 스레드에서 순서대로 처리 (콜백에서는 블로킹 작업 없음)
+        self._enqueue_command(MqttCommand(cmd, payload["action"], msg_id, payload))
+
+    def _route_unknown_command(self, msg_id, cmd, payload):
+        Logger.warn(f"  [WARN] Unknown command received on {TOPIC_UI_CMD}: {cmd}")
+
+    def _route_binpick_ack(self, msg_id, key, payload):
+        # NOTE: 실제 Logic에서는 여기서 logic-cmd-001과 같은 명령의 완료를 확인하고 FSM 상태를 업데이트함.
+        if _debug_enabled():
+            Logger.debug(f"  BINPICK ACK RCV: Status={payload['status']}, AckOf={payload['ack_of']}. (Logic Command Success)")
+
+    def _route_binpick_state(self, msg_id, evt, payload):
+        # status/detection/error 이벤트를 상태 객체에 반영하고 변경된 값만 Blackboard에 갱신
+        changes = self.binpick_state.update(evt, payload)
+        if evt == "error":
+            Logger.warn(f"  BINPICK Error RCV: {payload}")
+        elif changes and _debug_enabled():
+            Logger.debug(f"  BINPICK {evt} RCV: {changes}")
+
+    def _route_binpick_other(self, msg_id, key, payload):
+        if _debug_enabled():
+            Logger.debug(f"  Received BINPICK Event/Error: {key or payload.get('kind')}")
+
     def _on_publish(self, client, userdata, mid):
         """메시지 발행(PUB) 후 호출되는 함수"""
         pass
@@ -305,79 +567,85 @@ class MqttComm:
         }
         return json.dumps(ack_msg, indent=2)
 
+    def _publish_now(self, topic, payload) -> bool:
+        """브로커로 즉시 발행합니다. 연결되어 있지 않거나 발행 요청이 거부되면 False"""
+        if not self.connected:
+            return False
+        info = self.client.publish(topic, payload)
+        return getattr(info, "rc", mqtt.MQTT_ERR_SUCCESS) == mqtt.MQTT_ERR_SUCCESS
+
+    def _publish(self, topic, payload, priority=PRIORITY_HIGH, key=None) -> bool:
+        """
+        메시지를 발행합니다. 브로커에 연결되어 있지 않거나 스풀에 재발행 대기 메시지가 있으면
+        순서 유지를 위해 스풀에 보관하고, 재연결 시 재발행합니다.
+        :return: 즉시 발행되었으면 True, 스풀에 보관되었으면 False
+        """
+        if self.spool is None:
+            self.client.publish(topic, payload)
+            return True
+        # 발행은 스풀 lock 밖에서 수행 (발행이 지연되어도 다른 스레드의 스풀 보관/재발행을 막지 않음)
+        if self.spool.pending_count() == 0 and self._publish_now(topic, payload):
+            return True
+        self.spool.put(topic, payload, priority, key)
+        if self.connected:
+            # 연결 중이면 재시도 주기를 기다리지 않고 상태 발행 루프에서 즉시 재발행
+            self._spool_replay_requested.set()
+            self.status_publisher.wakeup.set()
+        return False
+
+    def _replay_spool(self):
+        """
+        스풀에 보관된 메시지를 재발행합니다. 재연결 시와, 재발행이 중간에 멈춘 경우 상태 발행 루프에서 재시도합니다.
+        중복 명령 캐시 TTL보다 오래된 메시지(이전 프로세스의 ACK 등)는 재발행하지 않고 버립니다.
+        """
+        if self.spool is None or not self.connected or self.spool.pending_count() == 0:
+            return
+        count = self.spool.replay(self._publish_now, max_age=self.ack_cache.ttl)
+        if count:
+            Logger.info(f"  [SPOOL] Replayed {count} message(s). Remaining: {self.spool.pending_count()}")
+
     def publish_ack(self, ack_json):
         """ACK 메시지를 /logic/evt 토픽으로 발행합니다."""
-        self.client.publish(TOPIC_LOGIC_EVT, ack_json)
-        Logger.info(f"  [PUB] ACK sent successfully: {TOPIC_LOGIC_EVT}")
+        if self._publish(TOPIC_LOGIC_EVT, ack_json):
+            if _debug_enabled():
+                Logger.debug(f"  [PUB] ACK sent successfully: {TOPIC_LOGIC_EVT}")
+        else:
+            Logger.info(f"  [SPOOL] Broker unavailable. ACK spooled: {TOPIC_LOGIC_EVT}")
         
     def publish_dio_status(self, di_values: list, do_values: list):
         """
         외부 Logic에서 현재 DIO 상태 값(DI 48개, DO 32개)을 받아 UI로 발행합니다.
+        값이 바뀐 경우에만 발행 대상이 되며, 실제 발행은 상태 발행기의 최소 발행 간격을 따릅니다.
         """
         if len(di_values) != DI_SIZE or len(do_values) != DO_SIZE:
             Logger.info(f"!!! [ERROR] DIO array size mismatch (DI:{len(di_values)}/{DI_SIZE}, DO:{len(do_values)}/{DO_SIZE}) !!!")
             return
 
-        event_msg = {
-            "header": {
-                "msg_type": "logic.event",
-                "source": "logic",
-                "target": "ui",
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "msg_id": self.EVENT_ID_DIO_STATUS,
-                "ack_required": False
-            },
-            "payload": {
-                "kind": "event",
-                "evt": "system_dio_status",
-                "di_values": di_values,
-                "do_values": do_values
-            }
-        }
-        
         try:
-            self.client.publish(TOPIC_LOGIC_EVT, json.dumps(event_msg))
-            # [Blackboard 동기화] DIO 상태를 Blackboard에 전송
-            bb.set(BB_STATUS_DI_ENTIRE, di_values)
-            bb.set(BB_STATUS_DO_ENTIRE, do_values)
+            if self.status_publisher.update_dio(di_values, do_values):
+                # [Blackboard 동기화] DIO 상태를 Blackboard에 전송
+                bb.set(BB_STATUS_DI_ENTIRE, list(di_values))
+                bb.set(BB_STATUS_DO_ENTIRE, list(do_values))
+            self.status_publisher.poll()
         except Exception as e:
             Logger.info(f"  [ERROR] DIO status publish failed: {e}")
 
+    def _read_system_states(self) -> list:
+        """로봇 및 연결된 장치의 시스템 상태를 Blackboard에서 가져옵니다."""
+        return [
+            bb.get(BB_KEY_ROBOT_STATE),
+            bb.get(BB_KEY_EXT_PLC_STATE),
+            bb.get(BB_KEY_GAUGE_STATE),
+            bb.get(BB_KEY_REMOTEIO_STATE)
+        ]
+
     def publish_system_status(self):
         """
         로봇 및 연결된 장치의 시스템 상태를 Blackboard에서 가져와 UI로 발행합니다.
+        값이 바뀐 경우에만 발행 대상이 되며, 변경이 없으면 keep-alive 주기로 재발행됩니다.
         """
-        # Blackboard에서 상태 값 가져오기 (새로운 키 사용)
-        robot_state = bb.get(BB_KEY_ROBOT_STATE)
-        ext_state = bb.get(BB_KEY_EXT_PLC_STATE)
-        gauge_state = bb.get(BB_KEY_GAUGE_STATE)
-        remoteio_state = bb.get(BB_KEY_REMOTEIO_STATE)
-        
-        # system_states 배열 구성 (5개 항목 예시를 따름)
-        system_states_array = [
-            robot_state, 
-            ext_state, 
-            gauge_state,
-            remoteio_state
-        ]
-
-        event_msg = {
-            "header": {
-                "msg_type": "logic.event",
-                "source": "logic",
-                "target": "ui",
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "msg_id": self.EVENT_ID_SYSTEM_STATUS,
-                "ack_required": False
-            },
-            "payload": {
-                "kind": "event",
-                "evt": "system_status",
-                "system_states": system_states_array # 필드명 변경 및 배열 할당
-            }
-        }
-        self.client.publish(TOPIC_LOGIC_EVT, json.dumps(event_msg))
-        # Logger.info("[PUB] System status published.")
+        self.status_publisher.update_system(self._read_system_states())
+        self.status_publisher.poll()
 
     
     # [추가] LOGIC -> BINPICK 명령 ID 생성
@@ -412,408 +680,455 @@ class MqttComm:
             }
         }
         
-        self.client.publish(TOPIC_BINPICK_CMD, json.dumps(cmd_msg))
-        Logger.info(f"  [PUB] Logic -> BINPICK Command sent to {TOPIC_BINPICK_CMD}. ID: {msg_id}")
+        self._publish(TOPIC_BINPICK_CMD, json.dumps(cmd_msg))
+        if _debug_enabled():
+            Logger.debug(f"  [PUB] Logic -> BINPICK Command sent to {TOPIC_BINPICK_CMD}. ID: {msg_id}")
         return msg_id
 
 
     # ==========================================================================
-    # 3. CMD 핸들러: 인장기 자동 제어 (tensile_control)
+    # 3. 액션 정보 테이블 (생성 시 1회 구성)
+    # ==========================================================================
+
+    def _build_action_tables(self):
+        """_load_config 이후 ACK ID를 반영하여 액션별 정보 테이블을 구성합니다."""
+        # tensile_control: action -> 성공 ACK ID
+        self.tensile_ack_ids = {
+            "start": self.ACK_ID_TENSIL_START_OK, "stop": self.ACK_ID_TENSIL_STOP,
+            "step_stop": self.ACK_ID_TENSIL_STEP_STOP, "pause": self.ACK_ID_TENSIL_PAUSE,
+            "resume": self.ACK_ID_TENSIL_RESUME, "reset": self.ACK_ID_TENSIL_RESET,
+            "go_home": self.ACK_ID_TENSIL_GOHOME
+        }
+        # system_control: action -> (상태 값, 상태 변수 이름, BB Key, ACK ID, 성공 Reason, 실패 Reason)
+        self.system_actions = {
+            "do_control": (1, "do_control_state", BB_KEY_DO_CONTROL, self.ACK_ID_MANUAL_CONTROL,
+                           "Digital output control executed successfully.", "Failed to communicate with DO module. Hardware error."),
+            "robot_recover": (1, "recover_state", BB_KEY_RECOVER, self.ACK_ID_ROBOT_RECOVER,
+                              "Robot recovery sequence started.", "Failed to initialize robot recovery. Check robot state."),
+            "process_auto_recover": (2, "recover_state", BB_KEY_RECOVER, self.ACK_ID_PROCESS_AUTO_RECOVER,
+                                     "Automatic process recovery started.", "Recovery not possible in current state."),
+            "robot_direct_teaching_on": (1, "dt_state", BB_KEY_DT, self.ACK_ID_ROBOT_DT_ON,
+                                         "Direct Teaching ON.", "Failed to enter DT mode."),
+            "robot_direct_teaching_off": (2, "dt_state", BB_KEY_DT, self.ACK_ID_ROBOT_DT_OFF,
+                                          "Direct Teaching OFF.", "Failed to exit DT mode."),
+            "gripper_hold": (1, "gripper_state", BB_KEY_GRIPPER, self.ACK_ID_GRIPPER_HOLD,
+                             "Gripper successfully holding the item.", "Gripper operation failed: HOLD."),
+            "gripper_release": (2, "gripper_state", BB_KEY_GRIPPER, self.ACK_ID_GRIPPER_RELEASE,
+                                "Gripper successfully released the item.", "Gripper operation failed: RELEASE."),
+            "go_home": (1, "system_go_home_state", BB_KEY_GO_HOME, self.ACK_ID_SYSTEM_GO_HOME,
+                        "Robot returned to system home position.", "Go Home failed."),
+            "manual_recover_complete": (1, "manual_recover_complete_state", BB_KEY_MANUAL_COMPLETE, self.ACK_ID_MANUAL_RECOVER_COMPLETE,
+                                        "Manual recovery sequence marked complete.", "State transition failed.")
+        }
+        # binpick_control: action -> (성공 Reason, 실패 Reason). 문서 3.4.1에 따라 start 성공 시 reason=null
+        self.binpick_reasons = {action: (f"Bin Picking action {action} executed.", f"Bin Picking action {action} failed.")
+                                for action in ACTION_MAP_BINPICK}
+        self.binpick_reasons.update({
+            "start": (None, "Job initialization failed."),
+            "stop": ("Bin Picking job stopped.", "Failed to stop job gracefully."),
+            "pause": ("Bin Picking action pause executed.", "Bin Picking action pause failed.")
+        })
+
+    # ==========================================================================
+    # 4. CMD 핸들러: 인장기 자동 제어 (tensile_control)
     # ==========================================================================
 
     def _handle_tensile_control(self, msg_id, action, command):
-        """
-        인장기 제어 명령을 처리하고 process_command 변수에 할당합니다.
-        ACK 발행 로직은 제거되었습니다.
-        """
-        
-        if action in ACTION_MAP_TENSIL:
-            self.tensile_command = ACTION_MAP_TENSIL[action]
-            self.last_command_id = msg_id
-            self.last_command_payload = command
-            
-            # ACK ID는 성공/실패 여부에 따라 외부에서 선택되어야 함.
-            if action == "start":
-                self.last_command_ack_id = self.ACK_ID_TENSIL_START_OK 
-            else:
-                ack_map_reverse = {v: k for k, v in ACTION_MAP_TENSIL.items()}
-                action_name = ack_map_reverse[self.tensile_command]
-                
-                # 나머지 tensile_control 명령에 대한 ACK ID 매핑
-                ack_id_map = {
-                    "stop": self.ACK_ID_TENSIL_STOP, "step_stop": self.ACK_ID_TENSIL_STEP_STOP,
-                    "pause": self.ACK_ID_TENSIL_PAUSE, "resume": self.ACK_ID_TENSIL_RESUME,
-                    "reset": self.ACK_ID_TENSIL_RESET, "go_home": self.ACK_ID_TENSIL_GOHOME
-                }
-                self.last_command_ack_id = ack_id_map.get(action_name, "logic-ack-unknown")
-
-            # [Blackboard 동기화]
-            bb.set(BB_KEY_TENSILE, self.tensile_command)
-
-
-            Logger.info(f"  [ASSIGN] tensile_command: {self.tensile_command} assigned ({action}). Waiting...")
-        else:
-            Logger.info(f"  [WARN] Unknown tensile_control action: {action}")
+        """인장기 제어 명령을 tensile_command 변수와 Blackboard에 할당합니다. (action은 라우팅 단계에서 검증됨)"""
+        self.tensile_command = ACTION_MAP_TENSIL[action]
+        self.last_command_id = msg_id
+        self.last_command_payload = command
+        # 실패 시 start는 TENSIL_START_REJECT로 대체됨 (_process_tensile_command)
+        self.last_command_ack_id = self.tensile_ack_ids.get(action, "logic-ack-unknown")
+
+        # [Blackboard 동기화]
+        bb.set(BB_KEY_TENSILE, self.tensile_command)
+        if _debug_enabled():
+            Logger.debug(f"  [ASSIGN] tensile_command: {self.tensile_command} assigned ({action}). Waiting...")
 
     # ==========================================================================
-    # 4. CMD 핸들러: 수동/시스템 제어 (system_control)
+    # 5. CMD 핸들러: 수동/시스템 제어 (system_control)
     # ==========================================================================
-    
+
     def _handle_manual_control(self, msg_id, action, command):
-        """
-        수동 및 시스템 제어 명령을 처리하고 상태 변수에 할당합니다.
-        ACK 발행 로직은 제거되었습니다.
-        """
+        """수동 및 시스템 제어 명령을 상태 변수와 Blackboard에 할당합니다. (action은 라우팅 단계에서 검증됨)"""
+        state_value, attr_name, bb_key, ack_id, _, _ = self.system_actions[action]
         self.last_command_id = msg_id
         self.last_command_payload = command
-        
-        # 시스템 제어 명령에 대한 상태, ACK ID, BB Key 매핑
-        manual_map = {
-            "do_control": [1, self.ACK_ID_MANUAL_CONTROL, "do_control_state", BB_KEY_DO_CONTROL],
-            "robot_recover": [1, self.ACK_ID_ROBOT_RECOVER, "recover_state", BB_KEY_RECOVER],
-            "process_auto_recover": [2, self.ACK_ID_PROCESS_AUTO_RECOVER, "recover_state", BB_KEY_RECOVER],
-            "robot_direct_teaching_on": [1, self.ACK_ID_ROBOT_DT_ON, "dt_state", BB_KEY_DT],
-            "robot_direct_teaching_off": [2, self.ACK_ID_ROBOT_DT_OFF, "dt_state", BB_KEY_DT],
-            "gripper_hold": [1, self.ACK_ID_GRIPPER_HOLD, "gripper_state", BB_KEY_GRIPPER],
-            "gripper_release": [2, self.ACK_ID_GRIPPER_RELEASE, "gripper_state", BB_KEY_GRIPPER],
-            "go_home": [1, self.ACK_ID_SYSTEM_GO_HOME, "system_go_home_state", BB_KEY_GO_HOME],
-            "manual_recover_complete": [1, self.ACK_ID_MANUAL_RECOVER_COMPLETE, "manual_recover_complete_state", BB_KEY_MANUAL_COMPLETE]
-        }
-        
-        if action in manual_map:
-            state_value, ack_id, attr_name, bb_key = manual_map[action]            
-            # 해당 상태 변수에 값 할당
-            setattr(self, attr_name, state_value)
-            self.last_command_ack_id = ack_id
-            
-            # [Blackboard 동기화]
-            bb.set(bb_key, state_value)            
-            Logger.info(f"  [ASSIGN] {attr_name}: {state_value} assigned ({action}). Waiting...")
+        # 해당 상태 변수에 값 할당
+        setattr(self, attr_name, state_value)
+        self.last_command_ack_id = ack_id
 
-        else:
-            Logger.info(f"  [WARN] Unknown system_control action: {action}")
+        # [Blackboard 동기화]
+        bb.set(bb_key, state_value)
+        if _debug_enabled():
+            Logger.debug(f"  [ASSIGN] {attr_name}: {state_value} assigned ({action}). Waiting...")
 
     # ==========================================================================
-    # 5. Bin Picking 제어 (binpick_control)
+    # 6. Bin Picking 제어 (binpick_control)
     # ==========================================================================
-    
+
     def _handle_binpick_control(self, msg_id, action, command):
-        """
-        Bin Picking 제어 명령을 처리하고 상태 변수에 할당합니다.
-        ACK 발행 로직은 제거되었습니다.
-        """
-        if action in ACTION_MAP_BINPICK:
-            self.binpick_command = ACTION_MAP_BINPICK[action]
-            self.last_command_id = msg_id
-            self.last_command_payload = command
-            
-            # [수정] Bin Picking ACK ID는 logic-ack-001로 고정
-            self.last_command_ack_id = self.ACK_ID_TENSIL_START_OK
-            
-            # [Blackboard 동기화]
-            bb.set(BB_KEY_BINPICK, self.binpick_command)
+        """Bin Picking 제어 명령을 상태 변수에 할당하고 Bin Picking 시스템으로 명령을 발행합니다."""
+        self.binpick_command = ACTION_MAP_BINPICK[action]
+        self.last_command_id = msg_id
+        self.last_command_payload = command
 
-            # [추가] Logic -> Binpick 명령 발행 (문서 3.6 참조)
-            job_id = command.get("job_id", "BP20251118-001")
-            self._send_command_to_binpick(action, job_id)
-            Logger.info(f"  [ASSIGN] binpick_command: {self.binpick_command} assigned ({action}). Waiting...")
-        else:
-            Logger.info(f"  [WARN] Unknown binpick_control action: {action}")
+        # [수정] Bin Picking ACK ID는 logic-ack-001로 고정
+        self.last_command_ack_id = self.ACK_ID_TENSIL_START_OK
+
+        # [Blackboard 동기화]
+        bb.set(BB_KEY_BINPICK, self.binpick_command)
+
+        # [추가] Logic -> Binpick 명령 발행 (문서 3.6 참조)
+        job_id = command.get("job_id", "BP20251118-001")
+        self._send_command_to_binpick(action, job_id)
+        if _debug_enabled():
+            Logger.debug(f"  [ASSIGN] binpick_command: {self.binpick_command} assigned ({action}). Waiting...")
 
     # ==========================================================================
-    # 6. Logic 처리 루프 (Main Logic 역할 수행)
+    # 7. 명령 디스패처 (Main Logic 역할 수행)
     # ==========================================================================
-    
-    def _get_manual_action_info(self, state_value, state_attr):
-        """상태 값과 속성 이름을 바탕으로 액션 이름, ACK ID, Reason을 반환합니다."""
-        # (액션 이름, ACK ID, 성공 Reason, 실패 Reason, BB Key)
-        ack_map = {
-            "do_control_state": {1: ("do_control", self.ACK_ID_MANUAL_CONTROL, "Digital output control executed successfully.", "Failed to communicate with DO module. Hardware error.", BB_KEY_DO_CONTROL)},
-            "recover_state": {
-                1: ("robot_recover", self.ACK_ID_ROBOT_RECOVER, "Robot recovery sequence started.", "Failed to initialize robot recovery. Check robot state.", BB_KEY_RECOVER),
-                2: ("process_auto_recover", self.ACK_ID_PROCESS_AUTO_RECOVER, "Automatic process recovery started.", "Recovery not possible in current state.", BB_KEY_RECOVER)
-            },
-            "dt_state": {
-                1: ("robot_direct_teaching_on", self.ACK_ID_ROBOT_DT_ON, "Direct Teaching ON.", "Failed to enter DT mode.", BB_KEY_DT),
-                2: ("robot_direct_teaching_off", self.ACK_ID_ROBOT_DT_OFF, "Direct Teaching OFF.", "Failed to exit DT mode.", BB_KEY_DT)
-            },
-            "gripper_state": {
-                1: ("gripper_hold", self.ACK_ID_GRIPPER_HOLD, "Gripper successfully holding the item.", "Gripper operation failed: HOLD.", BB_KEY_GRIPPER),
-                2: ("gripper_release", self.ACK_ID_GRIPPER_RELEASE, "Gripper successfully released the item.", "Gripper operation failed: RELEASE.", BB_KEY_GRIPPER)
-            },
-            "system_go_home_state": {1: ("go_home", self.ACK_ID_SYSTEM_GO_HOME, "Robot returned to system home position.", "Go Home failed.", BB_KEY_GO_HOME)},
-            "manual_recover_complete_state": {1: ("manual_recover_complete", self.ACK_ID_MANUAL_RECOVER_COMPLETE, "Manual recovery sequence marked complete.", "State transition failed.", BB_KEY_MANUAL_COMPLETE)}
-        }
-        
-        info = ack_map.get(state_attr, {}).get(state_value, ("UNKNOWN", "logic-ack-unknown", "Unknown system command.", "Unknown Error", "ui/cmd/error"))
-        return info
 
-    def _get_binpick_action_info(self, command_value):
-        """Bin Picking 명령에 대한 ACK 정보를 반환합니다."""
-        action_name = {v: k for k, v in ACTION_MAP_BINPICK.items()}.get(command_value, "UNKNOWN")
-        
-        # [수정] Bin Picking ACK ID는 logic-ack-001로 고정
-        ack_id_fixed = self.ACK_ID_TENSIL_START_OK 
-        
-        if action_name == "start":
-            # 문서 3.4.1에 따라 reason=null, data에 job_id가 포함됨
-            return action_name, ack_id_fixed, None, "Job initialization failed." 
-        elif action_name == "stop":
-            return action_name, ack_id_fixed, "Bin Picking job stopped.", "Failed to stop job gracefully."
-        elif action_name == "pause":
-            return action_name, ack_id_fixed, "Bin Picking action pause executed.", "Bin Picking action pause failed."
+    def _enqueue_command(self, command: MqttCommand):
+        """
+        중복 msg_id를 걸러낸 후 명령을 큐에 넣습니다.
+        이미 처리된 명령은 캐시된 ACK를 재발행하고, 처리 중인 명령은 무시합니다.
+        """
+        if command.msg_id is None:
+            self.command_queue.put(command)
+            return
+        state, cached_ack = self.ack_cache.reserve(command.msg_id)
+        if state == AckCache.DONE:
+            Logger.warn(f"  [DUP] {command.msg_id} already processed. Re-publishing cached ACK.")
+            self.publish_ack(cached_ack)
+        elif state == AckCache.PENDING:
+            Logger.warn(f"  [DUP] {command.msg_id} is already queued or in progress. Ignored.")
         else:
-            return action_name, ack_id_fixed, f"Bin Picking action {action_name} executed.", f"Bin Picking action {action_name} failed."
-            
-    
-    def _logic_processing_loop(self):
+            self.command_queue.put(command)
+
+    def get_duplicate_stats(self) -> dict:
+        """중복 명령 캐시 통계 {cached, pending, duplicates, in_flight_duplicates}"""
+        return self.ack_cache.get_stats()
+
+    def complete_command(self, msg_id=None, success: bool = True, reason=None, data=None) -> bool:
         """
-        MqttComm 클래스 내에서 실행되는 Logic 처리 스레드입니다.
-        내부 상태 변수를 Blackboard에 동기화하고, 명령을 처리한 후 ACK를 발행합니다.
+        외부 Logic(FSM 등)이 완료 대기 중인 UI 명령의 완료를 알립니다. 디스패처는 다음 폴링에서 ACK를 발행합니다.
+        :param msg_id: 완료할 명령의 msg_id. None이면 가장 최근에 할당된 명령
+        :param success: 성공 여부
+        :param reason: ACK reason (None이면 기본 문구 사용)
+        :param data: ACK data (None이면 기본 데이터 사용)
+        :return: 완료 신호가 전달되었는지 여부
         """
-        TENSIL_ACTIONS_REVERSE = {v: k for v, k in ACTION_MAP_TENSIL.items()}
-        
-        SYSTEM_CONTROL_STATE_ATTRS = [
-            "do_control_state", "recover_state", "dt_state", "gripper_state", 
-            "system_go_home_state", "manual_recover_complete_state"
-        ]
+        with self._pending_lock:
+            pending = list(self.pending_commands.values())
+        if msg_id is None:
+            command = max(pending, key=lambda c: c.received_at, default=None)
+        else:
+            command = next((c for c in pending if c.msg_id == msg_id), None)
+        if command is None:
+            Logger.info(f"  [WARN] complete_command: no pending command for msg_id {msg_id}")
+            return False
+        command.complete(success, reason, data)
+        return True
+
+    def get_pending_commands(self) -> list:
+        """완료 대기 중인 명령 목록 (할당 순서)"""
+        with self._pending_lock:
+            return sorted(self.pending_commands.values(), key=lambda c: c.received_at)
+
+    def get_command_metrics(self) -> dict:
+        """명령 종류별 수신 -> ACK 발행 지연 통계 {"cmd/action": {count, last_ms, avg_ms, max_ms}}"""
+        with self._metrics_lock:
+            return {key: dict(value) for key, value in self.command_metrics.items()}
+
+    def _record_command_latency(self, command: MqttCommand):
+        latency_ms = (time.monotonic() - command.received_at) * 1000.0
+        key = f"{command.cmd}/{command.action}"
+        with self._metrics_lock:
+            metric = self.command_metrics.setdefault(key, {"count": 0, "last_ms": 0.0, "avg_ms": 0.0, "max_ms": 0.0})
+            metric["count"] += 1
+            metric["last_ms"] = latency_ms
+            metric["avg_ms"] += (latency_ms - metric["avg_ms"]) / metric["count"]
+            metric["max_ms"] = max(metric["max_ms"], latency_ms)
+        if _debug_enabled():
+            Logger.debug(f"  [ACK] {key} ({command.msg_id}) latency: {latency_ms:.1f} ms")
+
+    def _done_condition(self, command: MqttCommand):
+        """명령의 BB 완료 조건 (FSM이 설정하는 완료 플래그). complete_command()와 함께 완료 경로로 사용됩니다."""
+        if command.cmd == CMD_TENSILE:
+            expected = ACTION_MAP_TENSIL[command.action]
+            return lambda: bb.get(BB_STATUS_TENSILE_DONE) == expected
+        if command.cmd == CMD_BINPICK:
+            return lambda: bool(bb.get(BB_STATUS_BINPICK_DONE))
+        status_key, expected, _ = SYSTEM_DONE_CONDITIONS[command.action]
+        if expected is None:
+            return lambda: bool(bb.get(status_key))
+        return lambda: bb.get(status_key) == expected
+
+    def _command_dispatch_loop(self):
+        """
+        명령 큐에서 UI 명령을 수신 순서대로 꺼내 할당하고, 완료 대기 중인 명령을 폴링해 ACK를 발행하는 디스패처 스레드입니다.
+        완료를 기다리는 동안에도 다음 명령을 꺼내므로 stop 등의 명령이 앞선 start의 완료 대기 뒤에 밀리지 않습니다.
+        """
+        Logger.info("\n[CommandDispatchThread]: Starting command dispatch loop.")
 
-        Logger.info("\n[LogicProcessingThread]: Starting internal logic processing loop.")
-        
         while self.running:
-            
-            # ----------------------------------------------------
-            # 1. TENSIL_CONTROL 명령 확인 및 처리
-            # ----------------------------------------------------
-            if self.tensile_command != 0:
-                # [Blackboard 동기화]
-                bb.set(BB_KEY_TENSILE, self.tensile_command)
-
-                command_value = self.tensile_command
-                action_name = TENSIL_ACTIONS_REVERSE.get(command_value, "UNKNOWN")
-                msg_id = self.last_command_id
-                ack_id = self.last_command_ack_id
-                
-                Logger.info(f"[LogicThread] TENSIL command detected: {action_name} ({msg_id})")
-                
-                # --- 장비 동작 수행 (ACK 결정) ---
-                # TODO: 실제 장비 제어 로직으로 대체 필요
-                for _ in range(50):
-                    if not self.running: break
-                    time.sleep(0.01)
-                
-                success = random.random() < 0.8 
-                
-                # --- ACK 전송 ---
-                if success:
-                    reason = f"{action_name} executed successfully."
-                    ack_json = self.generate_ack(msg_id, "ok", ack_id, reason=reason, data=self.last_command_payload)
-                else:
-                    reason = f"Failed to execute {action_name}. Check limits."
-                    fail_ack_id = self.ACK_ID_TENSIL_START_REJECT if action_name == "start" else ack_id
-                    ack_json = self.generate_ack(msg_id, "rejected", fail_ack_id, reason=reason)
-                
-                self.publish_ack(ack_json)
-                
-                # 2. 명령 완료 후 상태 초기화 (필수)
-                self.tensile_command = 0 
-                bb.set(BB_KEY_TENSILE, 0) # Blackboard 상태도 초기화
-                self.last_command_id = None
-                self.last_command_ack_id = None
-                self.last_command_payload = {}
-            
-            # ----------------------------------------------------
-            # 2. BINPICK_CONTROL 명령 확인 및 처리
-            # ----------------------------------------------------
-            if self.binpick_command != 0:
-                # [Blackboard 동기화]
-                bb.set(BB_KEY_BINPICK, self.binpick_command)
-
-                command_value = self.binpick_command
-                msg_id = self.last_command_id
-                ack_of_id = self.last_command_id # ack_of는 수신된 msg_id를 그대로 사용 (문서 3.4.1/3.4.2)
-                ack_id = self.last_command_ack_id # logic-ack-001로 고정되어 있음
-                
-                action_name, _, ok_reason, err_reason = self._get_binpick_action_info(command_value)
-                
-                Logger.info(f"[LogicThread] BINPICK command detected: {action_name} ({msg_id})")
-                
-                # --- 장비 동작 수행 (ACK 결정) ---
-                success = False
-                
-                if bb.get(BB_STATUS_BINPICK_DONE):
-                    success = True
-                    Logger.info("  [Logic] BINPICK: Done flag confirmed after device communication. Resetting Blackboard.")
-                    bb.set(BB_STATUS_BINPICK_DONE, False) # 완료 플래그 초기화
-                
-                # [SIMULATION FALLBACK] 장비 응답이 없을 경우, 랜덤으로 성공/실패 결정
-                if not success:
-                    time.sleep(0.1) 
-                    success = random.random() < 0.7 
-                
-                # --- ACK 전송 ---
-                if success:
-                    # 문서 3.4.1에 따라 reason=null, data={job_id}
-                    data = {"job_id": self.last_command_payload.get("job_id", "BP20251118-001")} # 문서 예시 데이터 사용
-                    ack_json = self.generate_ack(ack_of_id, "ok", ack_id, reason=ok_reason, data=data)
+            try:
+                command = self.command_queue.get(timeout=COMMAND_POLL_INTERVAL if self.pending_commands else 0.1)
+            except queue.Empty:
+                command = None
+            if command is not None:
+                self._start_command(command)
+            self._poll_pending_commands()
+
+    def _start_command(self, command: MqttCommand):
+        """
+        명령을 상태 변수와 Blackboard에 할당하고 완료 대기 목록에 등록합니다.
+        같은 BB 명령 키를 쓰는 이전 명령이 아직 대기 중이면 새 명령으로 대체된 것으로 실패 ACK를 발행합니다.
+        """
+        if command.cmd == CMD_TENSILE:
+            key, handler, timeout = BB_KEY_TENSILE, self._handle_tensile_control, TENSILE_DONE_TIMEOUT
+        elif command.cmd == CMD_BINPICK:
+            key, handler, timeout = BB_KEY_BINPICK, self._handle_binpick_control, BINPICK_DONE_TIMEOUT
+        else:
+            key, handler, timeout = self.system_actions[command.action][2], self._handle_manual_control, SYSTEM_DONE_TIMEOUT
+
+        with self._pending_lock:
+            previous = self.pending_commands.pop(key, None)
+        if previous is not None:
+            Logger.warn(f"  [DISPATCH] {previous.cmd}/{previous.action} ({previous.msg_id}) superseded by {command.action}.")
+            self._finish_command(previous, False, reason=f"Superseded by {command.action} ({command.msg_id}).")
+
+        try:
+            handler(command.msg_id, command.action, command.payload)
+        except Exception as e:
+            Logger.info(f"[ERROR] Error while dispatching {command.cmd}/{command.action}: {e}")
+            if command.msg_id is not None:
+                self.ack_cache.release(command.msg_id)
+            return
+        command.key = key
+        command.ack_id = self.last_command_ack_id
+        command.condition = self._done_condition(command)
+        command.deadline = time.monotonic() + timeout
+        with self._pending_lock:
+            self.pending_commands[key] = command
+
+    def _poll_pending_commands(self):
+        """대기 중인 명령의 완료 신호(complete_command), BB 완료 조건, 기한을 확인해 끝난 명령의 ACK를 발행합니다."""
+        if not self.pending_commands:
+            return
+        now = time.monotonic()
+        with self._pending_lock:
+            pending = list(self.pending_commands.items())
+        for key, command in pending:
+            try:
+                condition_met = command.condition()
+            except Exception as e:
+                Logger.info(f"[ERROR] Error while checking {command.cmd}/{command.action} done condition: {e}")
+                condition_met = False
+            if command.done.is_set():
+                success = command.result[0]
+            elif condition_met:
+                success = True
+            elif now >= command.deadline:
+                success = None     # 시간 초과
+            else:
+                continue
+            with self._pending_lock:
+                if self.pending_commands.get(key) is not command:
+                    continue
+                del self.pending_commands[key]
+            self._finish_command(command, success)
+
+    def _finish_command(self, command: MqttCommand, success, reason=None):
+        """
+        명령의 ACK를 만들어 발행하고 상태 변수/BB를 초기화합니다.
+        :param success: True/False, 시간 초과 시 None
+        :param reason: ACK reason 우선 값 (대체된 명령 등)
+        """
+        ack_json = None
+        try:
+            if command.cmd == CMD_TENSILE:
+                ack_json = self._process_tensile_command(command, success, reason)
+            elif command.cmd == CMD_BINPICK:
+                ack_json = self._process_binpick_command(command, success, reason)
+            else:
+                ack_json = self._process_system_command(command, success, reason)
+
+            self.publish_ack(ack_json)
+            self._record_command_latency(command)
+        except Exception as e:
+            Logger.info(f"[ERROR] Error while acknowledging {command.cmd}/{command.action}: {e}")
+        finally:
+            if command.msg_id is not None:
+                if ack_json is not None:
+                    self.ack_cache.store(command.msg_id, ack_json)
                 else:
-                    # 문서 3.4.2에 따라 status="error", reason={error_context}, data={}
-                    data = {}
-                    ack_json = self.generate_ack(ack_of_id, "error", ack_id, reason=err_reason, data=data)
-
-                self.publish_ack(ack_json)
-
-                # 2. 명령 완료 후 상태 초기화 (필수)
-                self.binpick_command = 0
-                bb.set(BB_KEY_BINPICK, 0) # Blackboard 상태도 초기화
-                self.last_command_id = None
-                self.last_command_ack_id = None
-                self.last_command_payload = {}
-
-
-            # ----------------------------------------------------
-            # 3. SYSTEM_CONTROL 명령 확인 및 처리 (통합 루프)
-            # ----------------------------------------------------
-            for attr_name in SYSTEM_CONTROL_STATE_ATTRS:
-                state_value = getattr(self, attr_name)
-                
-                if state_value != 0:
-                    # 1. 명령 정보, ACK ID, Reason, BB Key 가져오기
-                    action_name, ack_id, ok_reason, err_reason, bb_key = self._get_manual_action_info(state_value, attr_name)
-                    msg_id = self.last_command_id
-                    
-                    # [Blackboard 동기화]
-                    bb.set(bb_key, state_value)
-                    
-                    Logger.info(f"[LogicThread] SYSTEM command detected: {action_name} ({msg_id})")
-
-                    # 2. 실제 장비 명령 구동 후 성공여부에 따른 값 결정
-                    
-                    success = False
-                    
-                    if action_name == "do_control":
-                        if bb.get(BB_STATUS_DO_DONE):
-                            success = True
-                            Logger.info("  [Logic] DO_CONTROL: Done flag confirmed after device communication. Resetting Blackboard.")
-                            bb.set(BB_STATUS_DO_DONE, False) # 완료 플래그 초기화
-                    elif action_name == "robot_recover":
-                        if bb.get(BB_STATUS_ROBOT_RECOVER_DONE):
-                            success = True
-                            Logger.info("  [Logic] ROBOT_RECOVER: Robot recovery done flag confirmed. Resetting Blackboard.")
-                            bb.set(BB_STATUS_ROBOT_RECOVER_DONE, False)
-                    elif action_name == "process_auto_recover":
-                        if bb.get(BB_STATUS_PROC_RECOVER_DONE):
-                            success = True
-                            Logger.info("  [Logic] PROCESS_AUTO_RECOVER: Process auto recovery done flag confirmed. Resetting Blackboard.")
-                            bb.set(BB_STATUS_PROC_RECOVER_DONE, False)
-                    elif action_name == "robot_direct_teaching_on":
-                        if bb.get(BB_STATUS_DT_MODE) == 1:
-                            success = True
-                            Logger.info("  [Logic] DT ON: DT mode entry status confirmed.")
-                            # NOTE: DT Mode는 상태 변수이므로 상태 플래그를 초기화할 필요 없음.
-                    elif action_name == "robot_direct_teaching_off":
-                        if bb.get(BB_STATUS_DT_MODE) == 0:
-                            success = True
-                            Logger.info("  [Logic] DT OFF: DT mode exit status confirmed.")
-                            # NOTE: DT Mode는 상태 변수이므로 상태 플래그를 초기화할 필요 없음.
-                    elif action_name == "gripper_hold":
-                        if bb.get(BB_STATUS_GRIPPER_HOLDING) == 1:
-                            success = True
-                            Logger.info("  [Logic] GRIPPER HOLD: Hold status confirmed.")
-                            # NOTE: Holding 상태는 유지되므로 플래그 초기화 불필요.
-                    elif action_name == "gripper_release":
-                        if bb.get(BB_STATUS_GRIPPER_RELEASE) == 1: 
-                            success = True
-                            Logger.info("  [Logic] GRIPPER RELEASE: Release status confirmed. Resetting Blackboard.")
-                            bb.set(BB_STATUS_GRIPPER_RELEASE, False) # 릴리즈 성공 플래그 초기화
-                    elif action_name == "go_home":
-                        if bb.get(BB_STATUS_ROBOT_HOME_POS):
-                            success = True
-                            Logger.info("  [Logic] GO HOME: Robot home position confirmed. Resetting Blackboard.")
-                            bb.set(BB_STATUS_ROBOT_HOME_POS, False) # 가정: 홈 위치는 임시 플래그로 확인 후 리셋
-                    elif action_name == "manual_recover_complete":
-                        if bb.get(BB_STATUS_MANUAL_COMPLETE_DONE):
-                            success = True
-                            Logger.info("  [Logic] MANUAL RECOVER COMPLETE: Done report flag confirmed. Resetting Blackboard.")
-                            bb.set(BB_STATUS_MANUAL_COMPLETE_DONE, False) # 완료 플래그 초기화
-                    
-                    # [SIMULATION FALLBACK] 장비 응답이 없을 경우, 랜덤으로 성공/실패 결정
-                    if not success:
-                        time.sleep(0.1) 
-                        success = random.random() < 0.9 
-                    
-                    if success:
-                        data = {}
-                        
-                        # (1) DO_CONTROL: data에 applied_values 추가 및 현재 DO 상태 업데이트
-                        if action_name == "do_control":
-                            do_values_rcv = self.last_command_payload.get("params", {}).get("do_values", [])
-                            data = {"applied_values": do_values_rcv}
-                            self.current_do_values = do_values_rcv 
-                        
-                        # (2) 나머지 명령 (로직만 수행)
-                        else:
-                            pass 
-
-                        ack_json = self.generate_ack(msg_id, "ok", ack_id, reason=ok_reason, data=data)
-                    else:
-                        # 실패 처리 (모든 실패는 err_reason 사용)
-                        ack_json = self.generate_ack(msg_id, "error", ack_id, reason=err_reason)
-
-                    self.publish_ack(ack_json)
-
-                    # 3. 명령 완료 후 상태 초기화
-                    setattr(self, attr_name, 0)
-                    bb.set(bb_key, 0) # Blackboard 상태도 초기화
-                    self.last_command_id = None
-                    self.last_command_ack_id = None
-                    self.last_command_payload = {}
-                    break # 하나의 시스템 명령 처리 후 다음 루프로 이동
-
-            time.sleep(0.05) # 루프 지연 (50ms)
+                    self.ack_cache.release(command.msg_id)
+
+    def _process_tensile_command(self, command: MqttCommand, success, reason=None):
+        """TENSIL_CONTROL 명령의 완료 결과로 ACK JSON을 만듭니다. 시간 내 완료 신호가 없으면 실패로 응답합니다."""
+        action_name = command.action
+        msg_id = command.msg_id
+        ack_id = command.ack_id
+
+        if _debug_enabled():
+            Logger.debug(f"[LogicThread] TENSIL command finished: {action_name} ({msg_id}) -> {success}")
+
+        if command.condition():
+            bb.set(BB_STATUS_TENSILE_DONE, 0)  # 완료 플래그 초기화
+
+        _, result_reason, data = command.result or (None, None, None)
+        reason = reason or result_reason
+        if success is None:
+            reason = reason or f"No completion signal for {action_name} within {TENSILE_DONE_TIMEOUT:.1f} s."
+        if success:
+            reason = reason or f"{action_name} executed successfully."
+            ack_json = self.generate_ack(msg_id, "ok", ack_id, reason=reason,
+                                         data=command.payload if data is None else data)
+        else:
+            reason = reason or f"Failed to execute {action_name}. Check limits."
+            fail_ack_id = self.ACK_ID_TENSIL_START_REJECT if action_name == "start" else ack_id
+            ack_json = self.generate_ack(msg_id, "rejected", fail_ack_id, reason=reason)
+
+        # 명령 완료 후 상태 초기화 (필수)
+        self.tensile_command = 0
+        bb.set(BB_KEY_TENSILE, 0)
+        return ack_json
+
+    def _process_binpick_command(self, command: MqttCommand, success, reason=None):
+        """BINPICK_CONTROL 명령의 완료 결과로 ACK JSON을 만듭니다."""
+        msg_id = command.msg_id  # ack_of는 수신된 msg_id를 그대로 사용 (문서 3.4.1/3.4.2)
+        ack_id = command.ack_id  # logic-ack-001로 고정되어 있음
+
+        action_name = command.action
+        ok_reason, err_reason = self.binpick_reasons[action_name]
+
+        if _debug_enabled():
+            Logger.debug(f"[LogicThread] BINPICK command finished: {action_name} ({msg_id}) -> {success}")
+
+        if command.condition():
+            if _debug_enabled():
+                Logger.debug("  [Logic] BINPICK: Done flag confirmed after device communication. Resetting Blackboard.")
+            bb.set(BB_STATUS_BINPICK_DONE, False)  # 완료 플래그 초기화
+
+        # [SIMULATION FALLBACK] 장비 응답이 없을 경우, 랜덤으로 성공/실패 결정
+        if success is None:
+            success = random.random() < 0.7
+
+        _, result_reason, data = command.result or (None, None, None)
+        reason = reason or result_reason
+        if success:
+            # reset 성공 시 Bin Picking 에러 상태 해제
+            if action_name == "reset":
+                self.binpick_state.clear_error()
+            # 문서 3.4.1에 따라 reason=null, data={job_id}
+            if data is None:
+                data = {"job_id": command.payload.get("job_id", "BP20251118-001")}  # 문서 예시 데이터 사용
+            ack_json = self.generate_ack(msg_id, "ok", ack_id, reason=reason or ok_reason, data=data)
+        else:
+            # 문서 3.4.2에 따라 status="error", reason={error_context}, data={}
+            ack_json = self.generate_ack(msg_id, "error", ack_id, reason=reason or err_reason, data={})
+
+        # 명령 완료 후 상태 초기화 (필수)
+        self.binpick_command = 0
+        bb.set(BB_KEY_BINPICK, 0)
+        return ack_json
+
+    def _process_system_command(self, command: MqttCommand, success, reason=None):
+        """SYSTEM_CONTROL 명령의 완료 결과로 ACK JSON을 만듭니다."""
+        action_name = command.action
+        msg_id = command.msg_id
+        status_key, _, reset_value = SYSTEM_DONE_CONDITIONS[action_name]
+        _, attr_name, bb_key, ack_id, ok_reason, err_reason = self.system_actions[action_name]
+
+        if _debug_enabled():
+            Logger.debug(f"[LogicThread] SYSTEM command finished: {action_name} ({msg_id}) -> {success}")
+
+        if command.condition():
+            if _debug_enabled():
+                Logger.debug(f"  [Logic] {action_name.upper()}: Done status confirmed.")
+            if reset_value is not None:
+                bb.set(status_key, reset_value)  # 완료 플래그 초기화
+
+        # [SIMULATION FALLBACK] 장비 응답이 없을 경우, 랜덤으로 성공/실패 결정
+        if success is None:
+            success = random.random() < 0.9
+
+        _, result_reason, data = command.result or (None, None, None)
+        reason = reason or result_reason
+        if success:
+            if data is None:
+                data = {}
+                # DO_CONTROL: data에 applied_values 추가 및 현재 DO 상태 업데이트
+                if action_name == "do_control":
+                    do_values_rcv = command.payload.get("params", {}).get("do_values", [])
+                    data = {"applied_values": do_values_rcv}
+                    self.current_do_values = do_values_rcv
+            ack_json = self.generate_ack(msg_id, "ok", ack_id, reason=reason or ok_reason, data=data)
+        else:
+            # 실패 처리 (모든 실패는 err_reason 사용)
+            ack_json = self.generate_ack(msg_id, "error", ack_id, reason=reason or err_reason)
+
+        # 명령 완료 후 상태 초기화
+        setattr(self, attr_name, 0)
+        bb.set(bb_key, 0)
+        return ack_json
 
     def _status_publishing_loop(self):
         """
-        DIO 및 시스템 상태를 주기적으로 발행하는 전용 스레드 루프입니다.
-        (주기: DIO 상태는 0.5초, 시스템 상태는 DIO 발행 후 0.2초 간격)
+        DIO 및 시스템 상태를 발행하는 전용 스레드 루프입니다.
+        상태는 sample_interval마다 확인하고, 값이 바뀌면 즉시(min_interval 제한) 발행합니다.
+        변경이 없으면 keep-alive_interval마다 재발행합니다.
         """
         Logger.info("[StatusPublishingThread]: Starting status publishing loop.")
-        
-        # DIO 발행을 위한 초기 값 설정 (publish_dio_status에서 사용)
+
+        sample_interval = self.status_config.get("sample_interval", 0.02)
+        simulate_dio = self.status_config.get("simulate_dio", True)
         di_values = [0] * DI_SIZE
         do_values = [0] * DO_SIZE
+        next_dio_sim = 0.0
+        spool_retry_interval = self.spool_config.get("retry_interval", 1.0)
+        next_spool_retry = 0.0
 
         while self.running:
             try:
-                # 1. DIO 상태 시뮬레이션 및 발행 (0.5s 주기 시작)
-                # 시뮬레이션: 값을 약간씩 변경
-                di_values = [random.randint(0, 1) if random.random() < 0.02 else v for v in di_values]
-                do_values = [random.randint(0, 1) if random.random() < 0.05 else v for v in do_values]
-                
-                # DIO 발행 및 BB 업데이트 (T=0.0s)
-                self.publish_dio_status(di_values, do_values)
-
-                # 2. 0.2초 대기
-                for _ in range(20):
-                    if not self.running: break
-                    time.sleep(0.01)
-                if not self.running: break
-
-                # 3. 시스템 상태 발행 (T=0.2s)
-                self.publish_system_status() 
-
-                # 4. 남은 시간 대기 (0.5s - 0.2s = 0.3s)
-                for _ in range(30):
-                    if not self.running: break
-                    time.sleep(0.01)
-            
+                now = time.time()
+                # 연결 중 스풀된 메시지는 즉시, 재발행이 중간에 멈춰 남아 있는 메시지는 주기적으로 재시도
+                if self._spool_replay_requested.is_set() or now >= next_spool_retry:
+                    self._spool_replay_requested.clear()
+                    next_spool_retry = now + spool_retry_interval
+                    self._replay_spool()
+
+                if simulate_dio:
+                    # 시뮬레이션: 0.5초마다 값을 약간씩 변경
+                    if now >= next_dio_sim:
+                        di_values = [random.randint(0, 1) if random.random() < 0.02 else v for v in di_values]
+                        do_values = [random.randint(0, 1) if random.random() < 0.05 else v for v in do_values]
+                        next_dio_sim = now + 0.5
+                        if self.status_publisher.update_dio(di_values, do_values):
+                            bb.set(BB_STATUS_DI_ENTIRE, list(di_values))
+                            bb.set(BB_STATUS_DO_ENTIRE, list(do_values))
+                else:
+                    # 실제 장비: DeviceContext가 Blackboard에 갱신한 DIO 값을 사용
+                    di_bb = bb.get(BB_STATUS_DI_ENTIRE)
+                    do_bb = bb.get(BB_STATUS_DO_ENTIRE)
+                    if di_bb and do_bb:
+                        self.status_publisher.update_dio(di_bb, do_bb)
+
+                self.status_publisher.update_system(self._read_system_states())
+
+                wait = self.status_publisher.poll(now)
+                self.status_publisher.wait(min(wait, sample_interval))
+
             except Exception as e:
                 Logger.info(f"[ERROR] Error in status publishing thread: {e}")
                 time.sleep(1)
 
 
     # ==========================================================================
-    # 7. 실행 함수
+    # 8. 실행 함수
     # ==========================================================================
 
     def start(self):
@@ -840,6 +1155,8 @@ class MqttComm:
             self.status_thread.join()
         self.client.loop_stop()
         self.client.disconnect()
+        if self.spool is not None:
+            self.spool.close()
 
     def run(self):
         """MQTT 클라이언트 연결 및 루프를 시작합니다 (Blocking)."""
@@ -874,7 +1191,7 @@ if __name__ == "__main__":
     # 1. MqttComm 인스턴스 생성 및 MQTT 통신 시작
     connector = MqttComm()
     
-    # run() 메서드 내에서 MQTT 연결 성공 시, _logic_processing_loop 및 _status_publishing_loop 스레드가 자동 시작됨.
+    # run() 메서드 내에서 MQTT 연결 성공 시, _command_dispatch_loop 및 _status_publishing_loop 스레드가 자동 시작됨.
     try:
         connector.run()
     except KeyboardInterrupt:
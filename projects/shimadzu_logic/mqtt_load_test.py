@@ -0,0 +1,294 @@
+"""
+MqttComm 부하 테스트 (브로커 없이 프로세스 내 대체 브로커 사용)
+
+UI 역할의 부하 생성기가 tensile_control / system_control / binpick_control 명령을 지정한 속도로 발행하고,
+명령 -> ACK 지연 백분위수, 누락된 ACK 수, 프로세스 CPU 사용률을 측정합니다.
+FSM 역할의 응답기는 디스패처가 명령을 할당하면 work_ms 후 complete_command()로 완료를 알립니다.
+
+사용 예 (저장소 루트에서):
+    python -m projects.shimadzu_logic.mqtt_load_test --count 2000 --rate 200
+    python -m projects.shimadzu_logic.mqtt_load_test --count 500 --rate 0 --work-ms 2 --mix tensile=1,system=3
+"""
+import argparse
+import json
+import os
+import queue
+import random
+import threading
+import time
+from collections import defaultdict
+
+from pkg.utils.blackboard import initialize_global_blackboard
+from pkg.utils.logging import Logger, LogLevel
+from projects.shimadzu_logic import mqtt_comm
+from projects.shimadzu_logic.devices.bench_utils import percentile
+
+TENSILE_ACTIONS = ["start", "stop", "step_stop", "pause", "resume", "reset", "go_home"]
+SYSTEM_ACTIONS = list(mqtt_comm.SYSTEM_DONE_CONDITIONS)
+BINPICK_ACTIONS = list(mqtt_comm.ACTION_MAP_BINPICK)
+
+
+class PublishInfo:
+    """paho MQTTMessageInfo 대체 (rc만 사용)"""
+    __slots__ = ("rc", "mid")
+
+    def __init__(self, rc: int = 0, mid: int = 0):
+        self.rc = rc
+        self.mid = mid
+
+
+class InProcessBroker:
+    """
+    토픽 완전 일치 구독만 지원하는 프로세스 내 MQTT 브로커 대체 구현입니다.
+    클라이언트마다 수신 큐와 전달 스레드를 두어 paho의 네트워크 스레드처럼 on_message를 비동기로 호출합니다.
+    """
+    def __init__(self):
+        self.subscriptions = defaultdict(list)  # topic -> [client]
+        self.lock = threading.Lock()
+        self.published_count = 0
+
+    def client(self):
+        return InProcessClient(self)
+
+    def route(self, topic: str, payload):
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        with self.lock:
+            self.published_count += 1
+            targets = list(self.subscriptions.get(topic, ()))
+        for target in targets:
+            target.inbox.put((topic, payload))
+
+
+class InProcessMessage:
+    __slots__ = ("topic", "payload")
+
+    def __init__(self, topic: str, payload: bytes):
+        self.topic = topic
+        self.payload = payload
+
+
+class InProcessClient:
+    """MqttComm이 사용하는 paho Client 메서드만 구현한 대체 클라이언트입니다."""
+    def __init__(self, broker: InProcessBroker):
+        self.broker = broker
+        self.inbox = queue.Queue()
+        self.on_connect = None
+        self.on_message = None
+        self.on_publish = None
+        self.on_disconnect = None
+        self.connected = False
+        self._thread = None
+        self._mid = 0
+
+    def connect(self, host=None, port=None, keepalive=60):
+        self.connected = True
+        return 0
+
+    def subscribe(self, topic, qos=0):
+        with self.broker.lock:
+            self.broker.subscriptions[topic].append(self)
+        return 0, 0
+
+    def publish(self, topic, payload=None, qos=0, retain=False):
+        if not self.connected:
+            return PublishInfo(rc=4)  # MQTT_ERR_NO_CONN
+        self._mid += 1
+        self.broker.route(topic, payload)
+        return PublishInfo(rc=0, mid=self._mid)
+
+    def loop_start(self):
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        if self.on_connect:
+            self.on_connect(self, None, {}, 0)
+
+    def _loop(self):
+        while self.connected:
+            try:
+                topic, payload = self.inbox.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if self.on_message:
+                self.on_message(self, None, InProcessMessage(topic, payload))
+
+    def loop_stop(self):
+        self.connected = False
+        if self._thread:
+            self._thread.join(timeout=1.0)
+
+    def disconnect(self):
+        was_connected = self.connected
+        self.connected = False
+        if was_connected and self.on_disconnect:
+            self.on_disconnect(self, None, 0)
+
+
+class LoadUiClient:
+    """UI 역할: 명령을 발행하고 /logic/evt에서 ACK 수신 시각을 기록합니다."""
+    def __init__(self, broker: InProcessBroker):
+        self.client = broker.client()
+        self.client.on_message = self._on_message
+        self.client.connect()
+        self.client.subscribe(mqtt_comm.TOPIC_LOGIC_EVT)
+        self.client.loop_start()
+        self.sent = {}          # msg_id -> (cmd, action, 발행 시각)
+        self.acked = {}         # msg_id -> ACK 수신 시각
+        self.status_events = 0
+        self.lock = threading.Lock()
+
+    def _on_message(self, client, userdata, msg):
+        payload = json.loads(msg.payload)
+        body = payload.get("payload", {})
+        if body.get("kind") == "ack":
+            with self.lock:
+                self.acked.setdefault(body.get("ack_of"), time.perf_counter())
+        else:
+            self.status_events += 1
+
+    def send(self, cmd: str, action: str, msg_id: str):
+        message = {
+            "header": {"msg_type": "ui.command", "source": "ui", "target": "logic",
+                       "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"), "msg_id": msg_id, "ack_required": True},
+            "payload": {"kind": "command", "cmd": cmd, "action": action}
+        }
+        with self.lock:
+            self.sent[msg_id] = (cmd, action, time.perf_counter())
+        self.client.publish(mqtt_comm.TOPIC_UI_CMD, json.dumps(message))
+
+    def close(self):
+        self.client.loop_stop()
+
+
+def auto_complete_loop(comm, work_ms: float, stop_event: threading.Event):
+    """FSM 역할: 디스패처가 할당한 완료 대기 명령을 work_ms 후 완료 처리합니다."""
+    while not stop_event.is_set():
+        commands = [c for c in comm.get_pending_commands() if not c.done.is_set()]
+        if not commands:
+            time.sleep(0.0005)
+            continue
+        for command in commands:
+            if work_ms > 0:
+                time.sleep(work_ms / 1000.0)
+            comm.complete_command(command.msg_id, True)
+
+
+def parse_mix(text: str) -> dict:
+    """'tensile=1,system=1,binpick=1' -> {"tensile_control": 1.0, ...}"""
+    names = {"tensile": mqtt_comm.CMD_TENSILE, "system": mqtt_comm.CMD_SYSTEM, "binpick": mqtt_comm.CMD_BINPICK}
+    mix = {}
+    for item in text.split(','):
+        name, _, weight = item.partition('=')
+        mix[names[name.strip()]] = float(weight or 1)
+    return mix
+
+
+def run_load_test(count: int = 1000, rate: float = 100.0, mix: dict = None, work_ms: float = 0.0,
+                  ack_timeout: float = 5.0, duplicate_rate: float = 0.0, seed: int = 0) -> dict:
+    """
+    MqttComm을 프로세스 내 브로커에 연결하고 count개의 명령을 rate(개/초, 0이면 최대 속도)로 발행합니다.
+    :param mix: 명령 종류별 가중치 {cmd: weight}
+    :param work_ms: 응답기의 명령 처리 시간 (ms)
+    :param ack_timeout: 마지막 명령 발행 후 ACK를 기다리는 시간 (초)
+    :param duplicate_rate: 같은 msg_id로 재전송할 확률 (중복 억제 확인용)
+    """
+    rng = random.Random(seed)
+    mix = mix or {mqtt_comm.CMD_TENSILE: 1.0, mqtt_comm.CMD_SYSTEM: 1.0, mqtt_comm.CMD_BINPICK: 1.0}
+    actions = {mqtt_comm.CMD_TENSILE: TENSILE_ACTIONS, mqtt_comm.CMD_SYSTEM: SYSTEM_ACTIONS,
+               mqtt_comm.CMD_BINPICK: BINPICK_ACTIONS}
+    cmds = list(mix)
+    weights = [mix[c] for c in cmds]
+
+    broker = InProcessBroker()
+    comm = mqtt_comm.MqttComm(client_factory=broker.client)
+    if comm.spool is not None:
+        comm.spool.close()
+        comm.spool = None   # 대체 브로커는 끊기지 않으므로 스풀 불필요
+    ui = LoadUiClient(broker)
+    stop_event = threading.Event()
+    responder = threading.Thread(target=auto_complete_loop, args=(comm, work_ms, stop_event), daemon=True)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    comm.start()
+    responder.start()
+    try:
+        interval = 1.0 / rate if rate > 0 else 0.0
+        next_send = time.perf_counter()
+        for i in range(count):
+            cmd = rng.choices(cmds, weights)[0]
+            msg_id = f"load-{i:06d}"
+            ui.send(cmd, rng.choice(actions[cmd]), msg_id)
+            if duplicate_rate > 0 and rng.random() < duplicate_rate:
+                ui.send(cmd, ui.sent[msg_id][1], msg_id)
+            if interval:
+                next_send += interval
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        send_end = time.perf_counter()
+
+        deadline = time.perf_counter() + ack_timeout
+        while time.perf_counter() < deadline:
+            with ui.lock:
+                if len(ui.acked) >= len(ui.sent):
+                    break
+            time.sleep(0.01)
+        wall_end = time.perf_counter()
+        cpu_end = time.process_time()
+    finally:
+        stop_event.set()
+        comm.stop()
+        ui.close()
+
+    latencies = defaultdict(list)
+    for msg_id, (cmd, action, sent_at) in ui.sent.items():
+        if msg_id in ui.acked:
+            latencies[cmd].append((ui.acked[msg_id] - sent_at) * 1000.0)
+    all_latencies = sorted(v for values in latencies.values() for v in values)
+
+    result = {
+        "commands": len(ui.sent),
+        "acks": len(ui.acked),
+        "dropped_acks": len(ui.sent) - len(ui.acked),
+        "send_rate_hz": len(ui.sent) / (send_end - wall_start) if send_end > wall_start else float('inf'),
+        "ack_rate_hz": len(ui.acked) / (wall_end - wall_start) if wall_end > wall_start else float('inf'),
+        "p50_ms": percentile(all_latencies, 50),
+        "p95_ms": percentile(all_latencies, 95),
+        "p99_ms": percentile(all_latencies, 99),
+        "max_ms": all_latencies[-1] if all_latencies else float('nan'),
+        "cpu_percent": 100.0 * (cpu_end - cpu_start) / (wall_end - wall_start),
+        "status_events": ui.status_events,
+        "duplicates": comm.get_duplicate_stats(),
+    }
+    for cmd in cmds:
+        values = sorted(latencies[cmd])
+        result[f"{cmd}_p50_ms"] = percentile(values, 50)
+        result[f"{cmd}_p99_ms"] = percentile(values, 99)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MqttComm load test with an in-process broker")
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--rate', type=float, default=100.0, help="commands per second (0: as fast as possible)")
+    parser.add_argument('--mix', default="tensile=1,system=1,binpick=1")
+    parser.add_argument('--work-ms', type=float, default=0.0)
+    parser.add_argument('--ack-timeout', type=float, default=5.0)
+    parser.add_argument('--duplicate-rate', type=float, default=0.0)
+    parser.add_argument('--verbose', action='store_true', help="keep INFO logging of MqttComm")
+    args = parser.parse_args()
+
+    # 명령 완료/상태 키를 읽을 수 있도록 Blackboard 기본값 로드
+    initialize_global_blackboard(os.path.join(os.path.dirname(__file__), 'configs', 'blackboard.json'))
+    if not args.verbose:
+        Logger.set_log_level(LogLevel.WARN)
+
+    result = run_load_test(args.count, args.rate, parse_mix(args.mix), args.work_ms,
+                           args.ack_timeout, args.duplicate_rate)
+    for key, value in result.items():
+        print(f"{key:>24}: {value:.3f}" if isinstance(value, float) else f"{key:>24}: {value}")
+
+
+if __name__ == '__main__':
+    main()
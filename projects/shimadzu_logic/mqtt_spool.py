@@ -0,0 +1,237 @@
+import json
+import os
+import threading
+import time
+
+DEBUG_MODE = False
+
+# 발행 우선순위 (재연결 시 HIGH -> STATUS 순서로 재발행)
+PRIORITY_HIGH = 0       # ACK, 에러, Bin Picking 명령: 디스크에 보관, 순서대로 모두 재발행
+PRIORITY_STATUS = 1     # 주기 상태 이벤트: 키별 최신 값 1개만 보관 (이전 값은 대체)
+
+SEGMENT_PREFIX = "spool-"
+SEGMENT_SUFFIX = ".log"
+CURSOR_FILE = "cursor"
+
+
+class MqttSpool:
+    """
+    브로커 연결이 끊긴 동안 발행하지 못한 MQTT 메시지를 보관하는 스풀입니다.
+
+    - HIGH 메시지는 세그먼트 파일(spool-<첫 seq>.log)에 한 줄 JSON으로 append 합니다.
+      세그먼트가 segment_bytes를 넘으면 새 세그먼트를 만들고, 전체 크기가 max_bytes를 넘으면 가장 오래된 세그먼트를 버립니다.
+    - STATUS 메시지는 키(이벤트 종류)별 최신 값만 메모리에 보관합니다. 재연결 시점의 최신 상태만 의미가 있기 때문입니다.
+    - 재발행 진행 위치(seq)는 cursor 파일에 기록하므로 프로세스 재시작 후에도 이어서 재발행합니다.
+      각 레코드에는 보관 시각(ts)을 기록하며, replay(max_age)로 오래된 레코드는 재발행하지 않고 버립니다.
+    """
+    def __init__(self, directory: str, segment_bytes: int = 1024 * 1024, max_bytes: int = 16 * 1024 * 1024):
+        """
+        :param directory: 세그먼트 파일 저장 디렉토리
+        :param segment_bytes: 세그먼트 1개의 최대 크기 (bytes)
+        :param max_bytes: 스풀 전체 최대 크기 (bytes)
+        """
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+        self._replay_lock = threading.Lock()    # 재발행은 동시에 하나만 (publish는 lock 밖에서 호출)
+        self._replay_path = None    # 재발행 중인 세그먼트 (용량 초과 시에도 삭제하지 않음)
+        self.status = {}            # 키 -> (topic, payload)
+        self.spooled_count = 0
+        self.replayed_count = 0
+        self.dropped_count = 0
+        self.coalesced_count = 0
+        self.expired_count = 0
+        self._next_seq = 1
+        self._cursor = 0            # 재발행 완료된 마지막 seq
+        self._pending_high = 0      # 디스크에 남아 있는 재발행 대기 HIGH 메시지 수
+        self._segment = None        # 현재 쓰기 중인 세그먼트 파일 객체
+        self._segment_path = None
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    # --- 파일 관리 ---
+    def _segments(self) -> list:
+        """세그먼트 파일 경로 목록 (seq 오름차순)"""
+        names = [n for n in os.listdir(self.directory) if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX)]
+        return [os.path.join(self.directory, n) for n in sorted(names)]
+
+    @staticmethod
+    def _read_records(path: str):
+        """세그먼트 파일의 레코드를 순서대로 반환합니다. 마지막 줄이 잘린 경우 무시합니다."""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    break
+
+    def _load(self):
+        cursor_path = os.path.join(self.directory, CURSOR_FILE)
+        if os.path.exists(cursor_path):
+            try:
+                with open(cursor_path, 'r') as f:
+                    self._cursor = int(f.read().strip() or 0)
+            except (OSError, ValueError):
+                self._cursor = 0
+        last_seq = self._cursor
+        for path in self._segments():
+            for record in self._read_records(path):
+                last_seq = max(last_seq, record["seq"])
+                if record["seq"] > self._cursor:
+                    self._pending_high += 1
+        self._next_seq = last_seq + 1
+        if DEBUG_MODE: print(f"INFO: 스풀 로드 (cursor={self._cursor}, next_seq={self._next_seq})")
+
+    def _write_cursor(self):
+        cursor_path = os.path.join(self.directory, CURSOR_FILE)
+        tmp_path = cursor_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(str(self._cursor))
+        os.replace(tmp_path, cursor_path)
+
+    def _close_segment(self):
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+            self._segment_path = None
+
+    def _open_segment(self, seq: int):
+        self._close_segment()
+        self._segment_path = os.path.join(self.directory, f"{SEGMENT_PREFIX}{seq:012d}{SEGMENT_SUFFIX}")
+        self._segment = open(self._segment_path, 'a', encoding='utf-8')
+
+    def _enforce_limit(self):
+        """전체 크기가 max_bytes를 넘으면 가장 오래된 세그먼트부터 삭제합니다."""
+        segments = self._segments()
+        total = sum(os.path.getsize(p) for p in segments)
+        while total > self.max_bytes and len(segments) > 1 and segments[0] != self._replay_path:
+            oldest = segments.pop(0)
+            dropped = sum(1 for r in self._read_records(oldest) if r["seq"] > self._cursor)
+            total -= os.path.getsize(oldest)
+            os.remove(oldest)
+            self.dropped_count += dropped
+            self._pending_high -= dropped
+            if DEBUG_MODE: print(f"WARN: 스풀 용량 초과, 세그먼트 삭제: {oldest} ({dropped}건)")
+
+    # --- 공개 API ---
+    def __len__(self):
+        return self.pending_count()
+
+    def pending_count(self) -> int:
+        with self.lock:
+            return self._pending_high + len(self.status)
+
+    def put(self, topic: str, payload, priority: int = PRIORITY_HIGH, key: str = None):
+        """
+        발행하지 못한 메시지를 보관합니다.
+        :param priority: PRIORITY_HIGH 또는 PRIORITY_STATUS
+        :param key: STATUS 메시지의 대체 키 (같은 키의 이전 메시지는 버림). None이면 topic 사용
+        """
+        if isinstance(payload, bytes):
+            payload = payload.decode('utf-8')
+        with self.lock:
+            if priority == PRIORITY_STATUS:
+                key = key or topic
+                if key in self.status:
+                    self.coalesced_count += 1
+                self.status[key] = (topic, payload)
+                return
+            seq = self._next_seq
+            self._next_seq += 1
+            if self._segment is None or self._segment.tell() >= self.segment_bytes:
+                self._open_segment(seq)
+                self._enforce_limit()
+            self._segment.write(json.dumps({"seq": seq, "ts": time.time(), "topic": topic, "payload": payload}) + "\n")
+            self._segment.flush()
+            self.spooled_count += 1
+            self._pending_high += 1
+
+    def replay(self, publish, max_age: float = None) -> int:
+        """
+        보관된 메시지를 HIGH(저장 순서) -> STATUS 순서로 재발행합니다.
+        publish는 lock 밖에서 호출하므로 재발행 중에도 put()이 막히지 않으며, 재발행 중 새로 보관된 HIGH 메시지도 이어서 재발행합니다.
+        다른 스레드가 재발행 중이면 바로 0을 반환합니다.
+        :param publish: publish(topic, payload) -> bool. False를 반환하면 재발행을 중단하고 나머지는 보관
+        :param max_age: HIGH 메시지 최대 보관 시간 (초). 보관 후 이 시간이 지난 메시지는 재발행하지 않고 버림
+        :return: 재발행한 메시지 수
+        """
+        if not self._replay_lock.acquire(blocking=False):
+            return 0
+        try:
+            count, completed = self._replay_high(publish, max_age)
+            if completed:
+                count += self._replay_status(publish)
+        finally:
+            self._replay_lock.release()
+        if DEBUG_MODE: print(f"INFO: 스풀 재발행 {count}건")
+        return count
+
+    def _advance(self, seq: int):
+        """seq까지 재발행(또는 만료) 처리되었음을 기록합니다. (lock 보유 상태에서 호출)"""
+        if seq > self._cursor:
+            self._cursor = seq
+            self._pending_high -= 1
+
+    def _replay_high(self, publish, max_age: float = None):
+        """HIGH 메시지를 세그먼트 순서대로 재발행합니다. :return: (재발행 수, 모두 재발행했는지 여부)"""
+        count = 0
+        expire_before = time.time() - max_age if max_age else None
+        while True:
+            with self.lock:
+                # 쓰기 중인 세그먼트도 재발행 대상에 포함 (이후 put()은 새 세그먼트에 기록)
+                self._close_segment()
+                paths = self._segments()
+            # 재발행 중 새로 만들어진 세그먼트가 없을 때까지 반복
+            if not paths:
+                return count, True
+            for path in paths:
+                with self.lock:
+                    self._replay_path = path
+                    records = [r for r in self._read_records(path) if r["seq"] > self._cursor]
+                try:
+                    for record in records:
+                        if expire_before is not None and record.get("ts", expire_before) < expire_before:
+                            with self.lock:
+                                self._advance(record["seq"])
+                                self.expired_count += 1
+                            continue
+                        if not publish(record["topic"], record["payload"]):
+                            with self.lock:
+                                self._write_cursor()
+                            return count, False
+                        with self.lock:
+                            self._advance(record["seq"])
+                            self.replayed_count += 1
+                        count += 1
+                finally:
+                    with self.lock:
+                        self._replay_path = None
+                # 세그먼트 전체를 재발행했으면 삭제
+                with self.lock:
+                    os.remove(path)
+                    self._write_cursor()
+
+    def _replay_status(self, publish) -> int:
+        """키별 최신 STATUS 메시지를 재발행합니다. 재발행 중 새 값으로 대체된 키는 남겨둡니다."""
+        count = 0
+        with self.lock:
+            items = list(self.status.items())
+        for key, message in items:
+            if not publish(*message):
+                break
+            with self.lock:
+                if self.status.get(key) is message:
+                    del self.status[key]
+                self.replayed_count += 1
+            count += 1
+        return count
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {"pending": self.pending_count(), "spooled": self.spooled_count, "replayed": self.replayed_count,
+                    "dropped": self.dropped_count, "coalesced": self.coalesced_count, "expired": self.expired_count}
+
+    def close(self):
+        with self.lock:
+            self._close_segment()
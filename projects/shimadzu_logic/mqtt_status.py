@@ -0,0 +1,161 @@
+import json
+import threading
+import time
+
+# 상태 이벤트 종류 (payload.evt)
+EVT_DIO_STATUS = "system_dio_status"
+EVT_SYSTEM_STATUS = "system_status"
+
+
+def values_to_mask(values) -> int:
+    """0/1 배열을 비트마스크 정수로 변환합니다. (bit i = values[i])"""
+    mask = 0
+    for i, value in enumerate(values):
+        if value:
+            mask |= 1 << i
+    return mask
+
+
+def mask_to_values(mask: int, size: int) -> list:
+    """비트마스크 정수를 길이 size의 0/1 배열로 변환합니다."""
+    return [(mask >> i) & 1 for i in range(size)]
+
+
+class StatusChannel:
+    """상태 이벤트 1종의 최근 값, 인코딩된 payload 캐시 및 발행 시각을 보관합니다."""
+    __slots__ = ("evt", "prefix", "middle", "key", "body", "dirty", "last_sent")
+
+    def __init__(self, evt: str, msg_id: str):
+        self.evt = evt
+        # header는 timestamp를 제외하고 미리 직렬화해 둠 -> 발행 시 문자열 결합만 수행
+        header = {
+            "msg_type": "logic.event",
+            "source": "logic",
+            "target": "ui",
+            "timestamp": "__TS__",
+            "msg_id": msg_id,
+            "ack_required": False
+        }
+        self.prefix, self.middle = ('{"header": ' + json.dumps(header) + ', "payload": ').split('"__TS__"')
+        self.prefix += '"'
+        self.middle = '"' + self.middle
+        self.key = None         # 변경 감지용 값
+        self.body = None        # 인코딩된 payload JSON 문자열
+        self.dirty = False
+        self.last_sent = 0.0
+
+    def message(self, timestamp: str) -> str:
+        return self.prefix + timestamp + self.middle + self.body + "}"
+
+
+class StatusPublisher:
+    """
+    DIO/시스템 상태 이벤트를 값이 바뀔 때 즉시(최대 발행 주기 제한) 발행하고,
+    변경이 없으면 keep-alive 주기로만 재발행합니다.
+    payload는 값이 바뀔 때만 다시 인코딩하고, 발행 시에는 timestamp만 새로 붙입니다.
+    """
+    def __init__(self, publish, topic: str, dio_msg_id: str, system_msg_id: str,
+                 min_interval: float = 0.05, keepalive_interval: float = 2.0, compact_dio: bool = False):
+        """
+        :param publish: publish(topic, payload, key) 호출 가능한 함수. key는 이벤트 종류 (evt)
+        :param topic: 발행 토픽
+        :param dio_msg_id: system_dio_status 이벤트 msg_id
+        :param system_msg_id: system_status 이벤트 msg_id
+        :param min_interval: 이벤트 종류별 최소 발행 간격 (초)
+        :param keepalive_interval: 변경이 없을 때 재발행 주기 (초)
+        :param compact_dio: True면 DI/DO를 배열 대신 비트마스크 정수로 인코딩
+        """
+        self.publish = publish
+        self.topic = topic
+        self.min_interval = min_interval
+        self.keepalive_interval = keepalive_interval
+        self.compact_dio = compact_dio
+        self.dio = StatusChannel(EVT_DIO_STATUS, dio_msg_id)
+        self.system = StatusChannel(EVT_SYSTEM_STATUS, system_msg_id)
+        self.channels = (self.dio, self.system)
+        self.wakeup = threading.Event()     # 값 변경 시 발행 스레드를 즉시 깨움
+        self.sent_count = 0
+        self.keepalive_count = 0
+        self.unchanged_count = 0
+        self._lock = threading.Lock()
+        self._ts_second = None
+        self._ts_prefix = ""
+
+    def _timestamp(self, now: float) -> str:
+        """'%Y-%m-%dT%H:%M:%S.mmmZ' 형식. strftime은 초가 바뀔 때만 호출합니다."""
+        second = int(now)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        return f"{self._ts_prefix}.{int((now - second) * 1000):03d}Z"
+
+    def _update(self, channel: StatusChannel, key, encode) -> bool:
+        with self._lock:
+            if key == channel.key:
+                self.unchanged_count += 1
+                return False
+            channel.key = key
+            channel.body = encode()
+            channel.dirty = True
+        self.wakeup.set()
+        return True
+
+    def update_dio(self, di_values: list, do_values: list) -> bool:
+        """DIO 값을 갱신합니다. 값이 바뀌었으면 True (다음 poll에서 발행)"""
+        di_mask = values_to_mask(di_values)
+        do_mask = values_to_mask(do_values)
+
+        def encode():
+            if self.compact_dio:
+                payload = {"kind": "event", "evt": EVT_DIO_STATUS, "encoding": "bitmask",
+                           "di_size": len(di_values), "do_size": len(do_values),
+                           "di_mask": di_mask, "do_mask": do_mask}
+            else:
+                payload = {"kind": "event", "evt": EVT_DIO_STATUS,
+                           "di_values": list(di_values), "do_values": list(do_values)}
+            return json.dumps(payload)
+
+        return self._update(self.dio, (len(di_values), di_mask, len(do_values), do_mask), encode)
+
+    def update_system(self, system_states: list) -> bool:
+        """시스템 상태 배열을 갱신합니다. 값이 바뀌었으면 True (다음 poll에서 발행)"""
+        key = tuple(system_states)
+        return self._update(self.system, key, lambda: json.dumps(
+            {"kind": "event", "evt": EVT_SYSTEM_STATUS, "system_states": list(system_states)}))
+
+    def poll(self, now: float = None) -> float:
+        """
+        발행 시점이 된 이벤트를 발행합니다.
+        :return: 다음 발행 확인까지 남은 시간 (초)
+        """
+        self.wakeup.clear()
+        now = time.time() if now is None else now
+        wait = self.keepalive_interval
+        for channel in self.channels:
+            with self._lock:
+                if channel.body is None:
+                    continue
+                elapsed = now - channel.last_sent
+                if channel.dirty and elapsed >= self.min_interval:
+                    keepalive = False
+                elif not channel.dirty and elapsed >= self.keepalive_interval:
+                    keepalive = True
+                else:
+                    due = self.min_interval if channel.dirty else self.keepalive_interval
+                    wait = min(wait, due - elapsed)
+                    continue
+                message = channel.message(self._timestamp(now))
+                channel.dirty = False
+                channel.last_sent = now
+            self.publish(self.topic, message, channel.evt)
+            self.sent_count += 1
+            if keepalive:
+                self.keepalive_count += 1
+        return max(0.0, wait)
+
+    def wait(self, timeout: float):
+        """값 변경 또는 timeout까지 대기합니다. (wakeup은 poll에서 초기화)"""
+        self.wakeup.wait(timeout)
+
+    def get_stats(self) -> dict:
+        return {"sent": self.sent_count, "keepalive": self.keepalive_count, "unchanged": self.unchanged_count}
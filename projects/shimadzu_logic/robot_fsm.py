@@ -124,14 +124,17 @@ class RobotFSM(FiniteStateMachine):
             },
             RobotState.AUTO_MOTION_ENTER_THICKNESS_POS_1: {
                 RobotEvent.AUTO_MOTION_ENTER_THICKNESS_POS_1_DONE: RobotState.WAIT_AUTO_COMMAND,
+                RobotEvent.AUTO_MOTION_ENTER_THICKNESS_FAIL: RobotState.ERROR,
                 RobotEvent.VIOLATION_DETECT: RobotState.ERROR,
             },
             RobotState.AUTO_MOTION_ENTER_THICKNESS_POS_2: {
                 RobotEvent.AUTO_MOTION_ENTER_THICKNESS_POS_2_DONE: RobotState.WAIT_AUTO_COMMAND,
+                RobotEvent.AUTO_MOTION_ENTER_THICKNESS_FAIL: RobotState.ERROR,
                 RobotEvent.VIOLATION_DETECT: RobotState.ERROR,
             },
             RobotState.AUTO_MOTION_ENTER_THICKNESS_POS_3: {
                 RobotEvent.AUTO_MOTION_ENTER_THICKNESS_POS_3_DONE: RobotState.WAIT_AUTO_COMMAND,
+                RobotEvent.AUTO_MOTION_ENTER_THICKNESS_FAIL: RobotState.ERROR,
                 RobotEvent.VIOLATION_DETECT: RobotState.ERROR,
             },
             RobotState.AUTO_MOTION_RETRACT_FROM_THICKNESS: {
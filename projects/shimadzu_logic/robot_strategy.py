@@ -2,6 +2,7 @@ import time
 
 from pkg.utils.blackboard import GlobalBlackboard
 from .robot_context import *
+from .devices.mitutoyogauge import load_config as load_gauge_config, CONFIG_FILE_PATH as GAUGE_CONFIG_PATH
 
 bb = GlobalBlackboard()
 
@@ -187,33 +188,52 @@ class RobotApproachThicknessStrategy(Strategy):
     def exit(self, context: RobotContext, event: RobotEvent) -> None:
         pass
 
-class RobotEnterThicknessPos1Strategy(Strategy):
-    def prepare(self, context: RobotContext, **kwargs):
-        Logger.info("Robot: Entering Thickness Position 1.")
-    def operate(self, context: RobotContext) -> RobotEvent:
-        return RobotEvent.AUTO_MOTION_ENTER_THICKNESS_POS_1_DONE
+class RobotEnterThicknessPosStrategy(Strategy):
+    # 측정 위치 번호와 완료 이벤트는 하위 클래스에서 지정
+    position = 0
+    done_event = RobotEvent.NONE
+
+    def __init__(self):
+        super().__init__()
+        # 위치 진입 후 두께 값 안정까지 최대 대기 시간 (s), MitutoyoGauge.json PROFILE_CONFIG
+        profile_config = load_gauge_config(GAUGE_CONFIG_PATH).get('PROFILE_CONFIG', {})
+        self.timeout = profile_config.get('robot_position_timeout', 10.0)
+
+    def prepare(self, context: RobotContext, **kwargs):
+        Logger.info(f"Robot: Entering Thickness Position {self.position}.")
+        # 위치 진입 완료를 Device FSM에 알리고, 두께 값이 안정되면 다음 위치로 진행
+        bb.set("robot/thickness/position", self.position)
+        self.deadline = time.monotonic() + self.timeout
+    def operate(self, context: RobotContext) -> RobotEvent:
+        if bb.get("device/gauge/thickness/settled_pos") == self.position:
+            return self.done_event
+        # Device FSM 측정 실패(GAUGE_MEASURE_FAIL) 또는 시간 초과 시 실패 처리
+        if bb.get("device/gauge/thickness/failed"):
+            Logger.error(f"Robot: Thickness Position {self.position} measurement failed on device.")
+            return RobotEvent.AUTO_MOTION_ENTER_THICKNESS_FAIL
+        if time.monotonic() > self.deadline:
+            Logger.error(f"Robot: Thickness Position {self.position} not settled in {self.timeout} s.")
+            return RobotEvent.AUTO_MOTION_ENTER_THICKNESS_FAIL
+        return RobotEvent.NONE
     def exit(self, context: RobotContext, event: RobotEvent) -> None:
         pass
 
-class RobotEnterThicknessPos2Strategy(Strategy):
-    def prepare(self, context: RobotContext, **kwargs):
-        Logger.info("Robot: Entering Thickness Position 2.")
-    def operate(self, context: RobotContext) -> RobotEvent:
-        return RobotEvent.AUTO_MOTION_ENTER_THICKNESS_POS_2_DONE
-    def exit(self, context: RobotContext, event: RobotEvent) -> None:
-        pass
+class RobotEnterThicknessPos1Strategy(RobotEnterThicknessPosStrategy):
+    position = 1
+    done_event = RobotEvent.AUTO_MOTION_ENTER_THICKNESS_POS_1_DONE
 
-class RobotEnterThicknessPos3Strategy(Strategy):
-    def prepare(self, context: RobotContext, **kwargs):
-        Logger.info("Robot: Entering Thickness Position 3.")
-    def operate(self, context: RobotContext) -> RobotEvent:
-        return RobotEvent.AUTO_MOTION_ENTER_THICKNESS_POS_3_DONE
-    def exit(self, context: RobotContext, event: RobotEvent) -> None:
-        pass
+class RobotEnterThicknessPos2Strategy(RobotEnterThicknessPosStrategy):
+    position = 2
+    done_event = RobotEvent.AUTO_MOTION_ENTER_THICKNESS_POS_2_DONE
+
+class RobotEnterThicknessPos3Strategy(RobotEnterThicknessPosStrategy):
+    position = 3
+    done_event = RobotEvent.AUTO_MOTION_ENTER_THICKNESS_POS_3_DONE
 
 class RobotRetractFromThicknessStrategy(Strategy):
     def prepare(self, context: RobotContext, **kwargs):
         Logger.info("Robot: Retracting from Thickness Gauge.")
+        bb.set("robot/thickness/position", 0)
     def operate(self, context: RobotContext) -> RobotEvent:
         return RobotEvent.AUTO_MOTION_RETRACT_FROM_THICKNESS_DONE
     def exit(self, context: RobotContext, event: RobotEvent) -> None: